@@ -5,9 +5,9 @@ import sys
 from typing import Any
 
 from . import __version__
-from .lib.commands import clear_cache, run_debug_mode, show_config_info
-from .lib.config import load_config
-from .lib.logger import get_logger, setup_logging
+
+# Commands, config and logging are imported after argument parsing, so
+# `--version` and `--help` exit without loading them.
 
 
 def main() -> int:
@@ -41,10 +41,15 @@ Examples:
                           help='Enable verbose output')
         args = parser.parse_args()
 
+        from .lib.commands import clear_cache, run_debug_mode, show_config_info
+
         # Handle show-config without loading config
         if args.show_config:
             return show_config_info()
 
+        from .lib.config import load_config
+        from .lib.logger import get_logger, setup_logging
+
         # Load configuration (will use default path if none specified)
         if args.debug or args.list_providers or args.clear_cache:
             print("SSHplex CLI - Loading configuration...")
@@ -1,18 +1,38 @@
 """SSHplex host cache management for optimized startup performance."""
 
 import contextlib
+import json
 import os
 import tempfile
 import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-import yaml
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from .logger import get_logger
 from .sot.base import Host
 
+# Cache file: one JSON line of metadata, then one JSON line with the host list,
+# so the metadata can be read without loading the hosts
+CACHE_FILE_NAME = "hosts.cache"
+
+# Compact separators; default=str covers non-JSON metadata values such as dates
+_ENCODER = json.JSONEncoder(separators=(",", ":"), default=str)
+
+# Hosts serialized per write, bounding memory on large inventories
+_ENCODE_BATCH = 512
+
+# Split YAML files written by older versions; only removed by clear_cache
+_LEGACY_CACHE_FILES = ("hosts.yaml", "cache_metadata.yaml")
+
+
+def read_cached_host_dicts(cache_file: Path) -> Any:
+    """Read the serialized host list from a cache file, skipping its metadata line."""
+    with open(cache_file, "rb") as handle:
+        handle.readline()
+        return json.loads(handle.read())
+
 
 class HostCache:
     """Cache manager for storing and retrieving hosts from different SoT providers.
@@ -34,8 +54,9 @@ class HostCache:
 
         self.cache_dir = Path(cache_dir).expanduser()
         self.cache_ttl = timedelta(hours=cache_ttl_hours)
-        self.cache_file = self.cache_dir / "hosts.yaml"
-        self.metadata_file = self.cache_dir / "cache_metadata.yaml"
+        self.cache_file = self.cache_dir / CACHE_FILE_NAME
+        # Deprecated: metadata now lives in cache_file
+        self.metadata_file = self.cache_file
         
         # Thread lock for concurrent access protection
         self._lock = threading.RLock()
@@ -46,57 +67,59 @@ class HostCache:
     def is_cache_valid(self) -> bool:
         """Check if the cache is valid and not expired.
 
+        The cache file is replaced on every save, so its mtime is the cache
+        timestamp and a single stat() is enough.
+
         Returns:
             True if cache exists and is not expired, False otherwise
         """
-        with self._lock:
-            # Quick check: do files exist?
-            if not self.cache_file.exists() or not self.metadata_file.exists():
-                return False
-
-            # Quick check: file ages (faster than parsing YAML)
-            try:
-                cache_mtime = self.cache_file.stat().st_mtime
-                metadata_mtime = self.metadata_file.stat().st_mtime
-                now = datetime.now().timestamp()
-
-                # If cache is older than TTL, it's invalid
-                if now - cache_mtime > self.cache_ttl.total_seconds():
-                    return False
-
-                # If metadata is older than cache, it's stale
-                if metadata_mtime < cache_mtime:
-                    return False
-
-                # Full validation (parse YAML to be sure)
-                with open(self.metadata_file) as f:
-                    metadata = yaml.safe_load(f)
-
-                if not isinstance(metadata, dict) or 'timestamp' not in metadata:
-                    return False
-
-                cache_time = datetime.fromisoformat(metadata['timestamp'])
-                return datetime.now() - cache_time < self.cache_ttl
-
-            except (yaml.YAMLError, ValueError, KeyError, OSError) as e:
-                self.logger.warning(f"Failed to validate cache: {e}")
-                return False
-            except Exception as e:
-                self.logger.error(f"Unexpected error validating cache: {e}")
-                return False
-
-    def _atomic_write_yaml(self, file_path: Path, payload: Any) -> None:
-        """Write YAML payload atomically to avoid partial/corrupt cache writes."""
+        try:
+            cache_mtime = self.cache_file.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            self.logger.warning(f"Failed to validate cache: {e}")
+            return False
+        return time.time() - cache_mtime < self.cache_ttl.total_seconds()
+
+    def _read_metadata(self) -> Dict[str, Any]:
+        """Read only the metadata line of the cache file.
+
+        Raises:
+            ValueError: If the first line isn't a metadata object
+        """
+        with open(self.cache_file, "rb") as handle:
+            metadata = json.loads(handle.readline())
+        if not isinstance(metadata, dict):
+            raise ValueError("cache file has no metadata line")
+        return metadata
+
+    @staticmethod
+    def _encode_cache(metadata: Dict[str, Any], hosts: List[Host]) -> Iterator[bytes]:
+        """Encode the cache file a batch of hosts at a time instead of all at once."""
+        yield _ENCODER.encode(metadata).encode("utf-8") + b"\n["
+        for start in range(0, len(hosts), _ENCODE_BATCH):
+            batch = [host.to_dict() for host in hosts[start:start + _ENCODE_BATCH]]
+            # Drop the batch's own brackets; batches are joined with commas
+            encoded = _ENCODER.encode(batch)[1:-1].encode("utf-8")
+            yield b"," + encoded if start else encoded
+        yield b"]"
+
+    def _atomic_write(self, file_path: Path, chunks: Iterable[bytes]) -> None:
+        """Write data atomically to avoid partial/corrupt cache writes."""
         fd, temp_path_text = tempfile.mkstemp(
             prefix=f".{file_path.name}.",
             suffix=".tmp",
             dir=str(self.cache_dir),
-            text=True,
         )
         temp_path = Path(temp_path_text)
         try:
-            with os.fdopen(fd, "w") as handle:
-                yaml.safe_dump(payload, handle, default_flow_style=False, sort_keys=True)
+            with os.fdopen(fd, "wb") as handle:
+                for chunk in chunks:
+                    handle.write(chunk)
+                # Data must be on disk before the rename makes it visible
+                handle.flush()
+                os.fsync(handle.fileno())
             os.replace(temp_path, file_path)
         finally:
             if temp_path.exists():
@@ -115,25 +138,18 @@ class HostCache:
         """
         with self._lock:
             try:
-                hosts_data = [host.to_dict() for host in hosts]
-
-                # Save hosts data
-                self._atomic_write_yaml(self.cache_file, hosts_data)
-
-                # Save metadata
                 cache_metadata = {
                     'timestamp': datetime.now().isoformat(),
                     'host_count': len(hosts),
                     'providers': provider_info,
-                    'cache_version': '1.0'
+                    'cache_version': '2.0'
                 }
-
-                self._atomic_write_yaml(self.metadata_file, cache_metadata)
+                self._atomic_write(self.cache_file, self._encode_cache(cache_metadata, hosts))
 
                 self.logger.info(f"Successfully cached {len(hosts)} hosts to {self.cache_file}")
                 return True
 
-            except (yaml.YAMLError, OSError) as e:
+            except (TypeError, ValueError, OSError) as e:
                 self.logger.error(f"Failed to save hosts to cache: {e}")
                 return False
             except Exception as e:
@@ -151,8 +167,7 @@ class HostCache:
                 return None
 
             try:
-                with open(self.cache_file) as f:
-                    hosts_data = yaml.safe_load(f)
+                hosts_data = read_cached_host_dicts(self.cache_file)
 
                 if not hosts_data:
                     return []
@@ -172,7 +187,7 @@ class HostCache:
                 self.logger.info(f"Successfully loaded {len(hosts)} hosts from cache")
                 return hosts
 
-            except (yaml.YAMLError, KeyError, TypeError) as e:
+            except (ValueError, KeyError, TypeError, OSError) as e:
                 self.logger.error(f"Failed to load hosts from cache: {e}")
                 return None
             except Exception as e:
@@ -186,19 +201,11 @@ class HostCache:
             Dictionary with cache information or None if cache doesn't exist
         """
         with self._lock:
-            if not self.metadata_file.exists():
+            if not self.cache_file.exists():
                 return None
 
             try:
-                with open(self.metadata_file) as f:
-                    raw_metadata = yaml.safe_load(f)
-
-                # Validate that metadata is a dictionary
-                if not isinstance(raw_metadata, dict):
-                    self.logger.warning("Cache metadata is not a valid dictionary")
-                    return None
-
-                metadata: Dict[str, Any] = raw_metadata
+                metadata = self._read_metadata()
 
                 if metadata and 'timestamp' in metadata:
                     cache_time = datetime.fromisoformat(metadata['timestamp'])
@@ -207,7 +214,7 @@ class HostCache:
 
                 return metadata
 
-            except (yaml.YAMLError, ValueError, KeyError) as e:
+            except (ValueError, KeyError, OSError) as e:
                 self.logger.error(f"Failed to read cache metadata: {e}")
                 return None
             except Exception as e:
@@ -222,10 +229,10 @@ class HostCache:
         """
         with self._lock:
             try:
-                if self.cache_file.exists():
-                    self.cache_file.unlink()
-                if self.metadata_file.exists():
-                    self.metadata_file.unlink()
+                legacy_files = [self.cache_dir / name for name in _LEGACY_CACHE_FILES]
+                for path in [self.cache_file, *legacy_files]:
+                    if path.exists():
+                        path.unlink()
 
                 self.logger.info("Cache cleared successfully")
                 return True
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Any
 
-from .cache import HostCache
 from .config import get_config_info
-from .sot.factory import SoTFactory
+
+# The host cache and SoT providers are imported inside the commands that
+# use them, so --show-config doesn't load every provider module.
+
+# Debug listing lines buffered before each write while hosts stream in
+_DEBUG_FLUSH_ROWS = 64
 
 
 def show_config_info() -> int:
@@ -30,6 +35,8 @@ def show_config_info() -> int:
 
 def clear_cache(config: Any, logger: Any, no_cache_message: str = "No cache to clear") -> int:
     """Clear the host cache."""
+    from .cache import HostCache
+
     logger.info("Clearing host cache")
 
     cache = HostCache(
@@ -56,6 +63,8 @@ def clear_cache(config: Any, logger: Any, no_cache_message: str = "No cache to c
 
 def run_debug_mode(config: Any, logger: Any, footer_note: str = "") -> int:
     """Run provider connectivity + host retrieval debug flow."""
+    from .sot.factory import SoTFactory
+
     logger.info("Running debug mode - SoT provider connectivity test")
 
     sot_factory = SoTFactory(config)
@@ -85,18 +94,28 @@ def run_debug_mode(config: Any, logger: Any, footer_note: str = "") -> int:
             print(f"❌ {provider_name}: Connection failed")
 
     logger.info("Retrieving hosts from all SoT providers...")
-    hosts = sot_factory.get_all_hosts()
-
-    if hosts:
-        logger.info(f"Successfully retrieved {len(hosts)} hosts")
-        print(f"\n📋 Found {len(hosts)} hosts from all providers:")
-        print("-" * 80)
-        for i, host in enumerate(hosts, 1):
-            status = getattr(host, 'status', host.metadata.get('status', 'unknown'))
-            sources = host.metadata.get('sources', ['unknown'])
-            source_str = ', '.join(sources) if isinstance(sources, list) else str(sources)
-            print(f"{i:3d}. {host.name:<25} {host.ip:<15} [{status:<8}] ({source_str})")
-        print("-" * 80)
+    # Stream rows as each provider returns instead of waiting for the slowest
+    # one, writing them out in batches
+    separator = "-" * 80
+    lines: list[str] = []
+    host_count = 0
+    for host_count, host in enumerate(sot_factory.iter_all_hosts(), 1):
+        if host_count == 1:
+            lines += ["\n📋 Hosts from all providers:", separator]
+        # Host attributes mirror metadata, so one lookup covers both
+        status = host.metadata.get('status', 'unknown')
+        sources = host.metadata.get('sources', ['unknown'])
+        source_str = ', '.join(sources) if isinstance(sources, list) else str(sources)
+        lines.append(f"{host_count:3d}. {host.name:<25} {host.ip:<15} [{status:<8}] ({source_str})")
+        if len(lines) >= _DEBUG_FLUSH_ROWS:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+            lines = []
+
+    if host_count:
+        logger.info(f"Successfully retrieved {host_count} hosts")
+        lines += [separator, f"📋 Found {host_count} hosts from all providers"]
+        sys.stdout.write("\n".join(lines) + "\n")
     else:
         logger.warning("No hosts found matching the filters")
         print("⚠️  No hosts found matching the configured filters")
@@ -1,13 +1,23 @@
 """SSHplex configuration management with pydantic validation"""
 
+import contextlib
+import hashlib
+import os
+import pickle
 import shutil
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 from pydantic import BaseModel, Field, field_validator
 
 from .. import __version__
+from .yaml_compat import YamlLoader, load_yaml_file
+
+# Parsed config YAML is memoized here, keyed by the file's mtime and size
+_CONFIG_CACHE_DIR = Path("~/.cache/sshplex").expanduser()
 
 SUPPORTED_SOT_PROVIDER_TYPES = ("static", "netbox", "ansible", "consul", "git")
 SOT_PROVIDER_LABELS = {
@@ -367,6 +377,7 @@ def get_default_config_path() -> Path:
     return Path.home() / ".config" / "sshplex" / "sshplex.yaml"
 
 
+@lru_cache(maxsize=1)
 def get_template_config_path() -> Path:
     """Get the path to the config template file."""
     # Get the directory where this config.py file is located
@@ -407,7 +418,65 @@ def initialize_default_config() -> Path:
     return config_path
 
 
-def load_config(config_path: Optional[str] = None) -> Config:
+def _config_cache_file(config_file: Path) -> Path:
+    """Get the parsed-config cache file for a config path."""
+    digest = hashlib.sha1(str(config_file.resolve()).encode("utf-8")).hexdigest()
+    return _CONFIG_CACHE_DIR / f"config-{digest[:16]}.pickle"
+
+
+def _parse_config_yaml(config_file: Path) -> Any:
+    """Parse the config YAML file with the fastest available safe loader."""
+    with open(config_file) as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
+def _read_config_data(config_file: Path, use_cache: bool) -> Any:
+    """Parse the config YAML, reusing the cached parse while the file is unchanged.
+
+    Repeated loads in one process are served from memory; ``use_cache``
+    additionally persists the parse under ~/.cache/sshplex for later runs.
+    """
+    return load_yaml_file(config_file, lambda path, signature: _read_config_file(path, signature, use_cache))
+
+
+def _read_config_file(config_file: Path, signature: Tuple[int, int], use_cache: bool) -> Any:
+    """Parse the config YAML, going through the on-disk parse cache if enabled."""
+    if not use_cache:
+        return _parse_config_yaml(config_file)
+
+    cache_file = _config_cache_file(config_file)
+    try:
+        with open(cache_file, "rb") as handle:
+            cached_signature, cached_data = pickle.load(handle)
+        if cached_signature == signature:
+            return cached_data
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        # Missing, truncated, corrupt or wrongly shaped cache; fall back to parsing
+        pass
+
+    config_data = _parse_config_yaml(config_file)
+
+    temp_path: Optional[Path] = None
+    try:
+        _CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, temp_path_text = tempfile.mkstemp(
+            prefix=f".{cache_file.name}.", suffix=".tmp", dir=str(_CONFIG_CACHE_DIR)
+        )
+        temp_path = Path(temp_path_text)
+        with os.fdopen(fd, "wb") as handle:
+            pickle.dump((signature, config_data), handle, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_file)
+    except (OSError, pickle.PicklingError):
+        pass
+    finally:
+        if temp_path is not None and temp_path.exists():
+            with contextlib.suppress(OSError):
+                temp_path.unlink()
+
+    return config_data
+
+
+def load_config(config_path: Optional[str] = None, use_cache: bool = False) -> Config:
     """Load and validate configuration from YAML file.
 
     Uses ~/.config/sshplex/sshplex.yaml as default location.
@@ -415,6 +484,8 @@ def load_config(config_path: Optional[str] = None) -> Config:
 
     Args:
         config_path: Path to configuration file (optional, defaults to ~/.config/sshplex/sshplex.yaml)
+        use_cache: Reuse the parsed YAML cached under ~/.cache/sshplex while the
+            file's mtime and size are unchanged
 
     Returns:
         Validated configuration object
@@ -461,8 +532,7 @@ def load_config(config_path: Optional[str] = None) -> Config:
         logger = get_logger()
         logger.info(f"SSHplex: Loading configuration from {config_file}")
 
-        with open(config_file) as f:
-            config_data = yaml.safe_load(f)
+        config_data = _read_config_data(config_file, use_cache)
 
         if not config_data:
             raise ValueError("SSHplex: Configuration file is empty or invalid")
@@ -8,6 +8,8 @@ from pathlib import Path
 
 import yaml
 
+from .yaml_compat import YamlDumper, YamlLoader
+
 
 @dataclass
 class HostRecord:
@@ -35,7 +37,7 @@ class HistoryManager:
 
         try:
             with self.history_file.open() as handle:
-                data = yaml.safe_load(handle) or []
+                data = yaml.load(handle, Loader=YamlLoader) or []
         except Exception:
             return []
 
@@ -76,7 +78,9 @@ class HistoryManager:
             for record in records
         ]
         with self.history_file.open("w") as handle:
-            yaml.safe_dump(payload, handle, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                payload, handle, Dumper=YamlDumper, default_flow_style=False, sort_keys=False
+            )
 
     @staticmethod
     def _host_key(name: str, ip: str) -> str:
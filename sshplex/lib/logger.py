@@ -1,5 +1,7 @@
 """SSHplex logging configuration using loguru."""
 
+import contextlib
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -49,6 +51,20 @@ def setup_logging(log_level: str = "INFO", log_file: str = "logs/sshplex.log", e
     logger.info(f"SSHplex logging initialized - Level: {log_level}, File: {log_file}")
 
 
+def flush_logging() -> None:
+    """Flush pending log output and the standard streams, keeping every sink.
+
+    Call this right before replacing the process with ``os.exec*``: buffered
+    output is not written out when the process image is replaced. Sinks stay
+    in place so a failed exec can still be logged. File sinks are
+    line-buffered, so each record is already on disk.
+    """
+    logger.complete()
+    for stream in (sys.stdout, sys.stderr):
+        with contextlib.suppress(AttributeError, ValueError, OSError):
+            stream.flush()
+
+
 def get_logger() -> Any:
     """Get the configured logger instance."""
     return logger
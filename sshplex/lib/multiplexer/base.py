@@ -1,9 +1,23 @@
 """Base class for terminal multiplexers in SSHplex."""
 
+import time
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
 
+def default_session_name() -> str:
+    """Return a timestamped session name, e.g. ``sshplex-20250131_235959``.
+
+    Formatted from ``time.localtime()`` fields directly; equivalent to
+    ``strftime("%Y%m%d_%H%M%S")`` without a datetime object or format parsing.
+    """
+    now = time.localtime()
+    return (
+        f"sshplex-{now.tm_year:04d}{now.tm_mon:02d}{now.tm_mday:02d}"
+        f"_{now.tm_hour:02d}{now.tm_min:02d}{now.tm_sec:02d}"
+    )
+
+
 class MultiplexerBase(ABC):
     """Abstract base class for terminal multiplexers."""
 
@@ -37,6 +51,13 @@ class MultiplexerBase(ABC):
         """Send a command to all panes."""
         pass
 
+    def flush_commands(self) -> None:
+        """Wait until commands queued by pane/window creation are delivered.
+
+        Backends that send pane commands synchronously have nothing to wait for.
+        """
+        return None
+
     @abstractmethod
     def close_session(self) -> None:
         """Close the multiplexer session."""
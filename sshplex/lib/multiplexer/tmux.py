@@ -3,13 +3,19 @@
 import platform
 import re
 import uuid
-from datetime import datetime
-from typing import Any, Dict, Optional
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 import libtmux
 
 from ..logger import get_logger
-from .base import MultiplexerBase
+from ..utils.tmux import find_tmux
+from .base import MultiplexerBase, default_session_name
+from .tmux_control import TmuxControlClient
+
+# Threads typing pane commands while later panes are still being split
+_SEND_WORKERS = 8
 
 
 class TmuxManager(MultiplexerBase):
@@ -21,8 +27,7 @@ class TmuxManager(MultiplexerBase):
     def __init__(self, session_name: Optional[str], config: Optional[Any] = None):
         """Initialize tmux manager with session name and max panes per window."""
         if session_name is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            session_name = f"sshplex-{timestamp}"
+            session_name = default_session_name()
 
         super().__init__(session_name)
         self.logger = get_logger()
@@ -35,6 +40,16 @@ class TmuxManager(MultiplexerBase):
         self.current_window_pane_count = 0
         self.system = platform.system().lower()
         self._initialized = False
+        # Splits stay sequential so panes keep their order; the send-keys
+        # for each new pane runs in the background until flush_commands()
+        self._send_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_sends: List[Tuple[str, Future[None]]] = []
+        # While a connection run creates panes, commands go through one
+        # tmux control-mode client instead of a tmux process per command
+        self._control: Optional[TmuxControlClient] = None
+        self._control_unavailable = False
+        # Panes per window id from one list-panes call; reset when panes change
+        self._pane_counts: Optional[Counter[str]] = None
 
     def _generate_unique_session_name(self, base_name: str) -> str:
         """Generate a unique session name to avoid collisions.
@@ -48,17 +63,18 @@ class TmuxManager(MultiplexerBase):
         if not self.server:
             return base_name
             
-        # Check if base name is available
-        if not self.server.has_session(base_name):
+        # One session listing instead of a has-session call per candidate
+        existing = {session.session_name for session in self.server.sessions}
+        if base_name not in existing:
             return base_name
-        
+
         # Name exists, try with incremental suffix
         for i in range(1, 100):
             new_name = f"{base_name}-{i}"
-            if not self.server.has_session(new_name):
+            if new_name not in existing:
                 self.logger.info(f"Session '{base_name}' exists, using '{new_name}'")
                 return new_name
-        
+
         # Fallback to UUID-based name
         unique_suffix = str(uuid.uuid4())[:8]
         return f"{base_name}-{unique_suffix}"
@@ -79,27 +95,119 @@ class TmuxManager(MultiplexerBase):
             self.logger.error(f"SSHplex: Failed to initialize tmux server: {e}")
             return False
 
+    def _control_client(self) -> Optional[TmuxControlClient]:
+        """Return the session's control-mode client, starting it on first use."""
+        if self._control is not None or self._control_unavailable or not self._initialized:
+            return self._control
+
+        tmux_bin = find_tmux()
+        if not tmux_bin or self.server is None:
+            self._control_unavailable = True
+            return None
+
+        # Talk to the same server as libtmux
+        argv = [tmux_bin]
+        socket_name = getattr(self.server, "socket_name", None)
+        socket_path = getattr(self.server, "socket_path", None)
+        if isinstance(socket_path, str) and socket_path:
+            argv.append(f"-S{socket_path}")
+        elif isinstance(socket_name, str) and socket_name:
+            argv.append(f"-L{socket_name}")
+        argv += ["-C", "attach-session", "-t", self.session_name]
+
+        try:
+            self._control = TmuxControlClient(argv)
+        except (OSError, EOFError, RuntimeError) as e:
+            self._control_unavailable = True
+            self.logger.debug(f"SSHplex: tmux control mode unavailable, running tmux per command: {e}")
+        return self._control
+
+    def _run_control(self, *args: str) -> Optional[List[str]]:
+        """Run a tmux command through the control client.
+
+        Returns:
+            The command's output lines, or None when no control client is
+            available and the caller should run tmux itself
+
+        Raises:
+            RuntimeError: If tmux reports an error for the command
+        """
+        control = self._control_client()
+        if control is None:
+            return None
+        try:
+            return control.run(*args)
+        except (OSError, EOFError) as e:
+            self.logger.warning(f"SSHplex: tmux control client stopped ({e}), running tmux per command")
+            self._close_control()
+            self._control_unavailable = True
+            return None
+
+    def _close_control(self) -> None:
+        """Detach the control client so it no longer holds the session attached."""
+        if self._control is not None:
+            self._control.close()
+            self._control = None
+
+    def _split_and_tile(self, window: Any, vertical: bool = True) -> Any:
+        """Split the window's active pane and re-tile the window.
+
+        libtmux's split looks up the active pane first and lists every pane on
+        the server to build the new Pane, and select-layout is yet another
+        client. The split and layout go through the control client when there
+        is one; otherwise they are chained with ``;`` into a single tmux
+        process. Either way the Pane is built from the printed id.
+        """
+        direction = "-v" if vertical else "-h"
+        output = self._run_control("split-window", "-t", window.window_id, direction, "-P", "-F#{pane_id}")
+        if output is not None:
+            if not output:
+                raise RuntimeError("tmux split-window returned no pane id")
+            self._run_control("select-layout", "-t", window.window_id, "tiled")
+            return libtmux.Pane(server=window.server, pane_id=output[0])
+
+        result = window.cmd(
+            "split-window", direction, "-P", "-F#{pane_id}",
+            ";", "select-layout", "-t", window.window_id, "tiled",
+        )
+        if not result.stdout:
+            raise RuntimeError(" ".join(result.stderr) or "tmux split-window returned no pane id")
+        return libtmux.Pane(server=window.server, pane_id=result.stdout[0])
+
     @staticmethod
-    def _split_window(window: Any, vertical: bool = True) -> Any:
-        """Split tmux window with libtmux version compatibility."""
-        split_window = getattr(window, "split_window", None)
-        if callable(split_window):
-            try:
-                return split_window(vertical=vertical)
-            except Exception as exc:
-                if "deprecated" not in str(exc).lower() and "removed" not in str(exc).lower():
-                    raise
+    def _send_line(pane: Any, command: str) -> None:
+        """Type a command into a pane and press Enter with one tmux call.
 
-        split = getattr(window, "split", None)
-        if callable(split):
-            try:
-                from libtmux.window import PaneDirection
-                direction = PaneDirection.Below if vertical else PaneDirection.Right
-                return split(direction=direction)
-            except Exception:
-                return split()
+        libtmux's send_keys(enter=True) spawns a second tmux client just to
+        send Enter; pane creation and per-host sends do this once per host.
+        """
+        pane.cmd("send-keys", command, "Enter")
+
+    def _queue_line(self, hostname: str, pane: Any, command: str) -> None:
+        """Send a command to a new pane, in the background without a control client."""
+        try:
+            if self._run_control("send-keys", "-t", pane.pane_id, command, "Enter") is not None:
+                return
+        except RuntimeError as e:
+            self.logger.error(f"SSHplex: Failed to send command to '{hostname}': {e}")
+            return
+
+        if self._send_executor is None:
+            self._send_executor = ThreadPoolExecutor(max_workers=_SEND_WORKERS, thread_name_prefix='tmux-send-')
+        self._pending_sends.append((hostname, self._send_executor.submit(self._send_line, pane, command)))
 
-        raise RuntimeError("No compatible tmux split method found")
+    def flush_commands(self) -> None:
+        """Wait for queued pane commands, logging failures, and detach the control client."""
+        pending, self._pending_sends = self._pending_sends, []
+        for hostname, future in pending:
+            try:
+                future.result()
+            except Exception as e:
+                self.logger.error(f"SSHplex: Failed to send command to '{hostname}': {e}")
+        if self._send_executor is not None:
+            self._send_executor.shutdown(wait=True)
+            self._send_executor = None
+        self._close_control()
 
     def create_session(self) -> bool:
         """Create a new tmux session with SSHplex branding."""
@@ -196,34 +304,33 @@ class TmuxManager(MultiplexerBase):
                 # Additional panes - attempt split with fallback
                 vertical_split = (self.current_window_pane_count % 2 == 0)
                 try:
-                    pane = self._split_window(self.current_window, vertical=vertical_split)
+                    pane = self._split_and_tile(self.current_window, vertical=vertical_split)
                 except Exception as e:
                     # Handle "no space" error by resizing or creating a new window
                     self.logger.warning(f"Pane split failed ({e}), attempting layout adjustment")
                     try:
                         # Resize window to fit more panes
                         self.current_window.resize(height=80, width=200)
-                        pane = self._split_window(self.current_window, vertical=vertical_split)
+                        pane = self._split_and_tile(self.current_window, vertical=vertical_split)
                     except Exception:
                         # If still fails, create a new window
                         self.logger.info("Creating new window due to insufficient space")
                         ensure_window_available()
                         vertical_split = True  # first split in new window
-                        pane = self._split_window(self.current_window, vertical=vertical_split)
+                        pane = self._split_and_tile(self.current_window, vertical=vertical_split)
 
                 if pane is None:
                     raise RuntimeError(f"Failed to create tmux pane for {hostname}")
 
-            # Balance layout for best use of space
-            self.current_window.select_layout("tiled")
-
             # Store pane reference and increment counter
             self.panes[hostname] = pane
             self.current_window_pane_count += 1
+            self._pane_counts = None
 
             # Execute command if provided (includes pane title via SSH command)
             if command:
-                self.send_command(hostname, command)
+                self._queue_line(hostname, pane, command)
+                self.logger.debug(f"SSHplex: Command queued for '{hostname}': {command}")
 
             self.logger.info(f"SSHplex: Pane created for '{hostname}' successfully "
                             f"(window panes: {self.current_window_pane_count}/{max_panes_per_window})")
@@ -256,10 +363,11 @@ class TmuxManager(MultiplexerBase):
 
             # Store the pane reference
             self.panes[hostname] = pane
+            self._pane_counts = None
 
             # Execute the provided command (should be SSH command)
             if command:
-                pane.send_keys(command, enter=True)
+                self._queue_line(hostname, pane, command)
 
             self.logger.info(f"SSHplex: Window created for '{hostname}' successfully")
             return True
@@ -271,15 +379,15 @@ class TmuxManager(MultiplexerBase):
     def set_pane_title(self, hostname: str, title: str) -> bool:
         """Set the title of a specific pane."""
         try:
-            if hostname not in self.panes:
+            pane = self.panes.get(hostname)
+            if pane is None:
                 self.logger.error(f"SSHplex: Pane for '{hostname}' not found")
                 return False
 
-            pane = self.panes[hostname]
             # Sanitize title to prevent injection - only allow safe characters
             safe_title = re.sub(r'[^\w\s.-]', '', title)[:50]  # Remove dangerous chars, limit length
             # Set pane title using printf escape sequence
-            pane.send_keys(f'printf "\\033]2;{safe_title}\\033\\\\"', enter=True)
+            self._send_line(pane, f'printf "\\033]2;{safe_title}\\033\\\\"')
             return True
 
         except Exception as e:
@@ -288,13 +396,14 @@ class TmuxManager(MultiplexerBase):
 
     def send_command(self, hostname: str, command: str) -> bool:
         """Send a command to a specific pane."""
+        self.flush_commands()
         try:
-            if hostname not in self.panes:
+            pane = self.panes.get(hostname)
+            if pane is None:
                 self.logger.error(f"SSHplex: Pane for '{hostname}' not found")
                 return False
 
-            pane = self.panes[hostname]
-            pane.send_keys(command, enter=True)
+            self._send_line(pane, command)
             self.logger.debug(f"SSHplex: Command sent to '{hostname}': {command}")
             return True
 
@@ -303,15 +412,31 @@ class TmuxManager(MultiplexerBase):
             return False
 
     def broadcast_command(self, command: str) -> bool:
-        """Send a command to all panes."""
+        """Send a command to all panes.
+
+        All send-keys are chained with ``;`` into one tmux process instead of
+        one per pane. tmux stops at the first failing command, so a failure
+        is reported for the whole broadcast.
+        """
+        self.flush_commands()
+        if not self.panes:
+            return True
+        if self.server is None:
+            self.logger.error("SSHplex: Failed to broadcast command: no tmux server")
+            return False
+
+        args: List[str] = []
+        for pane in self.panes.values():
+            args += [";", "send-keys", "-t", str(pane.pane_id), command, "Enter"]
+
         try:
-            success_count = 0
-            for hostname in self.panes:
-                if self.send_command(hostname, command):
-                    success_count += 1
+            result = self.server.cmd(*args[1:])
+            if result.stderr:
+                self.logger.error(f"SSHplex: Failed to broadcast command: {' '.join(result.stderr)}")
+                return False
 
-            self.logger.info(f"SSHplex: Broadcast command sent to {success_count}/{len(self.panes)} panes")
-            return success_count == len(self.panes)
+            self.logger.info(f"SSHplex: Broadcast command sent to {len(self.panes)} panes")
+            return True
 
         except Exception as e:
             self.logger.error(f"SSHplex: Failed to broadcast command: {e}")
@@ -319,6 +444,7 @@ class TmuxManager(MultiplexerBase):
 
     def close_session(self) -> None:
         """Close the tmux session."""
+        self.flush_commands()
         try:
             if self.session:
                 self.logger.info(f"SSHplex: Closing tmux session '{self.session_name}'")
@@ -328,12 +454,14 @@ class TmuxManager(MultiplexerBase):
                 self.windows.clear()
                 self.panes.clear()
                 self.current_window_pane_count = 0
+                self._pane_counts = None
 
         except Exception as e:
             self.logger.error(f"SSHplex: Error closing session: {e}")
 
     def attach_to_session(self, auto_attach: bool = True) -> None:
         """Attach to the tmux session."""
+        self.flush_commands()
         try:
             if self.session:
                 # Set up custom key binding for broadcast toggle
@@ -381,10 +509,18 @@ class TmuxManager(MultiplexerBase):
             self.logger.error(f"SSHplex: Error attaching to session: {e}")
 
     def _attach_standard(self) -> None:
-        """Standard tmux attach using os.execlp."""
+        """Standard tmux attach, exec'ing the cached tmux path when known."""
         import os
+
+        from ..logger import flush_logging
+
         # Use exec to replace the current Python process with tmux attach
-        os.execlp("tmux", "tmux", "attach-session", "-t", self.session_name)
+        tmux_bin = find_tmux()
+        flush_logging()
+        if tmux_bin:
+            os.execv(tmux_bin, [tmux_bin, "attach-session", "-t", self.session_name])
+        else:
+            os.execlp("tmux", "tmux", "attach-session", "-t", self.session_name)
 
     def _attach_iterm2(self) -> bool:
         """Attach using iTerm2 tmux integration (macOS only).
@@ -424,6 +560,27 @@ class TmuxManager(MultiplexerBase):
             self.logger.error(f"SSHplex: Failed to launch iTerm2: {e}")
             return False
 
+    def _window_pane_count(self, window: Any) -> int:
+        """Number of panes in a window.
+
+        Every ``window.panes`` access runs its own list-panes, so all windows
+        of the session are counted with a single call and reused until panes
+        change. Falls back to ``window.panes`` when that call isn't possible.
+        """
+        if self._pane_counts is None and self.server is not None and self.session is not None:
+            try:
+                result = self.server.cmd(
+                    "list-panes", "-s", "-t", str(self.session.session_id), "-F", "#{window_id}"
+                )
+                if not result.stderr:
+                    self._pane_counts = Counter(result.stdout)
+            except Exception as e:
+                self.logger.debug(f"SSHplex: Failed to list session panes: {e}")
+
+        if self._pane_counts is not None:
+            return self._pane_counts.get(str(window.window_id), 0)
+        return len(window.panes)
+
     def setup_broadcast_keybinding(self) -> bool:
         """Set up custom keybinding for broadcast toggle."""
         try:
@@ -456,7 +613,7 @@ class TmuxManager(MultiplexerBase):
 
             layout_applied = False
             for window_id, window in self.windows.items():
-                if window and len(window.panes) > 1:
+                if window and self._window_pane_count(window) > 1:
                     window.select_layout('tiled')
                     self.logger.info(f"SSHplex: Applied tiled layout to window {window_id}")
                     layout_applied = True
@@ -478,7 +635,7 @@ class TmuxManager(MultiplexerBase):
 
             broadcast_enabled = False
             for window_id, window in self.windows.items():
-                if window and len(window.panes) > 1:
+                if window and self._window_pane_count(window) > 1:
                     window.cmd('set-window-option', 'synchronize-panes', 'on')
                     self.logger.info(f"SSHplex: Enabled broadcast for window {window_id}")
                     broadcast_enabled = True
@@ -0,0 +1,146 @@
+"""Persistent tmux control-mode client for SSHplex."""
+
+import contextlib
+import queue
+import shlex
+import subprocess
+import threading
+from typing import List, Optional, Sequence
+
+# Reply printed by the handshake command; everything before it is skipped
+_READY_MARKER = "sshplex-control-ready"
+
+# Seconds to wait for tmux to answer one command before giving up on the client
+_REPLY_TIMEOUT = 10.0
+
+
+class TmuxControlClient:
+    """Run tmux commands through one ``tmux -C`` client instead of a process each.
+
+    Every command written to a control client is answered by a
+    ``%begin``/``%end`` block (``%error`` on failure), in command order.
+    Only blocks whose flags field is ``1`` answer commands written here; the
+    ``attach-session`` from the command line is answered with flags ``0``,
+    and not necessarily first. Notifications such as ``%output`` only arrive
+    between blocks and are skipped.
+    """
+
+    def __init__(self, argv: List[str], timeout: float = _REPLY_TIMEOUT) -> None:
+        """Start the control client and wait until it accepts commands.
+
+        Args:
+            argv: Command line ending in ``-C attach-session -t <session>``
+            timeout: Seconds to wait for each reply
+
+        Raises:
+            OSError: If tmux can't be started
+            TimeoutError: If tmux doesn't answer in time
+            EOFError: If the client exits before it is ready
+            RuntimeError: If tmux rejects the attach or the handshake
+        """
+        self._timeout = timeout
+        self._process = subprocess.Popen(
+            argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        # Lines are read on a thread so a hung server can't block a reply
+        # forever; None marks the end of the output
+        self._lines: queue.Queue[Optional[str]] = queue.Queue()
+        self._reader = threading.Thread(target=self._read_lines, name="tmux-control", daemon=True)
+        self._reader.start()
+        try:
+            self._write(["display-message", "-p", _READY_MARKER])
+            while self._read_reply() != [_READY_MARKER]:
+                pass
+            # Pane output isn't needed; tmux < 3.2 doesn't know the flag
+            with contextlib.suppress(RuntimeError):
+                self.run("refresh-client", "-f", "no-output")
+        except Exception:
+            self.close()
+            raise
+
+    def run(self, *args: str) -> List[str]:
+        """Run one tmux command and return its output lines.
+
+        Raises:
+            RuntimeError: If tmux reports an error for the command
+            TimeoutError: If tmux doesn't answer in time
+            EOFError: If the control client has exited
+        """
+        self._write(args)
+        return self._read_reply()
+
+    def close(self) -> None:
+        """Detach the client and wait for it to exit."""
+        # Closing stdin detaches; tmux then exits and the reader sees EOF
+        if self._process.stdin is not None:
+            with contextlib.suppress(OSError):
+                self._process.stdin.close()
+        try:
+            self._process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        self._reader.join(timeout=2)
+
+    def _read_lines(self) -> None:
+        """Forward tmux's output to the reply queue until it exits."""
+        stdout = self._process.stdout
+        try:
+            if stdout is not None:
+                for raw_line in stdout:
+                    self._lines.put(raw_line.rstrip("\n"))
+        except (OSError, ValueError):
+            pass
+        finally:
+            if stdout is not None:
+                with contextlib.suppress(OSError):
+                    stdout.close()
+            self._lines.put(None)
+
+    def _write(self, args: Sequence[str]) -> None:
+        """Send one command line to tmux."""
+        if self._process.stdin is None or self._process.stdin.closed:
+            raise EOFError("tmux control client is closed")
+        self._process.stdin.write(shlex.join(args) + "\n")
+        self._process.stdin.flush()
+
+    def _next_line(self) -> str:
+        """Return the next output line from tmux."""
+        try:
+            line = self._lines.get(timeout=self._timeout)
+        except queue.Empty:
+            raise TimeoutError(f"tmux didn't answer within {self._timeout:g}s") from None
+        if line is None:
+            # Leave the end marker for any later read
+            self._lines.put(None)
+            raise EOFError("tmux control client exited")
+        return line
+
+    def _read_reply(self) -> List[str]:
+        """Read the reply to the oldest unanswered command written here.
+
+        Blocks answering anything else (the command-line attach) are
+        skipped, except that an ``%error`` there means the attach failed.
+        """
+        while True:
+            line = self._next_line()
+            if not line.startswith("%begin "):
+                continue
+            # %end/%error repeat the time, number and flags of %begin
+            guard = line[len("%begin"):]
+            from_client = guard.rsplit(" ", 1)[-1] == "1"
+            lines: List[str] = []
+            while True:
+                line = self._next_line()
+                if line == "%end" + guard:
+                    break
+                if line == "%error" + guard:
+                    raise RuntimeError(" ".join(lines) or "tmux command failed")
+                lines.append(line)
+            if from_client:
+                return lines
@@ -8,6 +8,7 @@ from pathlib import Path
 import yaml
 
 from .logger import get_logger
+from .yaml_compat import YamlDumper, YamlLoader
 
 
 @dataclass
@@ -48,7 +49,7 @@ class SnippetManager:
 
         try:
             with self.snippets_file.open() as handle:
-                raw_data = yaml.safe_load(handle)
+                raw_data = yaml.load(handle, Loader=YamlLoader)
 
             if not raw_data:
                 return []
@@ -115,7 +116,9 @@ class SnippetManager:
         ]
 
         with self.snippets_file.open("w") as handle:
-            yaml.safe_dump(payload, handle, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                payload, handle, Dumper=YamlDumper, default_flow_style=False, sort_keys=False
+            )
 
     @staticmethod
     def get_default_snippets() -> list[Snippet]:
@@ -1,11 +1,13 @@
 """Ansible YAML Inventory Source of Truth provider for SSHplex."""
 
+import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import yaml
 
 from ..logger import get_logger
+from ..yaml_compat import load_yaml_file
 from .base import Host, SoTProvider
 
 
@@ -47,8 +49,7 @@ class AnsibleProvider(SoTProvider):
 
                     self.logger.info(f"Loading inventory from: {inventory_path}")
 
-                    with open(inventory_path) as f:
-                        inventory_data = yaml.safe_load(f)
+                    inventory_data = load_yaml_file(inventory_path)
 
                     if not inventory_data:
                         self.logger.warning(f"Empty inventory file: {inventory_path}")
@@ -156,7 +157,8 @@ class AnsibleProvider(SoTProvider):
         # Get group filters
         include_groups = filters.get('groups', [])
         exclude_groups = filters.get('exclude_groups', [])
-        host_patterns = filters.get('host_patterns', [])
+        # Compiled once here instead of per host further down
+        host_patterns = [re.compile(pattern) for pattern in filters.get('host_patterns', [])]
 
         # First, collect all hosts with their group hierarchy
         all_hosts_with_groups: List[Tuple[Host, List[str]]] = []
@@ -203,7 +205,7 @@ class AnsibleProvider(SoTProvider):
 
     def _collect_hosts_with_hierarchy(self, group_data: Dict[str, Any], group_name: str, inventory_path: str,
                                       parent_groups: List[str], hosts_with_groups: List[Tuple[Host, List[str]]],
-                                      host_patterns: List[str]) -> None:
+                                      host_patterns: List[re.Pattern[str]]) -> None:
         """Collect all hosts with their full group hierarchy.
 
         Args:
@@ -212,7 +214,7 @@ class AnsibleProvider(SoTProvider):
             inventory_path: Path to inventory file
             parent_groups: List of parent group names
             hosts_with_groups: List to collect (host, group_list) tuples
-            host_patterns: Host name patterns to match
+            host_patterns: Compiled host name patterns to match
         """
         current_hierarchy = parent_groups + [group_name]
 
@@ -243,7 +245,7 @@ class AnsibleProvider(SoTProvider):
                     )
 
     def _create_host_from_vars(self, host_name: str, host_vars: Dict[str, Any], group_name: str,
-                               inventory_path: str, host_patterns: List[str]) -> Optional[Host]:
+                               inventory_path: str, host_patterns: List[re.Pattern[str]]) -> Optional[Host]:
         """Create a Host object from Ansible host variables.
 
         Args:
@@ -251,22 +253,15 @@ class AnsibleProvider(SoTProvider):
             host_vars: Host variables from inventory
             group_name: Group containing this host
             inventory_path: Path to inventory file
-            host_patterns: Host name patterns to match
+            host_patterns: Compiled host name patterns to match
 
         Returns:
             Host object or None if filtered out
         """
         try:
             # Apply host pattern filters
-            if host_patterns:
-                import re
-                matched = False
-                for pattern in host_patterns:
-                    if re.search(pattern, host_name):
-                        matched = True
-                        break
-                if not matched:
-                    return None
+            if host_patterns and not any(pattern.search(host_name) for pattern in host_patterns):
+                return None
 
             # Get IP address from ansible_host variable
             ip = host_vars.get('ansible_host')
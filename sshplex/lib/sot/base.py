@@ -5,7 +5,14 @@ from typing import Any, Dict, List, Optional
 
 
 class Host:
-    """Simple host data structure."""
+    """Simple host data structure.
+
+    Metadata values read as attributes (``host.role``). Hosts are slotted, so
+    there's no per-instance ``__dict__`` holding a second copy of every key;
+    other attributes set on a host are kept apart from its metadata.
+    """
+
+    __slots__ = ("name", "ip", "metadata", "_attributes")
 
     _RESERVED_METADATA_KEYS = {"name", "ip", "metadata"}
 
@@ -19,20 +26,44 @@ class Host:
         self.name = name
         self.ip = ip
         self.metadata: Dict[str, Any] = {}
+        # Attributes set outside metadata; allocated on first use
+        self._attributes: Optional[Dict[str, Any]] = None
 
         if metadata:
             self.update_metadata(metadata)
         if kwargs:
             self.update_metadata(kwargs)
 
+    def __getattr__(self, key: str) -> Any:
+        # Only reached for names that aren't slots or class attributes
+        if key in Host.__slots__ or key.startswith("__"):
+            raise AttributeError(key)
+        attributes = self._attributes
+        if attributes is not None and key in attributes:
+            return attributes[key]
+        try:
+            return self.metadata[key]
+        except KeyError:
+            raise AttributeError(f"'Host' object has no attribute '{key}'") from None
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        if key in Host.__slots__:
+            object.__setattr__(self, key, value)
+            return
+        if self._attributes is None:
+            self._attributes = {}
+        self._attributes[key] = value
+
     def update_metadata(self, values: Dict[str, Any]) -> None:
-        """Merge metadata values and mirror them as instance attributes."""
+        """Merge metadata values, which are also readable as attributes."""
+        attributes = self._attributes
         for raw_key, value in values.items():
             key = str(raw_key)
             if key in self._RESERVED_METADATA_KEYS:
                 continue
             self.metadata[key] = value
-            setattr(self, key, value)
+            if attributes:
+                attributes.pop(key, None)
 
     def merge_metadata(self, values: Dict[str, Any]) -> None:
         """Compatibility helper to merge metadata values in-place."""
@@ -106,3 +137,14 @@ class SoTProvider(ABC):
             True if connection is healthy, False otherwise
         """
         pass
+
+    def get_hosts_by_name(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Host]:
+        """Retrieve hosts keyed by name for direct lookup.
+
+        Args:
+            filters: Optional filters to apply
+
+        Returns:
+            Dictionary of host name to Host; when names repeat, the last host wins
+        """
+        return {host.name: host for host in self.get_hosts(filters)}
@@ -7,7 +7,7 @@ import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from ..cache import HostCache
 from ..config import SUPPORTED_SOT_PROVIDER_TYPES
@@ -39,11 +39,16 @@ class SoTFactory:
                 cache_dir=cache_config.cache_dir,
                 cache_ttl_hours=cache_config.ttl_hours
             )
+            cache_ttl_hours = cache_config.ttl_hours
         else:
             # Use default cache settings if not configured
             self.cache = HostCache()
+            cache_ttl_hours = 24
 
-        self._cached_hosts_by_key: dict[str, list[Host]] = {}
+        # In-memory host sets per filter key, stamped with time.monotonic()
+        # and kept no longer than the on-disk cache TTL
+        self._cached_hosts_by_key: dict[str, tuple[float, list[Host]]] = {}
+        self._memory_cache_ttl = float(cache_ttl_hours) * 3600
         self._cache_lock = threading.RLock()
         self._provider_creators: dict[str, str] = {
             "static": "_create_static_provider",
@@ -283,10 +288,13 @@ class SoTFactory:
 
         cache_key = self._build_cache_key(additional_filters)
         with self._cache_lock:
-            memory_hosts = self._cached_hosts_by_key.get(cache_key)
-            if memory_hosts is not None:
-                self.logger.debug(f"Returning hosts from memory cache key '{cache_key}'")
-                return memory_hosts
+            memory_entry = self._cached_hosts_by_key.get(cache_key)
+            if memory_entry is not None:
+                cached_at, memory_hosts = memory_entry
+                if time.monotonic() - cached_at < self._memory_cache_ttl:
+                    self.logger.debug(f"Returning hosts from memory cache key '{cache_key}'")
+                    return memory_hosts
+                del self._cached_hosts_by_key[cache_key]
 
         # Disk cache is only used for unfiltered host sets.
         if cache_key != "default":
@@ -296,7 +304,7 @@ class SoTFactory:
         if cached_hosts is not None:
             self.logger.info(f"Loaded {len(cached_hosts)} hosts from cache")
             with self._cache_lock:
-                self._cached_hosts_by_key[cache_key] = cached_hosts
+                self._cached_hosts_by_key[cache_key] = (time.monotonic(), cached_hosts)
             return cached_hosts
 
         return None
@@ -310,7 +318,7 @@ class SoTFactory:
         """Persist retrieved hosts in cache and memory."""
         cache_key = self._build_cache_key(additional_filters)
         with self._cache_lock:
-            self._cached_hosts_by_key[cache_key] = hosts
+            self._cached_hosts_by_key[cache_key] = (time.monotonic(), hosts)
 
         # Keep on-disk cache canonical for unfiltered results only.
         if cache_key != "default":
@@ -330,43 +338,53 @@ class SoTFactory:
         unique_hosts: dict[str, Host] = {}
 
         for host in hosts:
-            key = f"{host.name}:{host.ip}"
-            existing = unique_hosts.get(key)
+            self._merge_unique_host(unique_hosts, host)
 
-            if existing is None:
-                unique_hosts[key] = host
-                continue
+        return list(unique_hosts.values())
+
+    def _merge_unique_host(self, unique_hosts: dict[str, Host], host: Host) -> bool:
+        """Add a host to ``unique_hosts`` or merge it into its earlier copy.
 
-            existing_sources = existing.metadata.get('sources', [])
-            incoming_sources = host.metadata.get('sources', [])
+        Returns:
+            True if the host was not seen before
+        """
+        key = f"{host.name}:{host.ip}"
+        existing = unique_hosts.get(key)
 
-            existing.merge_metadata(host.metadata)
+        if existing is None:
+            unique_hosts[key] = host
+            return True
 
-            if isinstance(existing_sources, str):
-                existing_sources = [existing_sources]
-            elif not isinstance(existing_sources, list):
-                existing_sources = [str(existing_sources)] if existing_sources else []
+        existing_sources = existing.metadata.get('sources', [])
+        incoming_sources = host.metadata.get('sources', [])
 
-            if isinstance(incoming_sources, str):
-                incoming_sources = [incoming_sources]
-            elif not isinstance(incoming_sources, list):
-                incoming_sources = [str(incoming_sources)] if incoming_sources else []
+        existing.merge_metadata(host.metadata)
 
-            merged_sources: list[str] = []
-            for source in [
-                *existing_sources,
-                *incoming_sources,
-                self._get_host_source(existing),
-                self._get_host_source(host),
-            ]:
-                source_text = str(source).strip() if source else ""
-                if source_text and source_text not in merged_sources:
-                    merged_sources.append(source_text)
+        if isinstance(existing_sources, str):
+            existing_sources = [existing_sources]
+        elif not isinstance(existing_sources, list):
+            existing_sources = [str(existing_sources)] if existing_sources else []
 
-            if merged_sources:
-                existing.merge_metadata({'sources': merged_sources})
+        if isinstance(incoming_sources, str):
+            incoming_sources = [incoming_sources]
+        elif not isinstance(incoming_sources, list):
+            incoming_sources = [str(incoming_sources)] if incoming_sources else []
 
-        return list(unique_hosts.values())
+        merged_sources: list[str] = []
+        for source in [
+            *existing_sources,
+            *incoming_sources,
+            self._get_host_source(existing),
+            self._get_host_source(host),
+        ]:
+            source_text = str(source).strip() if source else ""
+            if source_text and source_text not in merged_sources:
+                merged_sources.append(source_text)
+
+        if merged_sources:
+            existing.merge_metadata({'sources': merged_sources})
+
+        return False
 
     def get_all_hosts(self, additional_filters: dict[str, Any] | None = None, force_refresh: bool = False) -> list[Host]:
         """Get hosts from all configured providers with caching support.
@@ -470,6 +488,60 @@ class SoTFactory:
 
         return final_hosts
 
+    def iter_all_hosts(self, additional_filters: dict[str, Any] | None = None, force_refresh: bool = False, max_workers: int = 4) -> Iterator[Host]:
+        """Yield hosts from all configured providers as each provider finishes.
+
+        Providers are queried in parallel like get_all_hosts_parallel, but a
+        provider's hosts are yielded as soon as it returns instead of after the
+        slowest one. A host reported again by a later provider is not yielded
+        twice; the later metadata and sources are merged into the host already
+        yielded. The complete host set is cached once every provider is done.
+
+        Args:
+            additional_filters: Additional filters to apply to all providers
+            force_refresh: If True, bypass cache and fetch fresh data from providers
+            max_workers: Maximum number of parallel provider queries (default: 4)
+
+        Yields:
+            Unique hosts, in provider completion order
+        """
+        cached_hosts = self._load_hosts_from_cache(force_refresh, additional_filters)
+        if cached_hosts is not None:
+            yield from cached_hosts
+            return
+
+        self.logger.info("Cache miss or refresh requested - streaming hosts from providers")
+
+        if not self.providers:
+            self.logger.error("No SoT providers initialized")
+            return
+
+        unique_hosts: dict[str, Host] = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='provider-') as executor:
+            future_to_provider = {
+                executor.submit(self._fetch_provider_hosts, provider, additional_filters): provider
+                for provider in self.providers
+            }
+
+            for future in as_completed(future_to_provider):
+                provider_name = type(future_to_provider[future]).__name__
+                try:
+                    hosts = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error retrieving hosts from {provider_name}: {e}")
+                    continue
+
+                self.logger.info(f"Retrieved {len(hosts)} hosts from {provider_name}")
+                for host in hosts:
+                    if self._merge_unique_host(unique_hosts, host):
+                        yield host
+
+        final_hosts = list(unique_hosts.values())
+        self.logger.info(f"Retrieved {len(final_hosts)} unique hosts from {len(self.providers)} providers")
+
+        self._save_hosts_to_cache(final_hosts, additional_filters, fetch_mode='parallel')
+
     def _fetch_provider_hosts(self, provider: SoTProvider,
                               additional_filters: dict[str, Any] | None) -> list[Host]:
         """Fetch hosts from a single provider with error handling.
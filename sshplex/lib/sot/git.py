@@ -13,6 +13,7 @@ from typing import Any
 import yaml
 
 from ..logger import get_logger
+from ..yaml_compat import YamlLoader
 from .ansible import AnsibleProvider
 from .base import Host, SoTProvider
 
@@ -205,7 +206,7 @@ class GitProvider(SoTProvider):
         for file_path in files:
             rel_file = str(file_path.relative_to(self.repo_dir))
             try:
-                payload = yaml.safe_load(file_path.read_text(encoding="utf-8"))
+                payload = yaml.load(file_path.read_text(encoding="utf-8"), Loader=YamlLoader)
             except Exception as e:
                 self.logger.error(f"Git provider '{self.name}' failed reading {file_path}: {e}")
                 continue
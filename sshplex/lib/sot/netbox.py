@@ -1,5 +1,6 @@
 """NetBox Source of Truth provider for SSHplex."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 from ..logger import get_logger
@@ -120,18 +121,22 @@ class NetBoxProvider(SoTProvider):
             self.logger.info("Retrieving VMs and devices from NetBox")
 
             # Build filter parameters
-            filter_params = {}
+            filter_params: Dict[str, Any] = {}
             if filters:
                 filter_params.update(filters)
-                self.logger.info(f"Applying filters: {filter_params}")
+                self.logger.info(f"Applying filters: {filters}")
 
             hosts = []
             vm_count = 0
             device_count = 0
 
-            # Get virtual machines
-            self.logger.info("Querying virtual machines...")
-            vms = list(self.api.virtualization.virtual_machines.filter(**filter_params))
+            # Both queries are network-bound, so run them side by side
+            self.logger.info("Querying virtual machines and physical devices...")
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix='netbox-') as executor:
+                vm_future = executor.submit(self._fetch_all, self.api.virtualization.virtual_machines, filter_params)
+                device_future = executor.submit(self._fetch_all, self.api.dcim.devices, filter_params)
+                vms = vm_future.result()
+                devices = device_future.result()
             self.logger.info(f"Found {len(vms)} virtual machines")
 
             for vm in vms:
@@ -140,9 +145,6 @@ class NetBoxProvider(SoTProvider):
                     hosts.append(host)
                     vm_count += 1
 
-            # Get physical devices
-            self.logger.info("Querying physical devices...")
-            devices = list(self.api.dcim.devices.filter(**filter_params))
             self.logger.info(f"Found {len(devices)} physical devices")
 
             for device in devices:
@@ -158,6 +160,11 @@ class NetBoxProvider(SoTProvider):
             self.logger.error(f"Failed to retrieve hosts from NetBox: {e}")
             return []
 
+    @staticmethod
+    def _fetch_all(endpoint: Any, filter_params: Dict[str, Any]) -> List[Any]:
+        """Run a filtered query against a NetBox endpoint and read every page."""
+        return list(endpoint.filter(**filter_params))
+
     def _get_primary_ip(self, vm: Any) -> Optional[str]:
         """Extract primary IP address from VM object.
 
@@ -170,11 +177,11 @@ class NetBoxProvider(SoTProvider):
         try:
             if vm.primary_ip4:
                 # Remove CIDR notation if present
-                ip = str(vm.primary_ip4).split('/')[0]
+                ip = str(vm.primary_ip4).partition('/')[0]
                 return ip
             elif vm.primary_ip6:
                 # Use IPv6 if no IPv4
-                ip = str(vm.primary_ip6).split('/')[0]
+                ip = str(vm.primary_ip6).partition('/')[0]
                 return ip
             else:
                 return None
@@ -294,11 +301,11 @@ class NetBoxProvider(SoTProvider):
         try:
             if device.primary_ip4:
                 # Remove CIDR notation if present
-                ip = str(device.primary_ip4).split('/')[0]
+                ip = str(device.primary_ip4).partition('/')[0]
                 return ip
             elif device.primary_ip6:
                 # Use IPv6 if no IPv4
-                ip = str(device.primary_ip6).split('/')[0]
+                ip = str(device.primary_ip6).partition('/')[0]
                 return ip
             else:
                 return None
@@ -1,5 +1,6 @@
 """Static host list Source of Truth provider for SSHplex."""
 
+import re
 from typing import Any, Dict, List, Optional
 
 from ..logger import get_logger
@@ -20,6 +21,18 @@ class StaticProvider(SoTProvider):
         self.hosts_data = hosts
         self.logger = get_logger()
 
+        # Tag -> indices into hosts_data, so tag filters skip non-matching hosts.
+        # Hosts whose tags are a plain string keep substring matching instead.
+        self._tag_index: Dict[str, List[int]] = {}
+        self._text_tag_hosts: List[int] = []
+        for index, host_data in enumerate(hosts):
+            tags = host_data.get('tags')
+            if isinstance(tags, str):
+                self._text_tag_hosts.append(index)
+            elif tags:
+                for tag in set(tags):
+                    self._tag_index.setdefault(tag, []).append(index)
+
     def connect(self) -> bool:
         """Static provider doesn't need connection.
 
@@ -46,44 +59,47 @@ class StaticProvider(SoTProvider):
         Returns:
             List of Host objects from static configuration
         """
-        hosts = []
+        host_rows = self._select_host_data(filters) if filters else self.hosts_data
+        hosts = [self._host_from_data(host_data) for host_data in host_rows]
 
-        for host_data in self.hosts_data:
-            # Extract name and ip, create kwargs from remaining data
-            name = host_data['name']
-            ip = host_data['ip']
+        self.logger.info(f"Static provider '{self.name}' returned {len(hosts)} hosts")
+        return hosts
 
-            # Create kwargs with remaining host data (excluding name and ip)
-            kwargs = {k: v for k, v in host_data.items() if k not in ['name', 'ip']}
-            kwargs['provider'] = self.name
+    def _host_from_data(self, host_data: Dict[str, Any]) -> Host:
+        """Build a Host from one configured host entry.
 
-            # Create host object
-            host = Host(name=name, ip=ip, **kwargs)
+        Args:
+            host_data: Host dictionary from the static configuration
 
-            # Add source information to metadata
-            host.metadata['sources'] = [self.name]
-            host.metadata['provider'] = self.name
+        Returns:
+            Host tagged with this provider as its source
+        """
+        # Extract name and ip, create kwargs from remaining data
+        name = host_data['name']
+        ip = host_data['ip']
 
-            hosts.append(host)
+        # Create kwargs with remaining host data (excluding name and ip)
+        kwargs = {k: v for k, v in host_data.items() if k not in ['name', 'ip']}
+        kwargs['provider'] = self.name
 
-        # Apply filters if provided
-        if filters:
-            hosts = self._apply_filters(hosts, filters)
+        # Create host object
+        host = Host(name=name, ip=ip, **kwargs)
 
-        self.logger.info(f"Static provider '{self.name}' returned {len(hosts)} hosts")
-        return hosts
+        # Add source information to metadata
+        host.metadata['sources'] = [self.name]
+        host.metadata['provider'] = self.name
+        return host
 
-    def _apply_filters(self, hosts: List[Host], filters: Dict[str, Any]) -> List[Host]:
-        """Apply filters to host list.
+    def _select_host_data(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Pick the host entries matching the filters before any Host is built.
 
         Args:
-            hosts: List of hosts to filter
             filters: Filters to apply
 
         Returns:
-            Filtered list of hosts
+            Matching host dictionaries, in configuration order
         """
-        filtered_hosts = hosts
+        selected = self.hosts_data
 
         # Filter by tags
         if 'tags' in filters and filters['tags']:
@@ -91,28 +107,30 @@ class StaticProvider(SoTProvider):
             if isinstance(required_tags, str):
                 required_tags = [required_tags]
 
-            filtered_hosts = [
-                host for host in filtered_hosts
-                if any(tag in getattr(host, 'tags', []) for tag in required_tags)
-            ]
+            indices = {index for tag in required_tags for index in self._tag_index.get(tag, ())}
+            indices.update(
+                index for index in self._text_tag_hosts
+                if any(tag in self.hosts_data[index]['tags'] for tag in required_tags)
+            )
+            selected = [self.hosts_data[index] for index in sorted(indices)]
 
         # Filter by name pattern
         if 'name_pattern' in filters and filters['name_pattern']:
-            import re
             pattern = re.compile(filters['name_pattern'], re.IGNORECASE)
-            filtered_hosts = [
-                host for host in filtered_hosts
-                if pattern.search(host.name)
+            selected = [
+                host_data for host_data in selected
+                if pattern.search(host_data['name'])
             ]
 
         # Filter by description pattern
         if 'description_pattern' in filters and filters['description_pattern']:
-            import re
             pattern = re.compile(filters['description_pattern'], re.IGNORECASE)
-            filtered_hosts = [
-                host for host in filtered_hosts
-                if pattern.search(getattr(host, 'description', ''))
+            selected = [
+                host_data for host_data in selected
+                if pattern.search(host_data.get('description', ''))
             ]
 
-        self.logger.debug(f"Static provider '{self.name}' filtered from {len(hosts)} to {len(filtered_hosts)} hosts")
-        return filtered_hosts
+        self.logger.debug(
+            f"Static provider '{self.name}' filtered from {len(self.hosts_data)} to {len(selected)} hosts"
+        )
+        return selected
@@ -24,6 +24,7 @@ from textual.widgets import (
     TextArea,
 )
 
+from ..cache import CACHE_FILE_NAME, read_cached_host_dicts
 from ..config import (
     MUX_BACKEND_LABELS,
     SOT_PROVIDER_LABELS,
@@ -913,11 +914,10 @@ class ConfigEditorScreen(ModalScreen[bool]):
         ]
         for cache_dir in candidate_cache_dirs:
             try:
-                cache_file = cache_dir / "hosts.yaml"
+                cache_file = cache_dir / CACHE_FILE_NAME
                 if not cache_file.exists():
                     continue
-                with open(cache_file) as f:
-                    hosts_data = yaml.safe_load(f) or []
+                hosts_data = read_cached_host_dicts(cache_file) or []
                 for host in hosts_data[:800]:
                     if isinstance(host, dict):
                         _add_keys_from_host_like(host)
@@ -2,18 +2,24 @@
 
 import asyncio
 import contextlib
+import fnmatch
+import re
 import subprocess
+from bisect import bisect_right
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import Any, Iterable, List, Optional, Set
+from typing import Any, Iterable, List, Optional
 
 import pyperclip
 import yaml
+from rich.text import Text
 from textual.app import App, ComposeResult, SystemCommand
 from textual.binding import Binding
 from textual.containers import Container, Vertical
 from textual.reactive import reactive
 from textual.screen import ModalScreen, Screen
+from textual.timer import Timer
 from textual.widgets import (
     DataTable,
     Footer,
@@ -29,6 +35,7 @@ from ..config import get_default_config_path, load_config
 from ..health import HealthStatus, check_host
 from ..history import HistoryManager
 from ..logger import get_logger
+from ..multiplexer.base import default_session_name
 from ..snippets import Snippet, SnippetManager
 from ..sot.base import Host
 from ..sot.factory import SoTFactory
@@ -40,6 +47,35 @@ from ..utils.ssh_config import (
 from .config_editor import ConfigEditorScreen
 from .session_manager import ITerm2SessionManager, TmuxSessionManager
 
+# Static status-bar label, formatted once at import instead of per compose
+_VERSION_LABEL = f"SSHplex v{__version__}"
+
+# Host table cells are pre-built Rich Text rather than markup strings, so
+# DataTable doesn't parse markup for every cell it measures and renders.
+_CHECKBOX_ON = Text("✓", style="green", end="")
+_CHECKBOX_OFF = Text(" ", style="dim", end="")
+
+# Seconds of typing idle time before the search filter is applied
+_SEARCH_DEBOUNCE = 0.15
+# Narrowing the table removes rows in place up to this many; each removal
+# re-indexes every row, so beyond it a full rebuild is cheaper
+_MAX_ROW_REMOVALS = 32
+
+# Upper bound on health-check connections open at once, so large
+# inventories don't exhaust file descriptors
+_HEALTH_CHECK_CONCURRENCY = 64
+
+# Table column aliases mapped to the Host attribute/metadata key they show
+_COLUMN_ALIASES = {
+    "source": "provider",
+    "alias": "ssh_alias",
+    "user": "ssh_user",
+    "port": "ssh_port",
+    "key": "ssh_key_path",
+    "key_path": "ssh_key_path",
+    "hostname": "ip",
+}
+
 
 class LoadingScreen(ModalScreen[None]):
     """Modal screen that displays loading progress while refreshing data sources."""
@@ -361,7 +397,6 @@ class HostSelector(App):
         Binding("l", "toggle_log_panel", "Logs", show=True),
     ]
 
-    selected_hosts: reactive[Set[str]] = reactive(set())
     search_filter: reactive[str] = reactive("")
     use_panes: reactive[bool] = reactive(True)  # True for panes, False for tabs
     use_broadcast: reactive[bool] = reactive(
@@ -380,11 +415,16 @@ class HostSelector(App):
         self.logger = get_logger()
         self.hosts: List[Host] = []
         self.filtered_hosts: List[Host] = []
+        # Selection flags indexed by position in self.hosts (1 = selected)
+        self._selected = bytearray()
+        self._host_index: dict[str, int] = {}
         self.sot_factory: Optional[SoTFactory] = None
         self.table: Optional[DataTable] = None
         self.log_widget: Optional[Log] = None
         self.status_widget: Optional[Static] = None
+        self._status_text: Optional[str] = None
         self.search_input: Optional[Input] = None
+        self._search_timer: Optional[Timer] = None
         self.cache_widget: Optional[Static] = None
         self.loading_screen: Optional[LoadingScreen] = None
         self.sort_reverse = False
@@ -402,6 +442,16 @@ class HostSelector(App):
         self.history_manager = HistoryManager(config_dir)
         self.filter_mode = "all"
         self.health_cache: dict[str, tuple[HealthStatus, datetime]] = {}
+        self._search_corpus: Optional[bytes] = None
+        self._search_offsets: List[int] = []
+        # Display values per host (parallel to self.hosts, in table column
+        # order) and favorite host keys, built once until invalidated
+        self._host_values: Optional[List[tuple[str, ...]]] = None
+        self._host_values_lower: Optional[List[tuple[str, ...]]] = None
+        self._favorite_keys: Optional[set[str]] = None
+        # Row keys currently rendered in the table, in order; None forces the
+        # next populate_table() to rebuild every row
+        self._table_keys: Optional[List[str]] = None
 
     def compose(self) -> ComposeResult:
         """Create the UI layout."""
@@ -423,7 +473,7 @@ class HostSelector(App):
         with Container(id="status-bar"):
             yield Static("SSHplex - Loading hosts...", id="status-content")
             yield Static("Cache: --", id="cache-display")
-            yield Static(f"SSHplex v{__version__}", id="version-display")
+            yield Static(_VERSION_LABEL, id="version-display")
 
         # Footer with keybindings
         yield Footer()
@@ -612,6 +662,10 @@ class HostSelector(App):
         hosts_to_display.sort(
             key=lambda r: getattr(r, col, ""), reverse=self.sort_reverse
         )
+        if hosts_to_display is self.hosts:
+            # Selection flags and cached values are positional; re-key them
+            self._reindex_hosts()
+            self._invalidate_host_values()
         self.populate_table(hosts_to_display)
 
     def show_loading_screen(
@@ -772,6 +826,8 @@ class HostSelector(App):
                 force_refresh=force_refresh
             )
             self.filtered_hosts = self.hosts.copy()  # Initialize filtered hosts
+            self._reindex_hosts()
+            self._invalidate_host_values()
 
             if not self.hosts:
                 self.log_message(
@@ -835,39 +891,159 @@ class HostSelector(App):
         if not self.table:
             return
 
+        keys = [self._host_key(host) for host in hosts_to_display]
+        shown = self._table_keys
+        if shown is not None:
+            if keys == shown:
+                return
+            removed = self._removed_row_keys(shown, keys)
+            if removed is not None and len(removed) <= _MAX_ROW_REMOVALS:
+                # Narrowed result (e.g. one more search character): drop the
+                # rows that went away instead of rebuilding the others
+                cursor_row = self.table.cursor_row
+                previous_key = shown[cursor_row] if 0 <= cursor_row < len(shown) else None
+                for key in removed:
+                    self.table.remove_row(key)
+                self._table_keys = keys
+                if previous_key in keys:
+                    self.table.move_cursor(row=keys.index(previous_key))
+                return
+
         previous_host_key = self._current_cursor_host_key()
 
         # Clear existing table data
         self.table.clear()
+        self._table_keys = keys
 
         if not hosts_to_display:
             return
 
-        for host in hosts_to_display:
+        # Build every row first, then insert them in one pass. Textual's
+        # add_rows() cannot take row keys and loops over add_row() anyway.
+        rows: list[tuple[list[Text], str]] = []
+        cursor_index: Optional[int] = None
+        for index, host in enumerate(hosts_to_display):
             # Build row data based on configured columns
             # Use colors for better visual feedback
             host_key = self._host_key(host)
-            is_selected = host_key in self.selected_hosts
-            row_data = [
-                "[green]✓[/green]" if is_selected else "[dim] [/dim]"
-            ]  # Checkbox column
-
-            # Highlight selected hosts with color
-            for column in self._table_columns():
-                value = self._get_column_value(host, column)
-                if is_selected:
-                    # Highlight selected hosts
-                    row_data.append(f"[bold]{value}[/bold]")
-                else:
-                    row_data.append(value)
+            if host_key == previous_host_key and cursor_index is None:
+                cursor_index = index
+            row_data = self._row_cells(
+                self._host_display_values(host), self._is_selected(host)
+            )
+            rows.append((row_data, host_key))
+
+        add_row = self.table.add_row
+        for row_data, host_key in rows:
+            add_row(*row_data, key=host_key)
 
-            self.table.add_row(*row_data, key=host_key)
+        if cursor_index is not None:
+            self.table.move_cursor(row=cursor_index)
 
-        if previous_host_key:
-            for index, host in enumerate(hosts_to_display):
-                if self._host_key(host) == previous_host_key:
-                    self.table.move_cursor(row=index)
-                    break
+    @staticmethod
+    def _removed_row_keys(shown: List[str], keys: List[str]) -> Optional[List[str]]:
+        """Return the keys dropped from shown if keys keeps its order, else None."""
+        if len(keys) > len(shown):
+            return None
+        removed: List[str] = []
+        position = 0
+        for key in keys:
+            while position < len(shown) and shown[position] != key:
+                removed.append(shown[position])
+                position += 1
+            if position == len(shown):
+                return None
+            position += 1
+        removed.extend(shown[position:])
+        return removed
+
+    @staticmethod
+    def _row_cells(values: Iterable[str], selected: bool) -> list[Text]:
+        """Build table cells from display values; selected hosts are bold."""
+        style = "bold" if selected else ""
+        return [_CHECKBOX_ON if selected else _CHECKBOX_OFF] + [
+            Text(value, style=style, end="") for value in values
+        ]
+
+    def _all_host_values(self) -> List[tuple[str, ...]]:
+        """Return display values for every host, in table column order."""
+        if self._host_values is None:
+            # Resolve column aliases and the history flag once per build,
+            # not once per cell
+            keys = [
+                self._normalize_column_name(str(column).strip())
+                for column in self._table_columns()
+            ]
+            mark_favorites = bool(getattr(self.config.history, "enabled", True))
+            column_value = self._column_value
+            self._host_values = [
+                tuple(column_value(host, key, mark_favorites) for key in keys)
+                for host in self.hosts
+            ]
+        return self._host_values
+
+    def _all_host_values_lower(self) -> List[tuple[str, ...]]:
+        """Return lowercased display values for every host, for matching."""
+        if self._host_values_lower is None:
+            self._host_values_lower = [
+                tuple(value.lower() for value in values)
+                for values in self._all_host_values()
+            ]
+        return self._host_values_lower
+
+    def _host_display_values(self, host: Host) -> tuple[str, ...]:
+        """Return cached display values for a host, in table column order."""
+        index = self._host_index.get(self._host_key(host))
+        values = self._all_host_values()
+        if index is not None and index < len(values):
+            return values[index]
+        return tuple(
+            self._get_column_value(host, column) for column in self._table_columns()
+        )
+
+    def _is_favorite(self, host: Host) -> bool:
+        """Return True when host is a favorite, reading history once per cache."""
+        if self._favorite_keys is None:
+            self._favorite_keys = {
+                self._host_key_from_parts(record.name, record.ip)
+                for record in self.history_manager.get_favorites()
+            }
+        return self._host_key(host) in self._favorite_keys
+
+    @property
+    def selected_count(self) -> int:
+        """Number of currently selected hosts."""
+        return self._selected.count(1)
+
+    @property
+    def selected_hosts(self) -> List[Host]:
+        """Currently selected hosts in load order."""
+        return [host for host, flag in zip(self.hosts, self._selected) if flag]
+
+    def _reindex_hosts(self) -> None:
+        """Rebuild host index and selection flags, keeping selections by key."""
+        previous = [
+            key for key, index in self._host_index.items() if self._selected[index]
+        ]
+        self._host_index = {
+            self._host_key(host): index for index, host in enumerate(self.hosts)
+        }
+        self._selected = bytearray(len(self.hosts))
+        for key in previous:
+            index = self._host_index.get(key)
+            if index is not None:
+                self._selected[index] = 1
+
+    def _is_selected(self, host: Host) -> bool:
+        """Return True when host is currently selected."""
+        index = self._host_index.get(self._host_key(host))
+        return index is not None and bool(self._selected[index])
+
+    def _set_selected(self, host: Host, selected: bool) -> None:
+        """Set selection flag for a host."""
+        index = self._host_index.get(self._host_key(host))
+        if index is not None:
+            self._selected[index] = int(selected)
 
     @staticmethod
     def _host_key(host: Host) -> str:
@@ -891,6 +1067,10 @@ class HostSelector(App):
 
     def _current_cursor_host_key(self) -> Optional[str]:
         """Get host key currently under cursor in rendered table."""
+        keys = self._table_keys
+        if self.table and keys is not None:
+            row = self.table.cursor_row
+            return keys[row] if 0 <= row < len(keys) else None
         host = self._current_cursor_host()
         if host is None:
             return None
@@ -899,23 +1079,21 @@ class HostSelector(App):
     @staticmethod
     def _normalize_column_name(column: str) -> str:
         """Normalize aliases used in table column config."""
-        mapping = {
-            "source": "provider",
-            "alias": "ssh_alias",
-            "user": "ssh_user",
-            "port": "ssh_port",
-            "key": "ssh_key_path",
-            "key_path": "ssh_key_path",
-            "hostname": "ip",
-        }
-        return mapping.get(column, column)
+        return _COLUMN_ALIASES.get(column, column)
 
     def _get_column_value(self, host: Host, column: str) -> str:
         """Get display value for a table column from host attributes/metadata."""
-        key = self._normalize_column_name(str(column).strip())
-        if key == "name" and bool(getattr(self.config.history, "enabled", True)):
+        return self._column_value(
+            host,
+            self._normalize_column_name(str(column).strip()),
+            bool(getattr(self.config.history, "enabled", True)),
+        )
+
+    def _column_value(self, host: Host, key: str, mark_favorites: bool) -> str:
+        """Get display value for an already-normalized column key."""
+        if key == "name" and mark_favorites:
             name_value = str(getattr(host, "name", ""))
-            if self.history_manager.is_favorite(host.name, host.ip):
+            if self._is_favorite(host):
                 return f"★ {name_value}"
             return name_value
 
@@ -955,8 +1133,7 @@ class HostSelector(App):
 
         # Host rows
         for host in hosts:
-            row = [self._get_column_value(host, col) for col in columns]
-            table.append(row)
+            table.append(list(self._host_display_values(host)))
 
         # Compute max width for each column
         col_widths = [max(len(row[i]) for row in table) for i in range(len(columns))]
@@ -978,23 +1155,24 @@ class HostSelector(App):
         if not self.table or not self.hosts:
             return
 
-        cursor_row = self.table.cursor_row
-        hosts_to_use = self.filtered_hosts if self.search_filter else self.hosts
-
-        if cursor_row >= 0 and cursor_row < len(hosts_to_use):
-            host_key = self._host_key(hosts_to_use[cursor_row])
-            host_label = hosts_to_use[cursor_row].name
+        # The rendered row keys map the cursor straight to a host position
+        host_key = self._current_cursor_host_key()
+        if host_key is None:
+            return
+        index = self._host_index.get(host_key)
+        if index is None:
+            return
 
-            if host_key in self.selected_hosts:
-                self.selected_hosts.discard(host_key)
-                self.update_row_checkbox(host_key, False)
-                self.log_message(f"Deselected: {host_label}")
-            else:
-                self.selected_hosts.add(host_key)
-                self.update_row_checkbox(host_key, True)
-                self.log_message(f"Selected: {host_label}")
+        host = self.hosts[index]
+        self._selected[index] ^= 1
+        if self._selected[index]:
+            self.update_row_checkbox(host_key, True)
+            self.log_message(f"Selected: {host.name}")
+        else:
+            self.update_row_checkbox(host_key, False)
+            self.log_message(f"Deselected: {host.name}")
 
-            self.update_status_selection()
+        self.update_status_selection()
 
     def action_select_all(self) -> None:
         """Select all hosts (filtered if search is active)."""
@@ -1003,10 +1181,22 @@ class HostSelector(App):
 
         hosts_to_select = self.filtered_hosts if self.search_filter else self.hosts
 
-        for host in hosts_to_select:
-            host_key = self._host_key(host)
-            self.selected_hosts.add(host_key)
-            self.update_row_checkbox(host_key, True)
+        # Only hosts whose state actually changes need their row restyled
+        if hosts_to_select is self.hosts:
+            changed = [host for host, flag in zip(self.hosts, self._selected) if not flag]
+        else:
+            changed = [host for host in hosts_to_select if not self._is_selected(host)]
+        if not changed:
+            self.log_message(f"All {len(hosts_to_select)} hosts already selected")
+            return
+
+        if hosts_to_select is self.hosts:
+            self._selected = bytearray(b"\x01") * len(self.hosts)
+        else:
+            for host in changed:
+                self._set_selected(host, True)
+
+        self.update_rows_checkbox(map(self._host_key, changed), True)
 
         self.log_message(f"Selected all {len(hosts_to_select)} hosts")
         self.update_status_selection()
@@ -1018,10 +1208,22 @@ class HostSelector(App):
 
         hosts_to_deselect = self.filtered_hosts if self.search_filter else self.hosts
 
-        for host in hosts_to_deselect:
-            host_key = self._host_key(host)
-            self.selected_hosts.discard(host_key)
-            self.update_row_checkbox(host_key, False)
+        # Only hosts whose state actually changes need their row restyled
+        if hosts_to_deselect is self.hosts:
+            changed = [host for host, flag in zip(self.hosts, self._selected) if flag]
+        else:
+            changed = [host for host in hosts_to_deselect if self._is_selected(host)]
+        if not changed:
+            self.log_message(f"No hosts selected among {len(hosts_to_deselect)}")
+            return
+
+        if hosts_to_deselect is self.hosts:
+            self._selected = bytearray(len(self.hosts))
+        else:
+            for host in changed:
+                self._set_selected(host, False)
+
+        self.update_rows_checkbox(map(self._host_key, changed), False)
 
         self.log_message(f"Deselected all {len(hosts_to_deselect)} hosts")
         self.update_status_selection()
@@ -1037,13 +1239,11 @@ class HostSelector(App):
             )
             return
 
-        if not self.selected_hosts:
+        if not self.selected_count:
             self.log_message("No hosts selected for connection", level="warning")
             return
 
-        selected_host_objects = [
-            h for h in self.hosts if self._host_key(h) in self.selected_hosts
-        ]
+        selected_host_objects = self.selected_hosts
         if not selected_host_objects:
             self.log_message("No hosts found matching selection", level="warning")
             return
@@ -1088,9 +1288,7 @@ class HostSelector(App):
         def _connect() -> Optional[str]:
             from ...sshplex_connector import SSHplexConnector
 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            session_name = f"sshplex-{timestamp}"
-            connector = SSHplexConnector(session_name, config=self.config)
+            connector = SSHplexConnector(default_session_name(), config=self.config)
 
             ok = connector.connect_to_hosts(
                 hosts=selected_host_objects,
@@ -1228,11 +1426,7 @@ class HostSelector(App):
         )
         now = datetime.now()
 
-        target_hosts = [
-            h
-            for h in self.get_hosts_to_display()
-            if self._host_key(h) in self.selected_hosts
-        ]
+        target_hosts = [h for h in self.get_hosts_to_display() if self._is_selected(h)]
         if not target_hosts:
             target_hosts = self.get_hosts_to_display()
 
@@ -1255,11 +1449,13 @@ class HostSelector(App):
             self.log_message(f"Health check complete for {len(target_hosts)} host(s)")
             return
 
+        port = int(getattr(self.config.ssh, "port", 22))
+        limit = asyncio.Semaphore(_HEALTH_CHECK_CONCURRENCY)
+
         async def check_one(host: Host, key: str) -> tuple[str, HealthStatus]:
             target = host.ip if host.ip else host.name
-            return key, await check_host(
-                target, port=int(getattr(self.config.ssh, "port", 22)), timeout=timeout
-            )
+            async with limit:
+                return key, await check_host(target, port=port, timeout=timeout)
 
         pending_checks = [check_one(host, key) for host, key in hosts_to_check]
         for checked, result in enumerate(
@@ -1270,6 +1466,7 @@ class HostSelector(App):
             self.health_cache[key] = (status, datetime.now())
             self.update_status(f"Health check: {checked}/{len(hosts_to_check)}")
 
+        self._invalidate_host_values()
         self.populate_table(self.get_hosts_to_display())
         self.update_status_with_mode()
         self.log_message(f"Health check complete for {len(target_hosts)} host(s)")
@@ -1288,6 +1485,7 @@ class HostSelector(App):
         current = self.history_manager.is_favorite(host.name, host.ip)
         new_value = not current
         self.history_manager.set_favorite(host.name, host.ip, new_value)
+        self._invalidate_host_values()
         icon = "★" if new_value else "☆"
         self.log_message(
             f"{icon} {'Favorited' if new_value else 'Unfavorited'}: {host.name}"
@@ -1383,6 +1581,7 @@ class HostSelector(App):
             pass
 
         # Rebuild table columns from updated configuration.
+        self._invalidate_host_values()
         if self.table:
             for column in list(self.table.ordered_columns):
                 self.table.remove_column(column.key)
@@ -1553,33 +1752,45 @@ class HostSelector(App):
 
     def update_row_checkbox(self, row_key: str, selected: bool) -> None:
         """Update the checkbox for a specific row."""
+        self.update_rows_checkbox([row_key], selected)
+
+    def update_rows_checkbox(self, row_keys: Iterable[str], selected: bool) -> None:
+        """Update checkbox and bold styling for many rows in one pass.
+
+        Restyling never changes a cell's width, so cells are updated with
+        ``update_width=False`` and DataTable skips re-measuring columns.
+        Rows that aren't rendered (e.g. hidden by a history filter) are skipped.
+        """
         if not self.table:
             return
 
-        checkbox = "[green]✓[/green]" if selected else "[dim] [/dim]"
-        self.table.update_cell(row_key, "checkbox", checkbox)
-
-        # Also update the row style for all columns
-        for column in self._table_columns():
-            value = self.table.get_cell(row_key, column)
-            if value:
-                if selected:
-                    self.table.update_cell(row_key, column, f"[bold]{value}[/bold]")
-                else:
-                    # Remove bold tags
-                    self.table.update_cell(
-                        row_key,
-                        column,
-                        value.replace("[bold]", "").replace("[/bold]", ""),
-                    )
+        table = self.table
+        columns = self._table_columns()
+        host_values = self._all_host_values()
+        for row_key in row_keys:
+            if row_key not in table.rows:
+                continue
+            # Rebuild cells from cached display values instead of reading
+            # the rendered Text back out of the table
+            index = self._host_index.get(row_key)
+            if index is not None and index < len(host_values):
+                values: Iterable[str] = host_values[index]
+            else:
+                cells = (table.get_cell(row_key, column) for column in columns)
+                values = [
+                    cell.plain if isinstance(cell, Text) else str(cell) for cell in cells
+                ]
+            for column, cell in zip(("checkbox", *columns), self._row_cells(values, selected)):
+                table.update_cell(row_key, column, cell, update_width=False)
 
     def update_status_selection(self) -> None:
         """Update status bar with selection count and mode."""
         self.update_status_with_mode()
 
     def update_status(self, message: str) -> None:
-        """Update the status bar."""
-        if self.status_widget:
+        """Update the status bar, skipping the relayout when text is unchanged."""
+        if self.status_widget and message != self._status_text:
+            self._status_text = message
             self.status_widget.update(message)
 
     def log_message(self, message: str, level: str = "info") -> None:
@@ -1596,12 +1807,11 @@ class HostSelector(App):
         if self.log_widget and self.config.ui.show_log_panel:
             timestamp = datetime.now().strftime("%H:%M:%S")
             level_prefix = level.upper() if level != "info" else "INFO"
+            # write_line already scrolls to the end synchronously
             self.log_widget.write_line(
                 f"[{timestamp}] {level_prefix}: {message}",
                 scroll_end=True,
             )
-            with contextlib.suppress(Exception):
-                self.log_widget.scroll_end(animate=False, immediate=True, x_axis=False)
 
     def action_show_help(self) -> None:
         """Show keyboard shortcuts help screen."""
@@ -1672,6 +1882,7 @@ class HostSelector(App):
 
     def action_focus_table(self) -> None:
         """Focus back on the table."""
+        self._flush_search()
         if self.table:
             self.table.focus()
             # If search is active, we keep the filter but just change focus
@@ -1715,7 +1926,7 @@ class HostSelector(App):
             filter_suffix = " | filter:favorites"
         elif self.filter_mode == "recent":
             filter_suffix = " | filter:recent"
-        selected_count = len(self.selected_hosts)
+        selected_count = self.selected_count
         total_hosts = (
             len(self.filtered_hosts) if self.search_filter else len(self.hosts)
         )
@@ -1738,46 +1949,122 @@ class HostSelector(App):
         self.action_connect_selected()
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Handle search input changes."""
+        """Handle search input changes.
+
+        Filtering is debounced so a burst of keystrokes re-filters the table
+        once. Clearing the search applies immediately.
+        """
         if event.input == self.search_input:
-            self.search_filter = event.value.lower().strip()
+            if self._search_timer is not None:
+                self._search_timer.stop()
+                self._search_timer = None
+
+            term = event.value.lower().strip()
+            if not term:
+                self._apply_search(term)
+                return
+            self._search_timer = self.set_timer(
+                _SEARCH_DEBOUNCE, partial(self._apply_search, term)
+            )
+
+    def _apply_search(self, term: str) -> None:
+        """Set the search filter and re-filter the table."""
+        self._search_timer = None
+        self.search_filter = term
 
-            # If search is cleared, hide the search container
-            if not self.search_filter:
-                search_container = self.query_one("#search-container")
-                search_container.styles.display = "none"
-                self.log_message("Search cleared")
+        # If search is cleared, hide the search container
+        if not self.search_filter:
+            search_container = self.query_one("#search-container")
+            search_container.styles.display = "none"
+            self.log_message("Search cleared")
 
-            self.filter_hosts()
+        self.filter_hosts()
+
+    def _flush_search(self) -> None:
+        """Apply a pending debounced search right away."""
+        if self._search_timer is not None and self.search_input is not None:
+            self._search_timer.stop()
+            self._apply_search(self.search_input.value.lower().strip())
+
+    def _invalidate_host_values(self) -> None:
+        """Drop cached display values and search corpus so they are rebuilt.
+
+        Called whenever what the table shows changes: hosts reloaded, columns
+        reconfigured, favorites toggled or health results updated.
+        """
+        self._host_values = None
+        self._host_values_lower = None
+        self._favorite_keys = None
+        self._search_corpus = None
+        self._search_offsets = []
+        self._table_keys = None
+
+    def _search_index(self) -> tuple[bytes, List[int]]:
+        """Return the search corpus and per-host end offsets.
+
+        Each host contributes one lowercased blob of its column values joined
+        with newlines; blobs are concatenated with NUL separators (neither can
+        be typed in the search input). ``offsets[i]`` is the exclusive end of
+        host ``i``'s blob, so a match position maps back to its host with a
+        single bisect.
+        """
+        if self._search_corpus is None:
+            blobs = [
+                "\n".join(values).encode("utf-8")
+                for values in self._all_host_values_lower()
+            ]
+            offsets: List[int] = []
+            end = -1
+            for blob in blobs:
+                end += len(blob) + 1
+                offsets.append(end)
+            self._search_corpus = b"\x00".join(blobs)
+            self._search_offsets = offsets
+        return self._search_corpus, self._search_offsets
+
+    def _match_host_indices(self, needle: bytes) -> List[int]:
+        """Return indices into ``self.hosts`` whose search blob contains needle."""
+        corpus, offsets = self._search_index()
+        matches: List[int] = []
+        position = corpus.find(needle)
+        while position >= 0:
+            index = bisect_right(offsets, position)
+            matches.append(index)
+            # Skip the rest of this host's blob; one hit is enough
+            position = corpus.find(needle, offsets[index] + 1)
+        return matches
 
     def filter_hosts(self) -> None:
         """Filter hosts based on search term with explicit wildcard support."""
-        import fnmatch
-
         term = (self.search_filter or "").strip()
 
-        # Only add wildcards if user hasn't explicitly added them
-        # This gives users control over exact vs fuzzy matching
-        if term and not term.startswith("*") and not term.endswith("*"):
-            # Implicit fuzzy match - match anywhere in the value
-            term = f"*{term}*"
-        elif not term:
+        if not term:
             # Empty search - show all hosts
             self.filtered_hosts = self.hosts
             self.populate_table(self.get_hosts_to_display())
             self.update_status_selection()
             return
 
-        self.filtered_hosts = [
-            host
-            for host in self.hosts
-            if any(
-                fnmatch.fnmatchcase(
-                    self._get_column_value(host, attr).lower(), term.lower()
-                )
-                for attr in self._table_columns()
-            )
-        ]
+        if not any(char in term for char in "*?["):
+            # Plain text is an implicit fuzzy match anywhere in the value
+            needle = term.lower().encode("utf-8")
+            self.filtered_hosts = [
+                self.hosts[index] for index in self._match_host_indices(needle)
+            ]
+        else:
+            # Only add wildcards if user hasn't explicitly added them
+            # This gives users control over exact vs fuzzy matching
+            if not term.startswith("*") and not term.endswith("*"):
+                term = f"*{term}*"
+
+            # Compile the glob once and test pre-lowercased values with it,
+            # rather than going through fnmatchcase per cell
+            match = re.compile(fnmatch.translate(term.lower())).match
+            self.filtered_hosts = [
+                host
+                for host, values in zip(self.hosts, self._all_host_values_lower())
+                if any(map(match, values))
+            ]
 
         # Re-populate table with filtered results
         self.populate_table(self.get_hosts_to_display())
@@ -1787,20 +2074,16 @@ class HostSelector(App):
 
     def on_key(self, event: Any) -> None:
         """Handle key presses - specifically check for Enter on DataTable."""
+        # Every key passes through here; bail out before the palette lookup
+        if event.key != "enter" or not self.table or not self.table.has_focus:
+            return
         if self._is_command_palette_open():
             return
 
-        # Check if Enter was pressed while DataTable has focus
-        if (
-            event.key == "enter"
-            and hasattr(self, "table")
-            and self.table
-            and self.table.has_focus
-        ):
-            self.action_connect_selected()
-            event.prevent_default()
-            event.stop()
-            return
+        # Enter was pressed while DataTable has focus
+        self.action_connect_selected()
+        event.prevent_default()
+        event.stop()
 
     def _is_command_palette_open(self) -> bool:
         """Return True when Textual command palette modal is active."""
@@ -1812,6 +2095,7 @@ class HostSelector(App):
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle Enter key pressed in search input."""
         if event.input == self.search_input and self.table:
+            self._flush_search()
             # Focus back on the table when Enter is pressed in search
             self.table.focus()
             if self.search_filter:
@@ -3,46 +3,78 @@
 import asyncio
 import contextlib
 import io
+import os
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Any, List, Optional
 
-import libtmux
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container
 from textual.screen import ModalScreen
 from textual.widgets import DataTable, Static
 
-from ..logger import get_logger
-
-
+from ..logger import flush_logging, get_logger
+from ..utils.tmux import find_tmux
+
+# tmux format strings for batched session listing. Free-form fields go last
+# so they can be split off with maxsplit even if they contain tabs.
+_SESSION_FORMAT = "\t".join(
+    (
+        "#{session_id}",
+        "#{session_created}",
+        "#{session_windows}",
+        "#{session_attached}",
+        "#{session_name}",
+    )
+)
+_PANE_FORMAT = "\t".join(
+    ("#{session_id}", "#{pane_synchronized}", "#{pane_current_command}")
+)
+
+# Formatted session creation times keyed by unix timestamp; sessions keep
+# their timestamp across refreshes, so each one is formatted only once.
+_CREATED_CACHE: dict[int, str] = {}
+_CREATED_CACHE_LIMIT = 4096
+
+# Column keys for the tmux session table, in display order
+_SESSION_COLUMNS = (
+    ("broadcast", "Broadcast", 9),
+    ("name", "Session Name", 26),
+    ("age", "Age", 9),
+    ("clients", "Clients", 8),
+    ("active_cmd", "Active Cmd", 18),
+    ("created", "Created", 16),
+    ("windows", "Windows", 7),
+    ("panes", "Panes", 6),
+)
+
+# Minimum seconds between manual refreshes (holding R would otherwise
+# queue a tmux round-trip per key repeat)
+_REFRESH_DEBOUNCE = 0.25
+
+# Broadcast cell text indexed by TmuxSession.broadcast
+_BROADCAST_CELL = ("OFF", "ON")
+
+
+@dataclass(slots=True)
 class TmuxSession:
     """Simple tmux session data structure."""
 
-    def __init__(
-        self,
-        name: str,
-        session_id: str,
-        created: str,
-        age: str,
-        windows: int,
-        panes: int,
-        clients: int,
-        active_cmd: str,
-        broadcast: bool = False,
-    ):
-        self.name = name
-        self.session_id = session_id
-        self.created = created
-        self.age = age
-        self.windows = windows
-        self.panes = panes
-        self.clients = clients
-        self.active_cmd = active_cmd
-        self.broadcast = broadcast
+    name: str
+    session_id: str
+    created: str
+    age: str
+    windows: int
+    panes: int
+    clients: int
+    active_cmd: str
+    broadcast: bool = False
 
     def __str__(self) -> str:
-        status = "ON" if self.broadcast else "OFF"
-        return f"{self.name} ({self.windows} windows, broadcast {status})"
+        return f"{self.name} ({self.windows} windows, broadcast {_BROADCAST_CELL[self.broadcast]})"
 
 
 class ITerm2ManagedTab:
@@ -419,6 +451,20 @@ class TmuxSessionManager(ModalScreen):
         self.tmux_server: Optional[Any] = None
         self.broadcast_enabled = False  # Track broadcast state
         self.config = config
+        # Rows currently rendered in the table, keyed by session name
+        self._rows_by_key: dict[str, tuple[str, ...]] = {}
+        self._last_refresh = 0.0
+
+    @staticmethod
+    def _new_tmux_server() -> Any:
+        """Create a libtmux server handle, importing libtmux on first use.
+
+        libtmux is imported lazily so that opening the host selector doesn't
+        pay for it unless the session manager actually talks to tmux.
+        """
+        import libtmux
+
+        return libtmux.Server()
 
     @staticmethod
     def _split_window(window: Any, vertical: bool = True) -> Any:
@@ -447,17 +493,23 @@ class TmuxSessionManager(ModalScreen):
         if self.tmux_server is None:
             return None
 
+        # default=None makes a miss a plain return instead of raising
+        # ObjectDoesNotExist; TypeError means a QueryList without default=.
         try:
-            return self.tmux_server.sessions.get(session_name=session_name)
-        except Exception:
+            return self.tmux_server.sessions.get(session_name=session_name, default=None)
+        except (AttributeError, TypeError):
             pass
 
-        try:
-            found = self.tmux_server.find_where({"session_name": session_name})
-            if found is not None:
-                return found
-        except Exception:
-            pass
+        find_where = getattr(self.tmux_server, "find_where", None)
+        if callable(find_where):
+            from libtmux.exc import LibTmuxException
+
+            try:
+                found = find_where({"session_name": session_name})
+                if found is not None:
+                    return found
+            except LibTmuxException:
+                pass
 
         for session in list(getattr(self.tmux_server, "sessions", [])):
             if getattr(session, "session_name", "") == session_name:
@@ -478,121 +530,106 @@ class TmuxSessionManager(ModalScreen):
         self.table = self.query_one("#session-table", DataTable)
 
         # Setup table columns
-        self.table.add_column("Broadcast", width=9)
-        self.table.add_column("Session Name", width=26)
-        self.table.add_column("Age", width=9)
-        self.table.add_column("Clients", width=8)
-        self.table.add_column("Active Cmd", width=18)
-        self.table.add_column("Created", width=16)
-        self.table.add_column("Windows", width=7)
-        self.table.add_column("Panes", width=6)
+        for key, label, width in _SESSION_COLUMNS:
+            self.table.add_column(label, width=width, key=key)
 
         # Load sessions in background to keep UI responsive
-        self.run_worker(self.load_sessions(), name="tmux_load_sessions")
+        self._reload_sessions("tmux_load_sessions")
 
         # Focus on the table after loading data
         self.table.focus()
 
         # Cursor is moved after async load completes
 
-    def _load_sessions_blocking(self) -> tuple[list[TmuxSession], str | None]:
-        """Collect tmux sessions using blocking libtmux calls."""
-        try:
-            tmux_server = libtmux.Server()
-            tmux_sessions = list(getattr(tmux_server, "sessions", []))
-            sessions: list[TmuxSession] = []
-
-            for session in tmux_sessions:
-                # Get window count safely
-                try:
-                    window_count = len(session.windows) if hasattr(session, 'windows') else 0
-                except (AttributeError, RuntimeError):
-                    window_count = 0
+    @staticmethod
+    def _format_created(timestamp: int) -> tuple[str, str]:
+        """Return (created, age) display strings for a unix timestamp."""
+        created = _CREATED_CACHE.get(timestamp)
+        if created is None:
+            created = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+            _CREATED_CACHE[timestamp] = created
+        age_delta = max(time.time() - timestamp, 0)
+        if age_delta < 60:
+            age = f"{int(age_delta)}s"
+        elif age_delta < 3600:
+            age = f"{int(age_delta // 60)}m"
+        elif age_delta < 86400:
+            age = f"{int(age_delta // 3600)}h"
+        else:
+            age = f"{int(age_delta // 86400)}d"
+        return created, age
 
-                # Get pane count safely
-                try:
-                    pane_count = sum(len(w.panes) for w in session.windows)
-                except (AttributeError, RuntimeError, TypeError):
-                    pane_count = 0
+    @staticmethod
+    def _tmux_lines(tmux_server: Any, *args: str) -> list[str]:
+        """Run a tmux command and return stdout lines, raising on real errors."""
+        result = tmux_server.cmd(*args)
+        stdout = list(getattr(result, "stdout", []) or [])
+        stderr = "\n".join(getattr(result, "stderr", []) or []).strip()
+        if stderr and not stdout:
+            # No running server simply means there are no sessions yet
+            if "no server running" in stderr or "error connecting" in stderr:
+                return []
+            raise RuntimeError(stderr)
+        return stdout
 
-                # Read synchronize-panes state across session windows
-                try:
-                    broadcast_on = any(
-                        bool(window.show_options().get("synchronize-panes"))
-                        for window in session.windows
-                    )
-                except Exception:
-                    broadcast_on = False
+    def _load_sessions_blocking(self) -> tuple[list[TmuxSession], str | None]:
+        """Collect tmux sessions with two batched tmux format queries.
 
-                # Get attached client count
-                try:
-                    attached_result = session.cmd('display-message', '-p', '#{session_attached}')
-                    if attached_result and getattr(attached_result, 'stdout', None):
-                        clients = int(attached_result.stdout[0])
-                    else:
-                        clients = 0
-                except Exception:
-                    clients = 0
+        One ``list-sessions`` call returns per-session fields and one
+        ``list-panes -a`` call returns every pane, instead of several tmux
+        round-trips per session and window.
+        """
+        try:
+            tmux_server = self._new_tmux_server()
+            session_lines = self._tmux_lines(
+                tmux_server, "list-sessions", "-F", _SESSION_FORMAT
+            )
+            pane_lines = (
+                self._tmux_lines(tmux_server, "list-panes", "-a", "-F", _PANE_FORMAT)
+                if session_lines
+                else []
+            )
 
-                # Get creation time - libtmux doesn't provide session.created directly
+            # Summarize panes per session: count, broadcast state, commands
+            pane_rows = [
+                parts for parts in (line.split("\t", 2) for line in pane_lines) if len(parts) == 3
+            ]
+            pane_counts = Counter(session_id for session_id, _, _ in pane_rows)
+            synchronized = {session_id for session_id, sync, _ in pane_rows if sync == "1"}
+            cmd_counts: defaultdict[str, Counter[str]] = defaultdict(Counter)
+            for (session_id, pane_cmd), count in Counter(
+                (session_id, pane_cmd or "?") for session_id, _, pane_cmd in pane_rows
+            ).items():
+                cmd_counts[session_id][pane_cmd] = count
+
+            session_rows = [
+                parts for parts in (line.split("\t", 4) for line in session_lines) if len(parts) == 5
+            ]
+            sessions: list[TmuxSession] = []
+            for session_id, created_ts, windows, attached, name in session_rows:
                 try:
-                    # Try to get session creation time from tmux itself
-                    result = session.cmd('display-message', '-p', '#{session_created}')
-                    if result and hasattr(result, 'stdout') and result.stdout:
-                        import datetime
-
-                        timestamp = int(result.stdout[0])
-                        created_dt = datetime.datetime.fromtimestamp(timestamp)
-                        created = created_dt.strftime("%Y-%m-%d %H:%M:%S")
-                        now_dt = datetime.datetime.now()
-                        age_delta = max((now_dt - created_dt).total_seconds(), 0)
-                        if age_delta < 60:
-                            age = f"{int(age_delta)}s"
-                        elif age_delta < 3600:
-                            age = f"{int(age_delta // 60)}m"
-                        elif age_delta < 86400:
-                            age = f"{int(age_delta // 3600)}h"
-                        else:
-                            age = f"{int(age_delta // 86400)}d"
-                    else:
-                        created = "Unknown"
-                        age = "-"
-                except (ValueError, AttributeError, IndexError, OSError):
+                    created, age = self._format_created(int(created_ts))
+                except (ValueError, OverflowError, OSError):
                     created = "Unknown"
                     age = "-"
 
-                # Summarize active pane commands in this session
-                cmd_counts: dict[str, int] = {}
-                try:
-                    for window in session.windows:
-                        for pane in window.panes:
-                            try:
-                                pane_cmd = str(getattr(pane, 'pane_current_command', '') or '')
-                            except Exception:
-                                pane_cmd = ''
-                            if not pane_cmd:
-                                pane_cmd = '?'
-                            cmd_counts[pane_cmd] = cmd_counts.get(pane_cmd, 0) + 1
-                except Exception:
-                    pass
-
-                if cmd_counts:
-                    top = sorted(cmd_counts.items(), key=lambda x: x[1], reverse=True)[:2]
-                    active_cmd = ", ".join(f"{name}({count})" for name, count in top)
+                counts = cmd_counts.get(session_id)
+                if counts:
+                    active_cmd = ", ".join(f"{cmd}({count})" for cmd, count in counts.most_common(2))
                 else:
                     active_cmd = "-"
 
                 sessions.append(
                     TmuxSession(
-                        name=session.session_name or "Unknown",
-                        session_id=session.session_id or "Unknown",
+                        name=name or "Unknown",
+                        session_id=session_id or "Unknown",
                         created=created,
                         age=age,
-                        windows=window_count,
-                        panes=pane_count,
-                        clients=clients,
+                        windows=int(windows) if windows.isdigit() else 0,
+                        panes=pane_counts.get(session_id, 0),
+                        clients=int(attached) if attached.isdigit() else 0,
                         active_cmd=active_cmd,
-                        broadcast=broadcast_on,
+                        broadcast=session_id in synchronized,
                     )
                 )
 
@@ -601,6 +638,14 @@ class TmuxSessionManager(ModalScreen):
         except Exception as e:
             return [], str(e)
 
+    def _reload_sessions(self, name: str) -> None:
+        """Start a session load, cancelling any load still in flight.
+
+        Loads share one exclusive worker group so quick successive refreshes
+        don't pile up tmux queries or let a stale result overwrite a newer one.
+        """
+        self.run_worker(self.load_sessions(), name=name, group="tmux_load_sessions", exclusive=True)
+
     async def load_sessions(self) -> None:
         """Load tmux sessions from the server without blocking the UI thread."""
         sessions, error = await asyncio.to_thread(self._load_sessions_blocking)
@@ -610,6 +655,7 @@ class TmuxSessionManager(ModalScreen):
             self.logger.error(f"SSHplex: Failed to load tmux sessions: {error}")
             if self.table is not None:
                 self.table.clear()
+                self._rows_by_key = {}
                 self.table.add_row("-", "tmux error", "-", "-", "-", error, "0", "0")
             return
 
@@ -619,31 +665,59 @@ class TmuxSessionManager(ModalScreen):
 
         self.logger.info(f"SSHplex: Loaded {len(self.sessions)} tmux sessions")
 
+    @staticmethod
+    def _session_row(session: TmuxSession) -> tuple[str, ...]:
+        """Return display cells for a session in column order."""
+        return (
+            _BROADCAST_CELL[session.broadcast],
+            session.name,
+            session.age,
+            str(session.clients),
+            session.active_cmd,
+            session.created,
+            str(session.windows),
+            str(session.panes),
+        )
+
     def populate_table(self) -> None:
-        """Populate the table with session data."""
+        """Populate the table with session data.
+
+        Only rows that changed since the last refresh are touched. The table
+        is rebuilt from scratch when rows would otherwise end up in a
+        different order than ``self.sessions``, since cursor rows index into
+        that list.
+        """
         if not self.table:
             return
 
-        # Clear existing data
-        self.table.clear()
-
         if not self.sessions:
+            self.table.clear()
+            self._rows_by_key = {}
             self.table.add_row("-", "No tmux sessions found", "-", "-", "-", "Create one with SSHplex", "0", "0")
             return
 
-        # Add sessions to table
-        for session in self.sessions:
-            self.table.add_row(
-                "ON" if session.broadcast else "OFF",
-                session.name,
-                session.age,
-                str(session.clients),
-                session.active_cmd,
-                session.created,
-                str(session.windows),
-                str(session.panes),
-                key=session.name
-            )
+        rows = {session.name: self._session_row(session) for session in self.sessions}
+        previous = self._rows_by_key
+        diff_order = [key for key in previous if key in rows]
+        diff_order.extend(key for key in rows if key not in previous)
+
+        if not previous or diff_order != list(rows):
+            self.table.clear()
+            for key, row in rows.items():
+                self.table.add_row(*row, key=key)
+        else:
+            for key in previous.keys() - rows.keys():
+                self.table.remove_row(key)
+            for key, row in rows.items():
+                old_row = previous.get(key)
+                if old_row is None:
+                    self.table.add_row(*row, key=key)
+                    continue
+                for (column, _, _), old_value, value in zip(_SESSION_COLUMNS, old_row, row):
+                    if old_value != value:
+                        self.table.update_cell(key, column, value)
+
+        self._rows_by_key = rows
 
     def action_move_up(self) -> None:
         """Move cursor up in the table."""
@@ -659,6 +733,16 @@ class TmuxSessionManager(ModalScreen):
             if current_row < len(self.sessions) - 1:
                 self.table.move_cursor(row=current_row + 1)
 
+    @staticmethod
+    def _exec_tmux_attach(session_name: str) -> None:
+        """Replace the current process with ``tmux attach-session``."""
+        tmux_bin = find_tmux()
+        flush_logging()
+        if tmux_bin:
+            os.execv(tmux_bin, [tmux_bin, "attach-session", "-t", session_name])
+        else:
+            os.execlp("tmux", "tmux", "attach-session", "-t", session_name)
+
     def action_connect_session(self) -> None:
         """Connect to the selected tmux session."""
         if not self.table or not self.sessions:
@@ -678,10 +762,6 @@ class TmuxSessionManager(ModalScreen):
                 # Close the modal first
                 self.dismiss()
 
-                # Small delay to ensure modal is closed
-                import time
-                time.sleep(0.1)
-
                 import platform
                 system = platform.system().lower()
                 try:
@@ -707,13 +787,11 @@ class TmuxSessionManager(ModalScreen):
 
                         if not success:
                             # Fallback to standard tmux attach
-                            import os
                             self.logger.info("Falling back to standard tmux attach")
-                            os.execlp("tmux", "tmux", "attach-session", "-t", session.name)
+                            self._exec_tmux_attach(session.name)
                     else:
                         # Auto-attach to the session by replacing current process
-                        import os
-                        os.execlp("tmux", "tmux", "attach-session", "-t", session.name)
+                        self._exec_tmux_attach(session.name)
 
                 except Exception as e:
                     self.logger.info(f"⚠️ Failed to attach to tmux session: {e}")
@@ -747,19 +825,19 @@ class TmuxSessionManager(ModalScreen):
         try:
             self.logger.info(f"SSHplex: Attempting to kill tmux session '{session.name}'")
 
-            self.tmux_server = libtmux.Server()
+            self.tmux_server = self._new_tmux_server()
             result = self.tmux_server.cmd("kill-session", "-t", session.name)
             stderr = "\n".join(getattr(result, "stderr", []) or [])
             if stderr.strip():
                 self.logger.warning(f"SSHplex: kill-session stderr for '{session.name}': {stderr}")
 
             # Verify and fallback
-            if self._find_tmux_session(session.name) is not None:
+            tmux_session = self._find_tmux_session(session.name)
+            if tmux_session is not None:
+                tmux_session.kill_session()
                 tmux_session = self._find_tmux_session(session.name)
-                if tmux_session:
-                    tmux_session.kill_session()
 
-            if self._find_tmux_session(session.name) is None:
+            if tmux_session is None:
                 self.logger.info(f"SSHplex: Successfully killed tmux session '{session.name}'")
             else:
                 self.logger.error(f"SSHplex: Session '{session.name}' still exists after kill attempt")
@@ -767,7 +845,7 @@ class TmuxSessionManager(ModalScreen):
         except Exception as e:
             self.logger.error(f"SSHplex: Failed to kill session: {e}")
         finally:
-            self.run_worker(self.load_sessions(), name="tmux_reload_after_kill")
+            self._reload_sessions("tmux_reload_after_kill")
 
     def on_key(self, event: Any) -> None:
         """Ensure key shortcuts work while table has focus."""
@@ -786,9 +864,16 @@ class TmuxSessionManager(ModalScreen):
             event.prevent_default()
 
     def action_refresh_sessions(self) -> None:
-        """Refresh the session list."""
+        """Refresh the session list, ignoring key-repeat within the debounce window."""
+        now = time.monotonic()
+        if now - self._last_refresh < _REFRESH_DEBOUNCE:
+            return
+        self._last_refresh = now
+
         self.logger.info("SSHplex: Refreshing tmux sessions")
-        self.run_worker(self.load_sessions(), name="tmux_refresh_sessions")
+        if len(_CREATED_CACHE) > _CREATED_CACHE_LIMIT:
+            _CREATED_CACHE.clear()
+        self._reload_sessions("tmux_refresh_sessions")
 
     def action_close_manager(self) -> None:
         """Close the session manager."""
@@ -806,7 +891,7 @@ class TmuxSessionManager(ModalScreen):
 
             try:
                 # Find the tmux session
-                self.tmux_server = libtmux.Server()
+                self.tmux_server = self._new_tmux_server()
                 tmux_session = self._find_tmux_session(session.name)
                 if not tmux_session:
                     self.logger.error(f"SSHplex: Session '{session.name}' not found")
@@ -840,7 +925,7 @@ class TmuxSessionManager(ModalScreen):
                     status_widget.update("📡 Broadcast: OFF")
 
                 # Refresh table to update per-session broadcast column
-                self.run_worker(self.load_sessions(), name="tmux_reload_after_broadcast")
+                self._reload_sessions("tmux_reload_after_broadcast")
 
             except Exception as e:
                 self.logger.error(f"SSHplex: Failed to toggle broadcast for session '{session.name}': {e}")
@@ -859,7 +944,7 @@ class TmuxSessionManager(ModalScreen):
 
             try:
                 # Find the tmux session
-                self.tmux_server = libtmux.Server()
+                self.tmux_server = self._new_tmux_server()
                 tmux_session = self._find_tmux_session(session.name)
                 if not tmux_session:
                     self.logger.error(f"SSHplex: Session '{session.name}' not found")
@@ -882,7 +967,7 @@ class TmuxSessionManager(ModalScreen):
                         self.logger.info(f"SSHplex: Created new pane in session '{session.name}'")
 
                         # Refresh session list to update window/pane count
-                        self.run_worker(self.load_sessions(), name="tmux_reload_after_create_pane")
+                        self._reload_sessions("tmux_reload_after_create_pane")
                     else:
                         self.logger.error(f"SSHplex: Failed to create pane in session '{session.name}'")
                 else:
@@ -905,7 +990,7 @@ class TmuxSessionManager(ModalScreen):
 
             try:
                 # Find the tmux session
-                self.tmux_server = libtmux.Server()
+                self.tmux_server = self._new_tmux_server()
                 tmux_session = self._find_tmux_session(session.name)
                 if not tmux_session:
                     self.logger.error(f"SSHplex: Session '{session.name}' not found")
@@ -927,7 +1012,7 @@ class TmuxSessionManager(ModalScreen):
                     self.logger.info(f"SSHplex: Created new window in session '{session.name}'")
 
                     # Refresh session list to update window count
-                    self.run_worker(self.load_sessions(), name="tmux_reload_after_create_window")
+                    self._reload_sessions("tmux_reload_after_create_window")
                 else:
                     self.logger.error(f"SSHplex: Failed to create window in session '{session.name}'")
 
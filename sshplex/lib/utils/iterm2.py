@@ -15,6 +15,10 @@ MACOS_PLATFORM = "darwin"
 ITERM2_APP_NAME = "iTerm2"
 TMUX_CONTROL_MODE_FLAG = "-CC"
 
+# Set once osascript has confirmed iTerm2 is installed; a negative answer is
+# re-checked because the app may be installed while SSHplex runs
+_iterm2_installed = False
+
 
 class ITerm2Error(Exception):
     """Raised when iTerm2 operations fail."""
@@ -33,11 +37,18 @@ def is_macos() -> bool:
 def check_iterm2_installed() -> bool:
     """Check if iTerm2 is installed on the system.
 
+    A positive answer is remembered for the rest of the process, so repeated
+    attaches don't fork osascript for it again.
+
     Returns:
         True if iTerm2 is installed, False otherwise
     """
+    global _iterm2_installed
+
     if not is_macos():
         return False
+    if _iterm2_installed:
+        return True
 
     try:
         result = subprocess.run(
@@ -46,7 +57,8 @@ def check_iterm2_installed() -> bool:
             text=True,
             timeout=5
         )
-        return result.returncode == 0 and "true" in result.stdout.lower()
+        _iterm2_installed = result.returncode == 0 and "true" in result.stdout.lower()
+        return _iterm2_installed
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return False
 
@@ -0,0 +1,12 @@
+"""Helpers for locating the tmux binary."""
+
+from __future__ import annotations
+
+import functools
+import shutil
+
+
+@functools.lru_cache(maxsize=1)
+def find_tmux() -> str | None:
+    """Return the absolute tmux path, resolved from PATH once per process."""
+    return shutil.which("tmux")
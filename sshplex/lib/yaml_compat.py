@@ -0,0 +1,67 @@
+"""YAML loader and dumper selection for SSHplex."""
+
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+import yaml
+
+# libyaml's C parser/emitter when PyYAML was built with it, else the
+# pure-Python safe ones
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeDumper as YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
+__all__ = ["YamlDumper", "YamlLoader", "load_yaml_file"]
+
+# Most files whose parse is kept in memory; the least recently used goes first
+_MAX_PARSED_FILES = 32
+
+# Parsed data per resolved path, with the (mtime_ns, size) it was read at;
+# kept pickled because unpickling a fresh copy is several times faster than deepcopy
+_PARSED_FILES: "OrderedDict[str, Tuple[Tuple[int, int], bytes]]" = OrderedDict()
+_PARSED_FILES_LOCK = threading.Lock()
+
+
+def _parse_yaml_file(path: Path, signature: Tuple[int, int]) -> Any:
+    """Parse a YAML file with the fastest available safe loader."""
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
+def load_yaml_file(path: Path, parse: Optional[Callable[[Path, Tuple[int, int]], Any]] = None) -> Any:
+    """Parse a YAML file, reusing the previous parse while the file is unchanged.
+
+    A file counts as unchanged while its mtime and size are; an edited file
+    replaces its own entry rather than adding one.
+
+    Args:
+        path: YAML file to read
+        parse: Called with the path and its (mtime_ns, size) when the file
+            has to be read; defaults to parsing it with ``YamlLoader``
+
+    Returns:
+        A copy of the parsed data that the caller is free to modify
+    """
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    memo_key = str(path.resolve())
+    with _PARSED_FILES_LOCK:
+        memo = _PARSED_FILES.get(memo_key)
+        if memo is not None and memo[0] == signature:
+            _PARSED_FILES.move_to_end(memo_key)
+            return pickle.loads(memo[1])
+
+    data = (parse or _parse_yaml_file)(path, signature)
+    pickled = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+    with _PARSED_FILES_LOCK:
+        _PARSED_FILES[memo_key] = (signature, pickled)
+        _PARSED_FILES.move_to_end(memo_key)
+        while len(_PARSED_FILES) > _MAX_PARSED_FILES:
+            _PARSED_FILES.popitem(last=False)
+    return data
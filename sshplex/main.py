@@ -2,17 +2,13 @@
 """Main entry point for SSHplex TUI Application (pip-installed package)"""
 
 import argparse
-import shutil
 import sys
-from datetime import datetime
 from typing import Any, Optional
 
 from . import __version__
-from .lib.commands import clear_cache, run_debug_mode, show_config_info
-from .lib.config import load_config
-from .lib.logger import get_logger, setup_logging
-from .lib.onboarding import OnboardingWizard
-from .lib.ui.host_selector import HostSelector
+
+# Config, logging, providers and the Textual UI are imported where they are
+# used, so `--version` and `--help` exit without loading them.
 
 
 def check_system_dependencies(config: Any) -> bool:
@@ -21,8 +17,10 @@ def check_system_dependencies(config: Any) -> bool:
     if backend == "iterm2-native":
         return True
 
+    from .lib.utils.tmux import find_tmux
+
     # Check if tmux is installed and available in PATH
-    if not shutil.which("tmux"):
+    if not find_tmux():
         print("❌ Error: tmux is not installed or not found in PATH")
         print("\nSSHplex requires tmux for terminal multiplexing.")
         print("Please install tmux:")
@@ -39,6 +37,9 @@ def run_onboarding(config_path: Optional[str] = None) -> int:
     """Run the interactive onboarding wizard."""
     try:
         from pathlib import Path
+
+        from .lib.onboarding import OnboardingWizard
+
         path = Path(config_path) if config_path else None
         wizard = OnboardingWizard(config_path=path)
         success = wizard.run()
@@ -74,8 +75,11 @@ Examples:
         parser.add_argument('--clear-cache', action='store_true', help='Clear the host cache before starting')
         parser.add_argument('--show-config', action='store_true', help='Show configuration paths and exit')
         parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose output')
+        parser.add_argument('--config-cache', action='store_true', help='Reuse the parsed configuration cached under ~/.cache/sshplex')
         args = parser.parse_args()
 
+        from .lib.commands import clear_cache, run_debug_mode, show_config_info
+
         # Handle show-config without loading config
         if args.show_config:
             return show_config_info()
@@ -84,9 +88,12 @@ Examples:
         if args.onboarding:
             return run_onboarding(args.config)
 
+        from .lib.config import load_config
+        from .lib.logger import get_logger, setup_logging
+
         # Load configuration (will use default path if none specified)
         print("SSHplex - Loading configuration...")
-        config = load_config(args.config)
+        config = load_config(args.config, use_cache=args.config_cache)
 
         # Check system dependencies (skip for debug/cache operations)
         if not args.debug and not args.clear_cache and not check_system_dependencies(config):
@@ -143,6 +150,8 @@ def tui_mode(config: Any, logger: Any, config_path: Optional[str] = None) -> int
     logger.info("Starting TUI mode - interactive host selection")
 
     try:
+        from .lib.ui.host_selector import HostSelector
+
         # Start the host selector TUI
         app = HostSelector(config=config, config_path=config_path or "")
         selected_hosts = app.run()
@@ -163,10 +172,10 @@ def tui_mode(config: Any, logger: Any, config_path: Optional[str] = None) -> int
         mode_display = "panes" if use_panes else "windows"
 
         # Create connector and establish connections
+        from .lib.multiplexer.base import default_session_name
         from .sshplex_connector import SSHplexConnector
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        session_name = f"sshplex-{timestamp}"
+        session_name = default_session_name()
         connector = SSHplexConnector(session_name, config=config)
 
         if connector.connect_to_hosts(
@@ -1,17 +1,43 @@
 """SSHplex Connector - SSH connections and multiplexer session management."""
 
+import heapq
 import platform
 import re
 import shlex
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from .lib.logger import get_logger
+from .lib.multiplexer.base import default_session_name
 from .lib.sot.base import Host
 from .lib.utils.ssh_config import resolve_ssh_effective_config
 
+# SSH commands are built concurrently (aliases shell out to `ssh -G`)
+_MAX_COMMAND_WORKERS = 16
+
+# Environment set in front of every SSH command typed into a pane
+_SSH_ENV_PREFIX = "TERM=xterm-256color"
+
+# Characters allowed in connection targets and user names, checked for
+# every host before anything is typed into a shell
+_HOSTNAME_RE = re.compile(r'^[a-zA-Z0-9.-]+$')
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9._-]+$')
+
+
+class _RedactedCommand:
+    """SSH command that is only redacted if a log message formats it."""
+
+    __slots__ = ("command",)
+
+    def __init__(self, command: str) -> None:
+        self.command = command
+
+    def __str__(self) -> str:
+        return SSHplexConnector._sanitize_ssh_command(self.command)
+
 
 class SSHplexConnector:
     """Manages SSH connections and multiplexer session management.
@@ -30,8 +56,7 @@ class SSHplexConnector:
             config: SSHplex configuration object
         """
         if session_name is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            session_name = f"sshplex-{timestamp}"
+            session_name = default_session_name()
 
         self.session_name = session_name
         self.config = config
@@ -102,11 +127,25 @@ class SSHplexConnector:
             self.logger.warning("SSHplex: No hosts provided for connection")
             return False
 
+        # Open one terminal per host even if the same entry was passed twice.
+        # Keyed like SoTFactory's dedup: hosts behind different proxies may
+        # share an IP, so the IP alone doesn't identify a host.
+        seen: Set[Tuple[str, str]] = set()
+        unique_hosts = []
+        for host in hosts:
+            host_key = (host.name, host.ip)
+            if host_key not in seen:
+                seen.add(host_key)
+                unique_hosts.append(host)
+        if len(unique_hosts) < len(hosts):
+            self.logger.info(f"SSHplex: Skipping {len(hosts) - len(unique_hosts)} duplicate host(s)")
+            hosts = unique_hosts
+
         if not username or not username.strip():
             raise ValueError("SSH username cannot be empty")
         
         # Validate username format to prevent injection
-        if not re.match(r'^[a-zA-Z0-9._-]+$', username):
+        if not _USERNAME_RE.match(username):
             raise ValueError(f"Invalid username format: {username}")
 
         if port < 1 or port > 65535:
@@ -132,96 +171,85 @@ class SSHplexConnector:
                 return False
 
             success_count = 0
-            failed_hosts = []
 
-            for _i, host in enumerate(hosts):
+            # Resolve each host's target and pane id once, while validating
+            valid_hosts = []
+            host_targets: List[Tuple[str, str]] = []
+            for host in hosts:
                 target_host = host.ip if host.ip else host.name
-                pane_id = host.name if host.name else target_host
 
                 # Validate connection target format to prevent injection
-                if not re.match(r'^[a-zA-Z0-9.-]+$', target_host):
+                if not _HOSTNAME_RE.match(target_host):
                     self.logger.warning(f"Invalid hostname format (potential injection): {target_host}")
                     self.logger.warning("Skipping potentially malicious host")
                     continue
+                valid_hosts.append(host)
+                host_targets.append((target_host, host.name if host.name else target_host))
+
+            # Build SSH commands up front. Hosts with an ssh_alias resolve it
+            # through an `ssh -G` subprocess, so build them in parallel; panes
+            # themselves are still created one at a time, in host order.
+            ssh_commands = self._build_ssh_commands(valid_hosts, username, key_path, port)
+
+            # Failed attempts are re-queued at their retry time instead of
+            # sleeping in place, so one slow host doesn't hold up the rest:
+            # (ready_at, host order, next attempt, target, pane id, command)
+            retry_queue: List[Tuple[float, int, int, str, str, str]] = []
+            failures: Dict[int, str] = {}
+
+            create_terminal, created_label, create_error = self._terminal_opener(use_panes)
+
+            def attempt_connection(order: int, attempt: int, target_host: str, pane_id: str, ssh_command: str) -> None:
+                nonlocal success_count
+                try:
+                    if create_terminal(pane_id, ssh_command):
+                        self.logger.info("SSHplex: Successfully created {} for {}", created_label, target_host)
+                        success_count += 1
+                        return
+                    last_error = create_error
+                except Exception as e:
+                    last_error = str(e)
+                    self.logger.warning(f"SSHplex: Connection attempt {attempt}/{max_attempts} failed for {target_host}: {e}")
+
+                if attempt < max_attempts:
+                    # Calculate delay with optional exponential backoff
+                    if retry_exponential:
+                        delay = base_delay * (2 ** (attempt - 1))
+                    else:
+                        delay = base_delay
+
+                    self.logger.info(f"SSHplex: Retrying {target_host} in {delay}s (attempt {attempt + 1}/{max_attempts})")
+                    heapq.heappush(
+                        retry_queue,
+                        (time.monotonic() + delay, order, attempt + 1, target_host, pane_id, ssh_command),
+                    )
+                    return
+
+                self.logger.error(f"SSHplex: Failed to create connection for {target_host} after {max_attempts} attempts: {last_error}")
+                failures[order] = target_host
 
-                # Build SSH command
-                ssh_command = self._build_ssh_command(host, username, key_path, port)
+            for order, ((target_host, pane_id), ssh_command) in enumerate(zip(host_targets, ssh_commands)):
+                # Redacting the command is skipped unless debug output is enabled
                 self.logger.debug(
-                    "SSHplex: Built SSH command for "
-                    f"{target_host}: {self._sanitize_ssh_command(ssh_command)}"
+                    "SSHplex: Built SSH command for {}: {}", target_host, _RedactedCommand(ssh_command)
                 )
 
-                self.logger.info(f"SSHplex: Connecting to {target_host} as {username}")
-
-                # Attempt connection with retry logic
-                connection_success = False
-                last_error = None
-                
-                for attempt in range(1, max_attempts + 1):
-                    try:
-                        if self.backend == "iterm2-native":
-                            if use_panes:
-                                max_panes = self.config.tmux.max_panes_per_window if self.config else 5
-                                if self.multiplexer.create_pane(pane_id, ssh_command, max_panes):
-                                    connection_success = True
-                                    self.logger.info(f"SSHplex: Successfully created pane for {target_host}")
-                                else:
-                                    last_error = "Failed to create iTerm2 native pane"
-                            else:
-                                if self.multiplexer.create_window(pane_id, ssh_command):
-                                    connection_success = True
-                                    self.logger.info(f"SSHplex: Successfully created tab for {target_host}")
-                                else:
-                                    last_error = "Failed to create iTerm2 native tab"
-                        else:
-                            if use_panes:
-                                # Create pane with SSH command
-                                max_panes = self.config.tmux.max_panes_per_window if self.config else 5
-                                if self.multiplexer.create_pane(pane_id, ssh_command, max_panes):
-                                    connection_success = True
-                                    self.logger.info(f"SSHplex: Successfully created pane for {target_host}")
-                                else:
-                                    last_error = "Failed to create tmux pane"
-                            else:
-                                # Create window (tab) with SSH command
-                                use_iterm2 = "darwin" in self.system and (self.config.tmux.control_with_iterm2 if self.config else False)
-                                if use_iterm2:
-                                    # iTerm2 mode: use single-pane windows for tmux -CC integration
-                                    if self.multiplexer.create_pane(pane_id, ssh_command, 1):
-                                        connection_success = True
-                                        self.logger.info(f"SSHplex: Successfully created window for {target_host}")
-                                    else:
-                                        last_error = "Failed to create iTerm2 window"
-                                else:
-                                    if self.multiplexer.create_window(pane_id, ssh_command):
-                                        connection_success = True
-                                        self.logger.info(f"SSHplex: Successfully created window for {target_host}")
-                                    else:
-                                        last_error = "Failed to create tmux window"
-                        
-                        if connection_success:
-                            break
-                            
-                    except Exception as e:
-                        last_error = str(e)
-                        self.logger.warning(f"SSHplex: Connection attempt {attempt}/{max_attempts} failed for {target_host}: {e}")
-                    
-                    # If not successful and more attempts remain, wait before retry
-                    if not connection_success and attempt < max_attempts:
-                        # Calculate delay with optional exponential backoff
-                        if retry_exponential:
-                            delay = base_delay * (2 ** (attempt - 1))
-                        else:
-                            delay = base_delay
-                        
-                        self.logger.info(f"SSHplex: Retrying {target_host} in {delay}s (attempt {attempt + 1}/{max_attempts})")
-                        time.sleep(delay)
-
-                if connection_success:
-                    success_count += 1
-                else:
-                    self.logger.error(f"SSHplex: Failed to create connection for {target_host} after {max_attempts} attempts: {last_error}")
-                    failed_hosts.append(target_host)
+                self.logger.info("SSHplex: Connecting to {} as {}", target_host, username)
+                attempt_connection(order, 1, target_host, pane_id, ssh_command)
+
+            # Sleep only until the earliest pending retry is due
+            while retry_queue:
+                ready_at, order, attempt, target_host, pane_id, ssh_command = heapq.heappop(retry_queue)
+                wait = ready_at - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+                attempt_connection(order, attempt, target_host, pane_id, ssh_command)
+
+            failed_hosts = [failures[order] for order in sorted(failures)]
+
+            # Pane commands are typed in the background; finish before the
+            # layout and broadcast changes
+            self.multiplexer.flush_commands()
 
             # Apply tiled layout for multiple panes (only when using panes, not windows)
             if use_panes and success_count > 1:
@@ -252,9 +280,50 @@ class SSHplexConnector:
             self.last_failed_hosts = [h.ip if h.ip else h.name for h in hosts]
             return False
 
+    def _terminal_opener(self, use_panes: bool) -> Tuple[Callable[[str, str], bool], str, str]:
+        """Pick how each host's terminal is created, once per connection run.
+
+        Returns:
+            (create function taking pane id and command, created label, failure message)
+        """
+        max_panes = self.config.tmux.max_panes_per_window if self.config else 5
+        create_pane = self.multiplexer.create_pane
+
+        if self.backend == "iterm2-native":
+            if use_panes:
+                return (lambda pane_id, command: create_pane(pane_id, command, max_panes)), "pane", "Failed to create iTerm2 native pane"
+            return self.multiplexer.create_window, "tab", "Failed to create iTerm2 native tab"
+
+        if use_panes:
+            # Create pane with SSH command
+            return (lambda pane_id, command: create_pane(pane_id, command, max_panes)), "pane", "Failed to create tmux pane"
+
+        # Create window (tab) with SSH command
+        use_iterm2 = "darwin" in self.system and (self.config.tmux.control_with_iterm2 if self.config else False)
+        if use_iterm2:
+            # iTerm2 mode: use single-pane windows for tmux -CC integration
+            return (lambda pane_id, command: create_pane(pane_id, command, 1)), "window", "Failed to create iTerm2 window"
+        return self.multiplexer.create_window, "window", "Failed to create tmux window"
+
+    def _build_ssh_commands(self, hosts: List[Host], username: str, key_path: Optional[str] = None, port: int = 22) -> List[str]:
+        """Build SSH commands for several hosts, preserving order.
+
+        Only hosts with an ``ssh_alias`` block (on ``ssh -G``), so a thread
+        pool is used just when there is one; otherwise this is string building.
+        """
+        if len(hosts) < 2 or not any(host and self._host_ssh_alias(host) for host in hosts):
+            return [self._build_ssh_command(host, username, key_path, port) for host in hosts]
+
+        max_workers = min(len(hosts), _MAX_COMMAND_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='ssh-command-') as executor:
+            return list(executor.map(lambda host: self._build_ssh_command(host, username, key_path, port), hosts))
+
     def _build_ssh_command(self, host: Any, username: str, key_path: Optional[str] = None, port: int = 22) -> str:
         """Build SSH command string with configurable security options.
 
+        The command is typed into the pane's shell, so the argument list is
+        quoted once here, at that boundary.
+
         Args:
             host: Host object with name, ip, and metadata attributes
             username: SSH username
@@ -264,6 +333,27 @@ class SSHplexConnector:
         Returns:
             SSH command string
 
+        Raises:
+            ValueError: If host is missing required attributes
+        """
+        ssh_args = self._build_ssh_args(host, username, key_path, port)
+        # Hosts sharing a proxy and key/port settings have identical options,
+        # so each distinct option set is quoted only once per connector
+        options = tuple(ssh_args[:-1])
+        prefix = self._ssh_command_prefixes.get(options)
+        if prefix is None:
+            # setdefault keeps one entry when pool threads race on a new option set
+            prefix = self._ssh_command_prefixes.setdefault(options, f"{_SSH_ENV_PREFIX} {shlex.join(options)}")
+        return f"{prefix} {shlex.quote(ssh_args[-1])}"
+
+    @staticmethod
+    def _host_ssh_alias(host: Any) -> str:
+        """Return the host's SSH config alias, or an empty string."""
+        return str(getattr(host, "ssh_alias", "") or host.metadata.get("ssh_alias", "")).strip()
+
+    def _build_ssh_args(self, host: Any, username: str, key_path: Optional[str] = None, port: int = 22) -> List[str]:
+        """Build the SSH argument vector for a host, unquoted.
+
         Raises:
             ValueError: If host is missing required attributes
         """
@@ -275,10 +365,9 @@ class SSHplexConnector:
         if not hostname:
             raise ValueError(f"Host missing both ip and name: {host}")
 
-        env_prefix = "TERM=xterm-256color"
         ssh_args = ["/usr/bin/ssh"]
 
-        host_alias = str(getattr(host, "ssh_alias", "") or host.metadata.get("ssh_alias", "")).strip()
+        host_alias = self._host_ssh_alias(host)
         target_override = str(getattr(host, "ssh_hostname", "") or host.metadata.get("ssh_hostname", "")).strip()
         target_resolved = target_override or hostname
         ssh_target = host_alias or target_resolved
@@ -303,51 +392,16 @@ class SSHplexConnector:
             if self.config is not None:
                 provider_name = host.metadata.get('provider', '')
                 if provider_name:
-                    proxy = next(
-                        (item for item in self.config.ssh.proxy if provider_name in item.imports),
-                        None
-                    )
-                    if proxy:
-                        # Sanitize proxy credentials to prevent injection
-                        proxy_host = proxy.host or ''
-                        proxy_user = proxy.username or ''
-                        proxy_key = self._expand_path(proxy.key_path or '')
-                        
-                        # Validate proxy values format
-                        if (re.match(r'^[a-zA-Z0-9.-]+$', proxy_host) and
-                            re.match(r'^[a-zA-Z0-9._-]+$', proxy_user) and
-                            proxy_key):
-                            proxy_command = (
-                                "/usr/bin/ssh "
-                                f"-i {shlex.quote(proxy_key)} "
-                                f"-W %h:%p {shlex.quote(proxy_user)}@{shlex.quote(proxy_host)}"
-                            )
-                            ssh_args.extend(["-o", f"ProxyCommand={proxy_command}"])
-                        else:
-                            self.logger.warning("Proxy configuration contains invalid values, skipping proxy")
+                    proxy_command = self._proxy_commands.get(provider_name)
+                    if proxy_command:
+                        ssh_args.extend(["-o", f"ProxyCommand={proxy_command}"])
+                    elif proxy_command is not None:
+                        self.logger.warning("Proxy configuration contains invalid values, skipping proxy")
         except Exception:
             # Proxy not configured for this host, continue without it
             pass
 
-        # Configure host key checking based on config
-        if self.config is not None:
-            strict_mode = self.config.ssh.strict_host_key_checking
-            if strict_mode:
-                ssh_args.extend(["-o", "StrictHostKeyChecking=yes"])
-            else:
-                # Less strict but still reasonable
-                ssh_args.extend(["-o", "StrictHostKeyChecking=accept-new"])
-
-            # Configure known_hosts file
-            known_hosts = self._expand_path(self.config.ssh.user_known_hosts_file)
-            if known_hosts:
-                ssh_args.extend(["-o", f"UserKnownHostsFile={known_hosts}"])
-            # If empty, SSH uses default ~/.ssh/known_hosts
-        else:
-            # Use reasonable defaults when config is None
-            ssh_args.extend(["-o", "StrictHostKeyChecking=accept-new"])
-
-        ssh_args.extend(["-o", "LogLevel=ERROR"])
+        ssh_args.extend(self._host_key_options)
 
         # Add key file if provided
         effective_key = self._expand_path(key_override or (key_path or ""))
@@ -365,14 +419,79 @@ class SSHplexConnector:
             ssh_args.extend(["-p", str(effective_port)])
 
         # Add connection timeout
-        timeout = getattr(self.config.ssh, 'timeout', 10) if self.config else 10
-        ssh_args.extend(["-o", f"ConnectTimeout={timeout}"])
+        ssh_args.extend(self._timeout_options)
 
         # Add user@hostname with proper escaping
         effective_user = user_override or username
         ssh_args.append(f"{effective_user}@{ssh_target}")
 
-        return f"{env_prefix} " + " ".join(shlex.quote(part) for part in ssh_args)
+        return ssh_args
+
+    @cached_property
+    def _proxy_commands(self) -> Dict[str, str]:
+        """Map each provider to its ProxyCommand, built once from config.
+
+        Providers whose proxy has invalid values map to an empty string.
+        """
+        commands: Dict[str, str] = {}
+        if self.config is None:
+            return commands
+        for proxy in self.config.ssh.proxy:
+            # Sanitize proxy credentials to prevent injection
+            proxy_host = proxy.host or ''
+            proxy_user = proxy.username or ''
+            proxy_key = self._expand_path(proxy.key_path or '')
+
+            # Validate proxy values format
+            proxy_command = ""
+            if (_HOSTNAME_RE.match(proxy_host) and
+                _USERNAME_RE.match(proxy_user) and
+                proxy_key):
+                proxy_command = (
+                    "/usr/bin/ssh "
+                    f"-i {shlex.quote(proxy_key)} "
+                    f"-W %h:%p {shlex.quote(proxy_user)}@{shlex.quote(proxy_host)}"
+                )
+            for provider_name in proxy.imports:
+                # First matching proxy wins
+                commands.setdefault(provider_name, proxy_command)
+        return commands
+
+    @cached_property
+    def _ssh_command_prefixes(self) -> Dict[Tuple[str, ...], str]:
+        """Quoted command prefixes keyed by SSH options, filled as hosts are built."""
+        return {}
+
+    @cached_property
+    def _host_key_options(self) -> List[str]:
+        """SSH options for host key checking and logging, same for every host."""
+        options: List[str] = []
+        # Configure host key checking based on config
+        if self.config is not None:
+            strict_mode = self.config.ssh.strict_host_key_checking
+            if strict_mode:
+                options.extend(["-o", "StrictHostKeyChecking=yes"])
+            else:
+                # Less strict but still reasonable
+                options.extend(["-o", "StrictHostKeyChecking=accept-new"])
+
+            # Configure known_hosts file
+            known_hosts = self._expand_path(self.config.ssh.user_known_hosts_file)
+            if known_hosts:
+                options.extend(["-o", f"UserKnownHostsFile={known_hosts}"])
+            # If empty, SSH uses default ~/.ssh/known_hosts
+        else:
+            # Use reasonable defaults when config is None
+            options.extend(["-o", "StrictHostKeyChecking=accept-new"])
+
+        options.extend(["-o", "LogLevel=ERROR"])
+        return options
+
+    @cached_property
+    def _timeout_options(self) -> List[str]:
+        """SSH connect timeout option, same for every host."""
+        timeout = getattr(self.config.ssh, 'timeout', 10) if self.config else 10
+        return ["-o", f"ConnectTimeout={timeout}"]
 
     def get_session_name(self) -> str:
         """Get the tmux session name."""
@@ -1,6 +1,9 @@
 """Tests for SSHplex host cache management."""
 
+import json
+import os
 import tempfile
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -45,8 +48,8 @@ class TestHostCache:
         """Test default cache configuration."""
         cache = HostCache(cache_dir=str(cache_dir))
         assert cache.cache_ttl == timedelta(hours=24)
-        assert cache.cache_file.name == "hosts.yaml"
-        assert cache.metadata_file.name == "cache_metadata.yaml"
+        assert cache.cache_file.name == "hosts.cache"
+        assert cache.metadata_file == cache.cache_file
 
     def test_custom_ttl(self, cache_dir):
         """Test custom TTL configuration."""
@@ -73,6 +76,45 @@ class TestHostCache:
         assert cache.metadata_file.exists()
         assert not list(cache.cache_dir.glob("*.tmp"))
 
+    def test_save_hosts_syncs_once_before_replace(self, cache, sample_hosts, monkeypatch):
+        """Test that a save is one fsync'd temp file renamed over the cache."""
+        calls = []
+        real_fsync, real_replace = os.fsync, os.replace
+        monkeypatch.setattr(os, "fsync", lambda fd: (calls.append("fsync"), real_fsync(fd)))
+        monkeypatch.setattr(
+            os, "replace", lambda src, dst: (calls.append("replace"), real_replace(src, dst))
+        )
+
+        assert cache.save_hosts(sample_hosts, {'provider_count': 1}) is True
+
+        assert calls == ["fsync", "replace"]
+
+    def test_save_hosts_across_encode_batches(self, cache, monkeypatch):
+        """Test that hosts encoded in several batches still form one JSON list."""
+        monkeypatch.setattr("sshplex.lib.cache._ENCODE_BATCH", 2)
+        hosts = [Host(name=f"host{i}", ip=f"10.0.3.{i}", provider="test") for i in range(5)]
+
+        assert cache.save_hosts(hosts, {'provider_count': 1}) is True
+
+        loaded = cache.load_hosts()
+        assert [host.name for host in loaded] == [f"host{i}" for i in range(5)]
+
+    def test_failed_save_keeps_previous_cache(self, cache, sample_hosts):
+        """Test that a host failing to serialize mid-write leaves the old cache intact."""
+        cache.save_hosts(sample_hosts, {'provider_count': 1})
+        before = cache.cache_file.read_bytes()
+
+        class BrokenHost(Host):
+            def to_dict(self):
+                raise TypeError("boom")
+
+        broken = BrokenHost(name="broken", ip="10.0.9.9")
+
+        assert cache.save_hosts([*sample_hosts, broken], {'provider_count': 1}) is False
+
+        assert cache.cache_file.read_bytes() == before
+        assert not list(cache.cache_dir.glob("*.tmp"))
+
     def test_load_hosts(self, cache, sample_hosts):
         """Test loading hosts from cache."""
         # Save hosts first
@@ -95,12 +137,8 @@ class TestHostCache:
         cache.save_hosts(sample_hosts, {'provider_count': 1})
         
         # Manually expire the cache
-        old_time = (datetime.now() - timedelta(hours=2)).isoformat()
-        with open(cache.metadata_file) as f:
-            metadata = yaml.safe_load(f)
-        metadata['timestamp'] = old_time
-        with open(cache.metadata_file, 'w') as f:
-            yaml.dump(metadata, f)
+        old_time = time.time() - timedelta(hours=2).total_seconds()
+        os.utime(cache.cache_file, (old_time, old_time))
         
         # Try to load - should return None
         loaded = cache.load_hosts()
@@ -120,12 +158,8 @@ class TestHostCache:
         cache.save_hosts(sample_hosts, {'provider_count': 1})
         
         # Manually expire
-        old_time = (datetime.now() - timedelta(hours=2)).isoformat()
-        with open(cache.metadata_file) as f:
-            metadata = yaml.safe_load(f)
-        metadata['timestamp'] = old_time
-        with open(cache.metadata_file, 'w') as f:
-            yaml.dump(metadata, f)
+        old_time = time.time() - timedelta(hours=2).total_seconds()
+        os.utime(cache.cache_file, (old_time, old_time))
         
         assert cache.is_cache_valid() is False
 
@@ -221,8 +255,49 @@ class TestHostCache:
         loaded = cache.load_hosts()
         assert loaded is None
 
+    def test_corrupted_json_cache_file(self, cache):
+        """Test handling of a truncated JSON cache file."""
+        cache.cache_file.write_text('[{"name": "host1", "ip":')
+
+        assert cache.load_hosts() is None
+
+    def test_cache_is_one_file_with_a_metadata_line(self, cache, sample_hosts):
+        """Test that metadata and hosts are written as two JSON lines of one file."""
+        cache.save_hosts(sample_hosts, {'provider_count': 1})
+
+        assert [path.name for path in cache.cache_dir.iterdir()] == ['hosts.cache']
+        metadata_line, hosts_line = cache.cache_file.read_text().split('\n')
+
+        assert json.loads(metadata_line)['host_count'] == 3
+        assert [host['name'] for host in json.loads(hosts_line)] == ['host1', 'host2', 'host3']
+
+    def test_get_cache_info_reads_only_the_metadata_line(self, cache, sample_hosts):
+        """Test that cache info doesn't need the host list to be readable."""
+        cache.save_hosts(sample_hosts, {'provider_count': 1})
+        metadata_line = cache.cache_file.read_text().split('\n')[0]
+        cache.cache_file.write_text(metadata_line + '\n[{"truncated')
+
+        info = cache.get_cache_info()
+
+        assert info is not None
+        assert info['host_count'] == 3
+        assert cache.load_hosts() is None
+
+    def test_clear_cache_removes_legacy_files(self, cache, sample_hosts):
+        """Test that split YAML files from older versions are ignored and cleared."""
+        legacy_files = [cache.cache_dir / 'hosts.yaml', cache.cache_dir / 'cache_metadata.yaml']
+        with open(legacy_files[0], 'w') as f:
+            yaml.safe_dump([host.to_dict() for host in sample_hosts], f)
+        with open(legacy_files[1], 'w') as f:
+            yaml.safe_dump({'timestamp': datetime.now().isoformat(), 'host_count': 3}, f)
+
+        assert cache.load_hosts() is None
+
+        assert cache.clear_cache() is True
+        assert not any(path.exists() for path in legacy_files)
+
     def test_corrupted_metadata_file(self, cache, sample_hosts):
-        """Test handling of corrupted metadata file."""
+        """Test handling of a cache file with corrupted contents."""
         # Save hosts
         cache.save_hosts(sample_hosts, {'provider_count': 1})
         
@@ -230,18 +305,34 @@ class TestHostCache:
         with open(cache.metadata_file, 'w') as f:
             f.write("invalid: yaml: [")
         
-        # Cache should be considered invalid
-        assert cache.is_cache_valid() is False
+        # Validity is stat-based; the corrupt document is caught on load
+        assert cache.load_hosts() is None
+        assert cache.get_cache_info() is None
 
     def test_missing_timestamp_in_metadata(self, cache, sample_hosts):
         """Test handling of metadata without timestamp."""
         cache.save_hosts(sample_hosts, {'provider_count': 1})
         
         # Remove timestamp from metadata
-        with open(cache.metadata_file) as f:
-            metadata = yaml.safe_load(f)
+        metadata_line, hosts_line = cache.cache_file.read_text().split('\n')
+        metadata = json.loads(metadata_line)
         del metadata['timestamp']
-        with open(cache.metadata_file, 'w') as f:
-            yaml.dump(metadata, f)
+        cache.cache_file.write_text(json.dumps(metadata) + '\n' + hosts_line)
         
-        assert cache.is_cache_valid() is False
+        info = cache.get_cache_info()
+        assert info is not None
+        assert 'age_hours' not in info
+        assert cache.load_hosts() is not None
+
+    def test_is_cache_valid_only_stats_the_file(self, cache, sample_hosts, monkeypatch):
+        """Test that validity checks never open the cache file."""
+        cache.save_hosts(sample_hosts, {'provider_count': 1})
+
+        def fail_open(*args, **kwargs):
+            raise AssertionError("cache file was opened")
+
+        monkeypatch.setattr("builtins.open", fail_open)
+        monkeypatch.setattr(Path, "read_bytes", fail_open)
+
+        assert cache.is_cache_valid() is True
+        assert cache.refresh_needed() is False
@@ -5,7 +5,8 @@ from __future__ import annotations
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-from sshplex.lib.commands import clear_cache
+from sshplex.lib.commands import clear_cache, run_debug_mode
+from sshplex.lib.sot.base import Host
 
 
 def _minimal_config() -> SimpleNamespace:
@@ -21,7 +22,7 @@ def test_clear_cache_still_attempts_delete_when_metadata_missing(capsys) -> None
     fake_cache.get_cache_info.return_value = None
     fake_cache.clear_cache.return_value = True
 
-    with patch("sshplex.lib.commands.HostCache", return_value=fake_cache):
+    with patch("sshplex.lib.cache.HostCache", return_value=fake_cache):
         result = clear_cache(config, logger, no_cache_message="Clearing cache...")
 
     assert result == 0
@@ -40,10 +41,63 @@ def test_clear_cache_returns_failure_when_delete_fails(capsys) -> None:
     fake_cache.get_cache_info.return_value = None
     fake_cache.clear_cache.return_value = False
 
-    with patch("sshplex.lib.commands.HostCache", return_value=fake_cache):
+    with patch("sshplex.lib.cache.HostCache", return_value=fake_cache):
         result = clear_cache(config, logger, no_cache_message="Clearing cache...")
 
     assert result == 1
     fake_cache.clear_cache.assert_called_once()
     captured = capsys.readouterr().out
     assert "Failed to clear cache" in captured
+
+
+def test_run_debug_mode_lists_hosts_in_order(capsys) -> None:
+    """run_debug_mode should print one formatted line per host."""
+    fake_factory = MagicMock()
+    fake_factory.get_cache_info.return_value = None
+    fake_factory.initialize_providers.return_value = True
+    fake_factory.get_provider_count.return_value = 1
+    fake_factory.get_provider_names.return_value = ["static"]
+    fake_factory.test_all_connections.return_value = {"static": True}
+    fake_factory.iter_all_hosts.return_value = iter([
+        Host("web-01", "10.0.0.1", sources=["static"]),
+        Host("db-01", "10.0.0.2", status="active"),
+    ])
+
+    with patch("sshplex.lib.sot.factory.SoTFactory", return_value=fake_factory):
+        result = run_debug_mode(SimpleNamespace(), MagicMock())
+
+    assert result == 0
+    lines = capsys.readouterr().out.splitlines()
+    start = lines.index("-" * 80)
+    assert lines[start + 1].startswith("  1. web-01")
+    assert lines[start + 1].endswith("[unknown ] (static)")
+    assert lines[start + 2].startswith("  2. db-01")
+    assert "[active  ] (unknown)" in lines[start + 2]
+    assert lines[start + 3] == "-" * 80
+    assert lines[start + 4] == "📋 Found 2 hosts from all providers"
+
+
+def test_run_debug_mode_writes_rows_in_batches_while_hosts_stream(capsys) -> None:
+    """Rows are written before the host iterator is exhausted."""
+    fake_factory = MagicMock()
+    fake_factory.get_cache_info.return_value = None
+    fake_factory.initialize_providers.return_value = True
+    fake_factory.get_provider_names.return_value = ["static"]
+    fake_factory.test_all_connections.return_value = {}
+    seen_before_last: list[str] = []
+
+    def stream_hosts():
+        for i in range(1, 101):
+            if i == 100:
+                seen_before_last.append(capsys.readouterr().out)
+            yield Host(f"host-{i:03d}", f"10.0.0.{i}")
+
+    fake_factory.iter_all_hosts.return_value = stream_hosts()
+
+    with patch("sshplex.lib.sot.factory.SoTFactory", return_value=fake_factory):
+        result = run_debug_mode(SimpleNamespace(), MagicMock())
+
+    assert result == 0
+    assert "host-062" in seen_before_last[0]
+    assert "host-099" not in seen_before_last[0]
+    assert "Found 100 hosts" in capsys.readouterr().out
@@ -1,5 +1,7 @@
 """Tests for SSHplex configuration management."""
 
+import pickle
+from collections import OrderedDict
 from unittest.mock import patch
 
 import pytest
@@ -17,6 +19,8 @@ from sshplex.lib.config import (
     SSHRetryConfig,
     TmuxConfig,
     UIConfig,
+    _config_cache_file,
+    _parse_config_yaml,
     ensure_config_directory,
     get_default_config_path,
     get_template_config_path,
@@ -323,6 +327,10 @@ class TestConfigPaths:
         path = get_default_config_path()
         assert str(path).endswith(".config/sshplex/sshplex.yaml")
 
+    def test_get_template_config_path_is_memoized(self):
+        """Test the template path is computed once."""
+        assert get_template_config_path() is get_template_config_path()
+
     def test_get_template_config_path(self):
         """Test template config path."""
         path = get_template_config_path()
@@ -397,3 +405,132 @@ class TestLoadConfig:
 
         assert default_config_file.exists()
         assert config.ssh.username == "testuser"
+
+
+class TestConfigCache:
+    """Tests for the parsed-config cache used by load_config."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_parse_memo(self, monkeypatch):
+        """Start each test without in-process parsed configs."""
+        monkeypatch.setattr("sshplex.lib.yaml_compat._PARSED_FILES", OrderedDict())
+
+    def test_repeat_loads_reuse_in_process_parse(self, temp_config_dir, sample_config_dict):
+        """Test repeat loads skip the YAML parse and return independent data."""
+        config_file = temp_config_dir / "sshplex.yaml"
+        with open(config_file, "w") as f:
+            yaml.dump(sample_config_dict, f)
+
+        with patch(
+            "sshplex.lib.config._parse_config_yaml", wraps=_parse_config_yaml
+        ) as parse:
+            first = load_config(str(config_file))
+            first.ssh.username = "changed"
+            second = load_config(str(config_file))
+            assert parse.call_count == 1
+            assert second.ssh.username == "testuser"
+
+            sample_config_dict["ssh"]["username"] = "otheruser"
+            with open(config_file, "w") as f:
+                yaml.dump(sample_config_dict, f)
+
+            assert load_config(str(config_file)).ssh.username == "otheruser"
+            assert parse.call_count == 2
+
+    def test_cached_parse_is_reused_until_file_changes(
+        self, temp_config_dir, temp_cache_dir, sample_config_dict, monkeypatch
+    ):
+        """Test the YAML is parsed once while the file is unchanged."""
+        monkeypatch.setattr("sshplex.lib.config._CONFIG_CACHE_DIR", temp_cache_dir)
+        config_file = temp_config_dir / "sshplex.yaml"
+        with open(config_file, "w") as f:
+            yaml.dump(sample_config_dict, f)
+
+        with patch(
+            "sshplex.lib.config._parse_config_yaml", wraps=_parse_config_yaml
+        ) as parse:
+            load_config(str(config_file), use_cache=True)
+            config = load_config(str(config_file), use_cache=True)
+            assert parse.call_count == 1
+            assert config.ssh.username == "testuser"
+
+            sample_config_dict["ssh"]["username"] = "otheruser"
+            with open(config_file, "w") as f:
+                yaml.dump(sample_config_dict, f)
+            config = load_config(str(config_file), use_cache=True)
+
+        assert parse.call_count == 2
+        assert config.ssh.username == "otheruser"
+
+    def test_parse_matches_safe_load(self, temp_config_dir, sample_config_dict):
+        """Test the fast loader yields the same data as yaml.safe_load."""
+        config_file = temp_config_dir / "sshplex.yaml"
+        with open(config_file, "w") as f:
+            yaml.dump(sample_config_dict, f)
+
+        assert _parse_config_yaml(config_file) == yaml.safe_load(config_file.read_text())
+
+    def test_cache_is_not_used_by_default(
+        self, temp_config_dir, temp_cache_dir, sample_config_dict, monkeypatch
+    ):
+        """Test load_config without use_cache never touches the cache directory."""
+        monkeypatch.setattr("sshplex.lib.config._CONFIG_CACHE_DIR", temp_cache_dir)
+        config_file = temp_config_dir / "sshplex.yaml"
+        with open(config_file, "w") as f:
+            yaml.dump(sample_config_dict, f)
+
+        load_config(str(config_file))
+
+        assert list(temp_cache_dir.iterdir()) == []
+
+    def test_corrupt_cache_falls_back_to_parsing(
+        self, temp_config_dir, temp_cache_dir, sample_config_dict, monkeypatch
+    ):
+        """Test an unreadable cache file is ignored and rewritten."""
+        monkeypatch.setattr("sshplex.lib.config._CONFIG_CACHE_DIR", temp_cache_dir)
+        config_file = temp_config_dir / "sshplex.yaml"
+        with open(config_file, "w") as f:
+            yaml.dump(sample_config_dict, f)
+
+        _config_cache_file(config_file).write_bytes(b"not a pickle")
+
+        with patch(
+            "sshplex.lib.config._parse_config_yaml", wraps=_parse_config_yaml
+        ) as parse:
+            config = load_config(str(config_file), use_cache=True)
+            assert parse.call_count == 1
+
+        assert config.ssh.username == "testuser"
+        assert load_config(str(config_file), use_cache=True).ssh.username == "testuser"
+
+    @pytest.mark.parametrize("payload", [b"", pickle.dumps("wrong shape")])
+    def test_truncated_or_misshaped_cache_falls_back_to_parsing(
+        self, temp_config_dir, temp_cache_dir, sample_config_dict, monkeypatch, payload
+    ):
+        """Test empty or wrongly shaped cache files are ignored."""
+        monkeypatch.setattr("sshplex.lib.config._CONFIG_CACHE_DIR", temp_cache_dir)
+        config_file = temp_config_dir / "sshplex.yaml"
+        with open(config_file, "w") as f:
+            yaml.dump(sample_config_dict, f)
+        _config_cache_file(config_file).write_bytes(payload)
+
+        assert load_config(str(config_file), use_cache=True).ssh.username == "testuser"
+
+    def test_stale_cache_falls_back_to_parsing(
+        self, temp_config_dir, temp_cache_dir, sample_config_dict, monkeypatch
+    ):
+        """Test a cache written for another version of the file isn't used."""
+        monkeypatch.setattr("sshplex.lib.config._CONFIG_CACHE_DIR", temp_cache_dir)
+        config_file = temp_config_dir / "sshplex.yaml"
+        with open(config_file, "w") as f:
+            yaml.dump(sample_config_dict, f)
+        stale = dict(sample_config_dict, ssh=dict(sample_config_dict["ssh"], username="stale"))
+        _config_cache_file(config_file).write_bytes(pickle.dumps(((0, 0), stale)))
+
+        with patch(
+            "sshplex.lib.config._parse_config_yaml", wraps=_parse_config_yaml
+        ) as parse:
+            config = load_config(str(config_file), use_cache=True)
+
+        assert parse.call_count == 1
+        assert config.ssh.username == "testuser"
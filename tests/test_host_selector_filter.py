@@ -0,0 +1,228 @@
+"""Tests for HostSelector search filtering."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
+
+from sshplex.lib.sot.base import Host
+from sshplex.lib.ui.host_selector import HostSelector
+
+
+def make_app(hosts: list[Host]) -> HostSelector:
+    config = SimpleNamespace(
+        health=SimpleNamespace(enabled=False),
+        history=SimpleNamespace(enabled=False),
+        ssh=SimpleNamespace(username="admin", port=22),
+        ui=SimpleNamespace(table_columns=["name", "ip", "role"]),
+    )
+    app = HostSelector(config)
+    app.hosts = hosts
+    app.filtered_hosts = list(hosts)
+    app.populate_table = Mock()
+    app.update_status_selection = Mock()
+    return app
+
+
+def sample_hosts() -> list[Host]:
+    return [
+        Host("web-01", "10.0.0.1", role="Frontend"),
+        Host("web-02", "10.0.0.2", role="frontend"),
+        Host("db-01", "10.0.1.1", role="database"),
+    ]
+
+
+def test_plain_search_matches_substring_case_insensitively() -> None:
+    app = make_app(sample_hosts())
+
+    app.search_filter = "front"
+    app.filter_hosts()
+
+    assert [host.name for host in app.filtered_hosts] == ["web-01", "web-02"]
+
+
+def test_plain_search_does_not_match_across_columns() -> None:
+    app = make_app(sample_hosts())
+
+    app.search_filter = "01 10"
+    app.filter_hosts()
+
+    assert app.filtered_hosts == []
+
+
+def test_wildcard_search_keeps_fnmatch_semantics() -> None:
+    app = make_app(sample_hosts())
+
+    app.search_filter = "db*"
+    app.filter_hosts()
+
+    assert [host.name for host in app.filtered_hosts] == ["db-01"]
+
+
+def test_search_index_rebuilds_after_invalidation() -> None:
+    app = make_app(sample_hosts())
+    app.search_filter = "cache"
+    app.filter_hosts()
+    assert app.filtered_hosts == []
+
+    app.hosts.append(Host("cache-01", "10.0.2.1", role="cache"))
+    app._invalidate_host_values()
+    app.filter_hosts()
+
+    assert [host.name for host in app.filtered_hosts] == ["cache-01"]
+
+
+def test_search_corpus_maps_each_match_to_one_host() -> None:
+    app = make_app(sample_hosts())
+
+    assert app._match_host_indices(b"0") == [0, 1, 2]
+    assert app._match_host_indices(b"database") == [2]
+    assert app._match_host_indices(b"missing") == []
+
+
+def test_search_input_changes_are_debounced() -> None:
+    app = make_app(sample_hosts())
+    app.search_input = Mock(value="db")
+    timers: list[Mock] = []
+
+    def fake_set_timer(delay: float, callback: Any) -> Mock:
+        timer = Mock(callback=callback)
+        timers.append(timer)
+        return timer
+
+    app.set_timer = fake_set_timer
+    app.on_input_changed(SimpleNamespace(input=app.search_input, value="d"))
+    app.on_input_changed(SimpleNamespace(input=app.search_input, value="db"))
+
+    timers[0].stop.assert_called_once()
+    assert app.filtered_hosts == app.hosts
+
+    timers[1].callback()
+
+    assert app.search_filter == "db"
+    assert [host.name for host in app.filtered_hosts] == ["db-01"]
+
+
+def test_flush_search_applies_pending_filter() -> None:
+    app = make_app(sample_hosts())
+    app.search_input = Mock(value="WEB-02")
+    pending = Mock()
+    app._search_timer = pending
+
+    app._flush_search()
+
+    pending.stop.assert_called_once()
+    assert app._search_timer is None
+    assert [host.name for host in app.filtered_hosts] == ["web-02"]
+
+
+def test_host_values_are_cached_and_read_favorites_once() -> None:
+    app = make_app(sample_hosts())
+    app.config.history.enabled = True
+    app._reindex_hosts()
+    app.history_manager = Mock()
+    app.history_manager.get_favorites.return_value = [SimpleNamespace(name="db-01", ip="10.0.1.1")]
+
+    values = [app._host_display_values(host) for host in app.hosts]
+    app._host_display_values(app.hosts[0])
+
+    assert values[2] == ("★ db-01", "10.0.1.1", "database")
+    assert values[0][0] == "web-01"
+    app.history_manager.get_favorites.assert_called_once()
+    app.history_manager.is_favorite.assert_not_called()
+
+    app.history_manager.get_favorites.return_value = []
+    app._invalidate_host_values()
+
+    assert app._host_display_values(app.hosts[2])[0] == "db-01"
+
+
+def test_wildcard_search_matches_single_column_values() -> None:
+    app = make_app(sample_hosts())
+
+    app.search_filter = "web-0?"
+    app.filter_hosts()
+    assert [host.name for host in app.filtered_hosts] == ["web-01", "web-02"]
+
+    app.search_filter = "*FRONT*"
+    app.filter_hosts()
+    assert [host.name for host in app.filtered_hosts] == ["web-01", "web-02"]
+
+    app.search_filter = "web*10.0*"
+    app.filter_hosts()
+    assert app.filtered_hosts == []
+
+
+class RecordingTable:
+    """Minimal DataTable stand-in that records row operations."""
+
+    def __init__(self) -> None:
+        self.keys: list[str] = []
+        self.cursor_row = 0
+        self.cleared = 0
+        self.removed: list[str] = []
+
+    def clear(self) -> None:
+        self.cleared += 1
+        self.keys = []
+
+    def add_row(self, *cells: object, key: str) -> None:
+        self.keys.append(key)
+
+    def remove_row(self, key: str) -> None:
+        self.removed.append(key)
+        self.keys.remove(key)
+
+    def move_cursor(self, row: int) -> None:
+        self.cursor_row = row
+
+
+def test_narrowing_search_removes_rows_instead_of_rebuilding() -> None:
+    app = make_app(sample_hosts())
+    del app.populate_table
+    table = RecordingTable()
+    app.table = table  # type: ignore[assignment]
+
+    app.filter_hosts()
+    assert table.cleared == 1
+    table.cursor_row = 1
+
+    app.search_filter = "web"
+    app.filter_hosts()
+    assert table.cleared == 1
+    assert table.removed == ["db-01|10.0.1.1"]
+    assert table.keys == ["web-01|10.0.0.1", "web-02|10.0.0.2"]
+    assert table.cursor_row == 1
+
+    app.search_filter = "web-"
+    app.filter_hosts()
+    assert table.cleared == 1
+    assert table.removed == ["db-01|10.0.1.1"]
+
+    app.search_filter = ""
+    app.filter_hosts()
+    assert table.cleared == 2
+    assert len(table.keys) == 3
+
+
+def test_invalidated_values_force_a_full_rebuild() -> None:
+    app = make_app(sample_hosts())
+    del app.populate_table
+    table = RecordingTable()
+    app.table = table  # type: ignore[assignment]
+
+    app.filter_hosts()
+    app._invalidate_host_values()
+    app.filter_hosts()
+
+    assert table.cleared == 2
+    assert table.removed == []
+
+
+def test_host_values_resolve_column_aliases() -> None:
+    app = make_app([Host("web-01", "10.0.0.1", provider="static")])
+    app.config.ui.table_columns = [" source ", "user", "hostname", "missing"]
+
+    assert app._all_host_values() == [("static", "admin", "10.0.0.1", "N/A")]
+    assert app._get_column_value(app.hosts[0], "source") == "static"
@@ -0,0 +1,187 @@
+"""Tests for HostSelector selection state."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from sshplex.lib.sot.base import Host
+from sshplex.lib.ui.host_selector import HostSelector
+
+
+def make_app(hosts: list[Host]) -> HostSelector:
+    config = SimpleNamespace(
+        health=SimpleNamespace(enabled=False),
+        history=SimpleNamespace(enabled=False),
+        ssh=SimpleNamespace(username="admin", port=22),
+        tmux=SimpleNamespace(backend="tmux"),
+        ui=SimpleNamespace(table_columns=["name", "ip"]),
+    )
+    app = HostSelector(config)
+    app.hosts = hosts
+    app.filtered_hosts = list(hosts)
+    app._reindex_hosts()
+    app.table = Mock(cursor_row=0)
+    app.update_row_checkbox = Mock()
+    app.update_rows_checkbox = Mock()
+    app.log_message = Mock()
+    app.update_status_selection = Mock()
+    return app
+
+
+def sample_hosts() -> list[Host]:
+    return [Host(f"host{i}", f"10.0.0.{i}") for i in range(4)]
+
+
+def test_toggle_select_flips_cursor_row() -> None:
+    app = make_app(sample_hosts())
+    app.table.cursor_row = 2
+
+    app.action_toggle_select()
+    assert [host.name for host in app.selected_hosts] == ["host2"]
+
+    app.action_toggle_select()
+    assert app.selected_count == 0
+
+
+def test_select_all_respects_search_filter() -> None:
+    hosts = sample_hosts()
+    app = make_app(hosts)
+
+    app.action_select_all()
+    assert app.selected_count == 4
+
+    app.action_deselect_all()
+    app.search_filter = "host1"
+    app.filtered_hosts = [hosts[1]]
+    app.action_select_all()
+
+    assert app.selected_hosts == [hosts[1]]
+
+
+def test_reindex_keeps_selection_by_host_key() -> None:
+    app = make_app(sample_hosts())
+    app.table.cursor_row = 3
+    app.action_toggle_select()
+
+    app.hosts = [Host("host3", "10.0.0.3"), Host("new", "10.0.0.9")]
+    app._reindex_hosts()
+
+    assert [host.name for host in app.selected_hosts] == ["host3"]
+    assert app._is_selected(app.hosts[0])
+    assert not app._is_selected(app.hosts[1])
+
+
+def test_row_cells_are_plain_text_with_selection_style() -> None:
+    app = make_app([Host("web[1]", "10.0.0.1")])
+    host = app.hosts[0]
+
+    cells = app._row_cells(app._host_display_values(host), selected=True)
+
+    assert [cell.plain for cell in cells] == ["✓", "web[1]", "10.0.0.1"]
+    assert str(cells[1].style) == "bold"
+    assert [cell.plain for cell in app._row_cells(["web[1]"], selected=False)] == [" ", "web[1]"]
+
+
+class FakeTable:
+    """DataTable double storing cells and recording update_width flags."""
+
+    def __init__(self, rows: dict[str, dict[str, object]]) -> None:
+        self.rows = rows
+        self.width_updates: list[bool] = []
+
+    def get_cell(self, row_key: str, column: str) -> object:
+        return self.rows[row_key][column]
+
+    def update_cell(self, row_key: str, column: str, value: object, update_width: bool = True) -> None:
+        self.rows[row_key][column] = value
+        self.width_updates.append(update_width)
+
+
+def test_update_rows_checkbox_restyles_without_width_updates() -> None:
+    hosts = sample_hosts()
+    app = make_app(hosts)
+    del app.update_rows_checkbox
+    keys = [app._host_key(host) for host in hosts]
+    app.table = FakeTable(
+        {key: dict(zip(["checkbox", "name", "ip"], app._row_cells(app._host_display_values(host), False)))
+         for key, host in zip(keys[:2], hosts)}
+    )
+
+    app.update_rows_checkbox(keys, True)
+
+    assert app.table.width_updates and not any(app.table.width_updates)
+    assert app.table.rows[keys[0]]["checkbox"].plain == "✓"
+    assert str(app.table.rows[keys[1]]["name"].style) == "bold"
+    assert app.table.rows[keys[1]]["name"].plain == "host1"
+
+
+def test_select_all_only_restyles_rows_that_change() -> None:
+    hosts = sample_hosts()
+    app = make_app(hosts)
+    app.table.cursor_row = 1
+    app.action_toggle_select()
+
+    app.action_select_all()
+    restyled = list(app.update_rows_checkbox.call_args.args[0])
+    assert restyled == [app._host_key(host) for host in hosts if host.name != "host1"]
+
+    app.update_rows_checkbox.reset_mock()
+    app.action_select_all()
+    app.update_rows_checkbox.assert_not_called()
+    assert app.selected_count == 4
+
+
+def test_status_bar_is_only_updated_when_text_changes() -> None:
+    app = make_app(sample_hosts())
+    del app.update_status_selection
+    app.status_widget = Mock()
+
+    app.update_status_selection()
+    app.update_status_selection()
+    assert app.status_widget.update.call_count == 1
+
+    app.table.cursor_row = 0
+    app.action_toggle_select()
+    assert app.status_widget.update.call_count == 2
+    assert app.status_widget.update.call_args.args[0].startswith("sel 1/4")
+
+
+def test_header_sort_keeps_selection_on_the_same_hosts() -> None:
+    hosts = sample_hosts()
+    app = make_app(hosts)
+    app.populate_table = Mock()
+    app.table.cursor_row = 1
+    app.action_toggle_select()
+
+    app.on_data_table_header_selected(SimpleNamespace(column_key=SimpleNamespace(value="name")))
+
+    assert [host.name for host in app.hosts] == ["host3", "host2", "host1", "host0"]
+    assert [host.name for host in app.selected_hosts] == ["host1"]
+    assert app._host_display_values(app.hosts[0]) == ("host3", "10.0.0.3")
+
+
+def test_toggle_select_follows_rendered_row_keys() -> None:
+    hosts = sample_hosts()
+    app = make_app(hosts)
+    # Rendered order differs from self.hosts, e.g. after sorting a filtered view
+    app._table_keys = [app._host_key(hosts[3]), app._host_key(hosts[1])]
+    app.table.cursor_row = 0
+
+    app.action_toggle_select()
+
+    assert [host.name for host in app.selected_hosts] == ["host3"]
+    app.update_row_checkbox.assert_called_once_with("host3|10.0.0.3", True)
+
+
+def test_on_key_ignores_non_enter_keys_before_palette_lookup() -> None:
+    app = make_app(sample_hosts())
+    app._is_command_palette_open = Mock(return_value=False)
+    app.action_connect_selected = Mock()
+    event = Mock(key="down")
+
+    app.on_key(event)
+
+    app._is_command_palette_open.assert_not_called()
+    app.action_connect_selected.assert_not_called()
+    event.stop.assert_not_called()
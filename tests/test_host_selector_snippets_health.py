@@ -101,3 +101,33 @@ async def test_health_check_skips_fresh_cache(
     check_mock.assert_not_called()
     app.populate_table.assert_called_once_with([host])
     app.update_status_with_mode.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_health_checks_bound_open_connections(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    app = make_app()
+    hosts = [Host(f"host{i}", f"10.0.0.{i}") for i in range(10)]
+    app.get_hosts_to_display = Mock(return_value=hosts)
+    app.populate_table = Mock()
+    app.update_status = Mock()
+    app.update_status_with_mode = Mock()
+    in_flight = 0
+    peak = 0
+
+    async def fake_check_host(target: str, port: int, timeout: float) -> HealthStatus:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return HealthStatus.HEALTHY
+
+    monkeypatch.setattr(host_selector_module, "check_host", fake_check_host)
+    monkeypatch.setattr(host_selector_module, "_HEALTH_CHECK_CONCURRENCY", 3)
+
+    await app._check_health_async()
+
+    assert peak == 3
+    assert len(app.health_cache) == 10
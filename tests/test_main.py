@@ -5,6 +5,7 @@ from __future__ import annotations
 from types import SimpleNamespace
 from unittest.mock import patch
 
+from sshplex.lib.utils.tmux import find_tmux
 from sshplex.main import check_system_dependencies
 
 
@@ -15,7 +16,7 @@ def _config_with_backend(backend: str) -> SimpleNamespace:
 def test_check_system_dependencies_skips_tmux_for_iterm2_native() -> None:
     """iTerm2-native backend should not require tmux binary."""
     config = _config_with_backend("iterm2-native")
-    with patch("sshplex.main.shutil.which") as mock_which:
+    with patch("sshplex.lib.utils.tmux.shutil.which") as mock_which:
         assert check_system_dependencies(config) is True
         mock_which.assert_not_called()
 
@@ -23,5 +24,18 @@ def test_check_system_dependencies_skips_tmux_for_iterm2_native() -> None:
 def test_check_system_dependencies_requires_tmux_for_tmux_backend() -> None:
     """tmux backend should fail dependency check when tmux is missing."""
     config = _config_with_backend("tmux")
-    with patch("sshplex.main.shutil.which", return_value=None):
+    find_tmux.cache_clear()
+    with patch("sshplex.lib.utils.tmux.shutil.which", return_value=None):
         assert check_system_dependencies(config) is False
+    find_tmux.cache_clear()
+
+
+def test_check_system_dependencies_resolves_tmux_once() -> None:
+    """Repeated checks reuse the cached tmux lookup."""
+    config = _config_with_backend("tmux")
+    find_tmux.cache_clear()
+    with patch("sshplex.lib.utils.tmux.shutil.which", return_value="/usr/bin/tmux") as mock_which:
+        assert check_system_dependencies(config) is True
+        assert check_system_dependencies(config) is True
+        mock_which.assert_called_once_with("tmux")
+    find_tmux.cache_clear()
@@ -1,5 +1,7 @@
 """Tests for SSHplex tmux multiplexer manager."""
 
+from collections import Counter
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -47,7 +49,7 @@ class TestTmuxManager:
     def test_generate_unique_session_name_available(self, manager, mock_libtmux):
         """Test unique name generation when name is available."""
         mock_server = MagicMock()
-        mock_server.has_session.return_value = False
+        mock_server.sessions = [SimpleNamespace(session_name='other')]
         manager.server = mock_server
         
         result = manager._generate_unique_session_name('test-session')
@@ -56,7 +58,7 @@ class TestTmuxManager:
     def test_generate_unique_session_name_exists(self, manager, mock_libtmux):
         """Test unique name generation when name exists."""
         mock_server = MagicMock()
-        mock_server.has_session.side_effect = lambda name: name == 'test-session'
+        mock_server.sessions = [SimpleNamespace(session_name='test-session')]
         manager.server = mock_server
         
         result = manager._generate_unique_session_name('test-session')
@@ -67,11 +69,12 @@ class TestTmuxManager:
         """Test unique name generation when multiple names exist."""
         mock_server = MagicMock()
         existing = ['test-session', 'test-session-1', 'test-session-2']
-        mock_server.has_session.side_effect = lambda name: name in existing
+        mock_server.sessions = [SimpleNamespace(session_name=name) for name in existing]
         manager.server = mock_server
         
         result = manager._generate_unique_session_name('test-session')
         assert result == 'test-session-3'
+        mock_server.has_session.assert_not_called()
 
     def test_init_server_success(self, manager, mock_libtmux):
         """Test successful server initialization."""
@@ -132,7 +135,8 @@ class TestTmuxManager:
         result = manager.send_command('test-host', 'ls -la')
         
         assert result is True
-        mock_pane.send_keys.assert_called_once_with('ls -la', enter=True)
+        mock_pane.cmd.assert_called_once_with('send-keys', 'ls -la', 'Enter')
+        mock_pane.send_keys.assert_not_called()
 
     def test_set_pane_title_no_pane(self, manager):
         """Test setting title when pane doesn't exist."""
@@ -147,34 +151,43 @@ class TestTmuxManager:
         result = manager.set_pane_title('test-host', 'My Title')
         
         assert result is True
-        mock_pane.send_keys.assert_called_once()
+        mock_pane.cmd.assert_called_once_with('send-keys', 'printf "\\033]2;My Title\\033\\\\"', 'Enter')
 
     def test_broadcast_command(self, manager):
-        """Test broadcasting command to all panes."""
-        mock_pane1 = MagicMock()
-        mock_pane2 = MagicMock()
-        manager.panes['host1'] = mock_pane1
-        manager.panes['host2'] = mock_pane2
+        """Test broadcasting command to all panes in one tmux call."""
+        manager.server = MagicMock()
+        manager.server.cmd.return_value = SimpleNamespace(stdout=[], stderr=[])
+        manager.panes['host1'] = MagicMock(pane_id='%1')
+        manager.panes['host2'] = MagicMock(pane_id='%2')
         
         result = manager.broadcast_command('uptime')
         
         assert result is True
-        mock_pane1.send_keys.assert_called_once()
-        mock_pane2.send_keys.assert_called_once()
+        manager.server.cmd.assert_called_once_with(
+            'send-keys', '-t', '%1', 'uptime', 'Enter',
+            ';', 'send-keys', '-t', '%2', 'uptime', 'Enter',
+        )
+        manager.panes['host1'].send_keys.assert_not_called()
 
     def test_broadcast_command_partial_failure(self, manager):
         """Test broadcast when some panes fail."""
-        mock_pane1 = MagicMock()
-        mock_pane2 = MagicMock()
-        mock_pane2.send_keys.side_effect = Exception('Failed')
-        
-        manager.panes['host1'] = mock_pane1
-        manager.panes['host2'] = mock_pane2
+        manager.server = MagicMock()
+        manager.server.cmd.return_value = SimpleNamespace(stdout=[], stderr=["can't find pane: %2"])
+        manager.panes['host1'] = MagicMock(pane_id='%1')
+        manager.panes['host2'] = MagicMock(pane_id='%2')
         
         result = manager.broadcast_command('uptime')
         
         assert result is False
 
+    def test_broadcast_command_tmux_error(self, manager):
+        """Test broadcast when tmux can't be run."""
+        manager.server = MagicMock()
+        manager.server.cmd.side_effect = Exception('Failed')
+        manager.panes['host1'] = MagicMock(pane_id='%1')
+
+        assert manager.broadcast_command('uptime') is False
+
     def test_close_session(self, manager, mock_libtmux):
         """Test session closing."""
         mock_session = MagicMock()
@@ -219,6 +232,35 @@ class TestTmuxManager:
         assert result is True
         mock_window.cmd.assert_called()
 
+    def test_layout_and_broadcast_count_panes_once(self, manager):
+        """Test pane counts come from one list-panes call for the session."""
+        manager.server = MagicMock()
+        manager.server.cmd.return_value = SimpleNamespace(stdout=['@1', '@1', '@2'], stderr=[])
+        manager.session = MagicMock(session_id='$1')
+        manager.windows[0] = MagicMock(window_id='@1')
+        manager.windows[1] = MagicMock(window_id='@2')
+
+        assert manager.setup_tiled_layout() is True
+        assert manager.enable_broadcast() is True
+
+        manager.server.cmd.assert_called_once_with('list-panes', '-s', '-t', '$1', '-F', '#{window_id}')
+        manager.windows[0].select_layout.assert_called_once_with('tiled')
+        manager.windows[1].select_layout.assert_not_called()
+        manager.windows[0].cmd.assert_called_once_with('set-window-option', 'synchronize-panes', 'on')
+        manager.windows[1].cmd.assert_not_called()
+
+    def test_pane_counts_reset_when_panes_change(self, manager):
+        """Test a new pane invalidates the cached pane counts."""
+        manager._pane_counts = Counter({'@1': 1})
+        window = MagicMock(window_id='@1')
+        window.active_pane = MagicMock(pane_id='%1')
+        manager.current_window = window
+        manager.session = MagicMock()
+        manager._initialized = True
+
+        assert manager.create_pane('web-01') is True
+        assert manager._pane_counts is None
+
     def test_disable_broadcast_success(self, manager):
         """Test disabling broadcast mode."""
         mock_window = MagicMock()
@@ -250,6 +292,124 @@ class TestTmuxManager:
         
         assert result is False
 
+    def test_create_window_sends_command_and_enter_in_one_call(self, manager):
+        """Test the SSH command and Enter go to tmux in a single send-keys."""
+        mock_pane = MagicMock()
+        manager.session = MagicMock()
+        manager.session.new_window.return_value.panes = [mock_pane]
+
+        result = manager.create_window('web-01', 'ssh web-01')
+        manager.flush_commands()
+
+        assert result is True
+        mock_pane.cmd.assert_called_once_with('send-keys', 'ssh web-01', 'Enter')
+        mock_pane.send_keys.assert_not_called()
+
+    def test_create_pane_sends_command_and_enter_in_one_call(self, manager):
+        """Test pane creation types the command with a single send-keys."""
+        mock_pane = MagicMock()
+        manager.session = MagicMock()
+        manager.current_window = MagicMock()
+        manager.current_window.active_pane = mock_pane
+
+        result = manager.create_pane('web-01', 'ssh web-01')
+        manager.flush_commands()
+
+        assert result is True
+        assert manager.panes['web-01'] is mock_pane
+        mock_pane.cmd.assert_called_once_with('send-keys', 'ssh web-01', 'Enter')
+
+    def test_split_and_tile_uses_one_chained_tmux_call(self, manager):
+        """Test the split and the tiled layout go to tmux as one command chain."""
+        window = MagicMock(window_id='@3')
+        window.cmd.return_value = MagicMock(stdout=['%7'], stderr=[])
+
+        pane = manager._split_and_tile(window, vertical=False)
+
+        window.cmd.assert_called_once_with(
+            'split-window', '-h', '-P', '-F#{pane_id}', ';', 'select-layout', '-t', '@3', 'tiled'
+        )
+        assert pane.pane_id == '%7'
+        assert pane.server is window.server
+
+    def test_split_and_tile_raises_when_no_pane_was_created(self, manager):
+        """Test a failed split surfaces tmux's error so create_pane can fall back."""
+        window = MagicMock(window_id='@3')
+        window.cmd.return_value = MagicMock(stdout=[], stderr=['no space for new pane'])
+
+        with pytest.raises(RuntimeError, match='no space'):
+            manager._split_and_tile(window)
+
+    def test_pane_creation_goes_through_control_client_once_session_exists(self, manager):
+        """Test splits, layout and send-keys use the control client, and flush detaches it."""
+        control = MagicMock()
+        control.run.side_effect = lambda *args: ['%9'] if args[0] == 'split-window' else []
+        manager.server = MagicMock(socket_name='sshplex-test', socket_path=None)
+        manager.session = MagicMock()
+        manager.current_window = MagicMock(window_id='@1')
+        manager.current_window_pane_count = 1
+        manager._initialized = True
+
+        with patch('sshplex.lib.multiplexer.tmux.find_tmux', return_value='/opt/bin/tmux'), \
+                patch('sshplex.lib.multiplexer.tmux.TmuxControlClient', return_value=control) as client_cls:
+            assert manager.create_pane('web-02', 'ssh web-02') is True
+            manager.flush_commands()
+
+        client_cls.assert_called_once_with(
+            ['/opt/bin/tmux', '-Lsshplex-test', '-C', 'attach-session', '-t', 'test-session']
+        )
+        assert [call.args for call in control.run.call_args_list] == [
+            ('split-window', '-t', '@1', '-h', '-P', '-F#{pane_id}'),
+            ('select-layout', '-t', '@1', 'tiled'),
+            ('send-keys', '-t', '%9', 'ssh web-02', 'Enter'),
+        ]
+        assert manager.panes['web-02'].pane_id == '%9'
+        manager.current_window.cmd.assert_not_called()
+        control.close.assert_called_once()
+        assert manager._control is None
+
+    def test_control_client_failure_falls_back_to_tmux_commands(self, manager):
+        """Test a control client that can't start leaves the per-command path in place."""
+        window = MagicMock(window_id='@3')
+        window.cmd.return_value = MagicMock(stdout=['%7'], stderr=[])
+        manager.server = MagicMock(socket_name=None, socket_path=None)
+        manager._initialized = True
+
+        with patch('sshplex.lib.multiplexer.tmux.find_tmux', return_value='/opt/bin/tmux'), \
+                patch('sshplex.lib.multiplexer.tmux.TmuxControlClient', side_effect=EOFError('exited')) as client_cls:
+            assert manager._split_and_tile(window).pane_id == '%7'
+            assert manager._split_and_tile(window).pane_id == '%7'
+
+        client_cls.assert_called_once()
+        assert window.cmd.call_count == 2
+
+    def test_pane_commands_are_sent_in_background_until_flushed(self, manager):
+        """Test splits don't wait on send-keys, and flush waits for every send."""
+        import threading
+
+        release = threading.Event()
+        panes = [MagicMock(), MagicMock()]
+        for pane in panes:
+            pane.cmd.side_effect = lambda *args: release.wait(5)
+        panes[1].cmd.side_effect = RuntimeError("pane gone")
+        manager.logger = MagicMock()
+        manager.session = MagicMock()
+        manager.current_window = MagicMock()
+        manager.current_window.active_pane = panes[0]
+
+        with patch.object(TmuxManager, '_split_and_tile', return_value=panes[1]):
+            assert manager.create_pane('web-01', 'ssh web-01') is True
+            assert manager.create_pane('web-02', 'ssh web-02') is True
+
+        assert manager._pending_sends
+        release.set()
+        manager.flush_commands()
+
+        assert manager._pending_sends == []
+        assert manager._send_executor is None
+        panes[0].cmd.assert_called_once_with('send-keys', 'ssh web-01', 'Enter')
+        manager.logger.error.assert_called_once()
+
 
 class TestTmuxManagerAttach:
     """Tests for tmux session attachment."""
@@ -265,10 +425,47 @@ class TestTmuxManagerAttach:
 
     def test_attach_standard_calls_execlp(self, manager):
         """Test standard attach uses os.execlp."""
-        with patch('os.execlp') as mock_execlp:
+        with patch('sshplex.lib.multiplexer.tmux.find_tmux', return_value=None), \
+                patch('os.execlp') as mock_execlp:
             manager._attach_standard()
             mock_execlp.assert_called_once_with('tmux', 'tmux', 'attach-session', '-t', 'test-session')
 
+    def test_attach_standard_execs_resolved_tmux_path(self, manager):
+        """Test standard attach skips the PATH search when tmux was resolved."""
+        with patch('sshplex.lib.multiplexer.tmux.find_tmux', return_value='/opt/bin/tmux'), \
+                patch('os.execv') as mock_execv, patch('os.execlp') as mock_execlp:
+            manager._attach_standard()
+            mock_execv.assert_called_once_with(
+                '/opt/bin/tmux', ['/opt/bin/tmux', 'attach-session', '-t', 'test-session']
+            )
+            mock_execlp.assert_not_called()
+
+    def test_attach_standard_flushes_logging_before_exec(self, manager):
+        """Test buffered log output is written out before the process is replaced."""
+        calls = []
+        with patch('sshplex.lib.multiplexer.tmux.find_tmux', return_value='/opt/bin/tmux'), \
+                patch('sshplex.lib.logger.flush_logging', side_effect=lambda: calls.append('flush')), \
+                patch('os.execv', side_effect=lambda *args: calls.append('exec')):
+            manager._attach_standard()
+        assert calls == ['flush', 'exec']
+
+    def test_failed_exec_can_still_be_logged(self, manager):
+        """Test flushing before exec keeps the log sinks for a failed exec."""
+        from loguru import logger
+
+        messages = []
+        sink_id = logger.add(messages.append, format="{message}")
+        try:
+            with patch('sshplex.lib.multiplexer.tmux.find_tmux', return_value='/opt/bin/tmux'), \
+                    patch('os.execv', side_effect=PermissionError('denied')), \
+                    pytest.raises(PermissionError):
+                manager._attach_standard()
+            manager.logger.error("SSHplex: Failed to launch tmux session: denied")
+        finally:
+            logger.remove(sink_id)
+
+        assert [str(m).strip() for m in messages] == ["SSHplex: Failed to launch tmux session: denied"]
+
     def test_attach_iterm2_success(self, manager):
         """Test iTerm2 attach when launch succeeds."""
         manager.config.tmux.control_with_iterm2 = True
@@ -309,3 +506,17 @@ class TestTmuxManagerAttach:
                 patch('sshplex.lib.multiplexer.tmux.TmuxManager._attach_standard') as mock_standard:
             manager.attach_to_session(auto_attach=True)
             mock_standard.assert_called_once()
+
+
+def test_default_session_name_matches_strftime_format():
+    """Test the session name helper formats like strftime("%Y%m%d_%H%M%S")."""
+    import time
+
+    from sshplex.lib.multiplexer import base
+
+    fixed = time.struct_time((2025, 1, 31, 7, 5, 9, 4, 31, 0))
+    with patch.object(base.time, 'localtime', return_value=fixed):
+        name = base.default_session_name()
+
+    assert name == f"sshplex-{time.strftime('%Y%m%d_%H%M%S', fixed)}"
+    assert name == "sshplex-20250131_070509"
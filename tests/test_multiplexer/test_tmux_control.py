@@ -0,0 +1,159 @@
+"""Tests for the tmux control-mode client."""
+
+import io
+import os
+import queue
+import shlex
+import shutil
+import subprocess
+from typing import Optional
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sshplex.lib.multiplexer.tmux_control import TmuxControlClient
+
+
+class FakeProcess:
+    """Popen stand-in that replays canned control-mode output."""
+
+    def __init__(self, output: str) -> None:
+        self.stdin = io.StringIO()
+        self.stdout = io.StringIO(output)
+        self.wait = MagicMock()
+        self.kill = MagicMock()
+
+    def written(self) -> list:
+        return self.stdin.getvalue().splitlines()
+
+
+# tmux answers the handshake before the command-line attach (flags 0)
+HANDSHAKE = (
+    "%begin 2 11 1\n"
+    "sshplex-control-ready\n"
+    "%end 2 11 1\n"
+    "%begin 1 10 0\n"
+    "%end 1 10 0\n"
+    "%session-changed $0 v\n"
+    "%begin 2 12 1\n"
+    "%end 2 12 1\n"
+)
+
+
+def start(output: str, process: Optional[FakeProcess] = None) -> tuple:
+    process = process or FakeProcess(HANDSHAKE + output)
+    # Keep what was written readable after close()
+    process.stdin.close = MagicMock()
+    with patch("sshplex.lib.multiplexer.tmux_control.subprocess.Popen", return_value=process):
+        client = TmuxControlClient(["tmux", "-C", "attach-session", "-t", "v"], timeout=0.5)
+    return client, process
+
+
+def test_handshake_skips_attach_reply_and_disables_pane_output() -> None:
+    _, process = start("")
+
+    assert process.written() == [
+        "display-message -p sshplex-control-ready",
+        "refresh-client -f no-output",
+    ]
+
+
+def test_run_returns_reply_lines_and_skips_notifications() -> None:
+    client, process = start(
+        "%output %1 %end 2 13 1\\015\\012\n"
+        "%layout-change @0 abc\n"
+        "%begin 3 13 1\n"
+        "%4\n"
+        "%end 3 13 1\n"
+    )
+
+    assert client.run("split-window", "-t", "@0", "-P", "-F#{pane_id}") == ["%4"]
+    assert process.written()[-1] == "split-window -t @0 -P '-F#{pane_id}'"
+
+
+def test_run_quotes_arguments_and_raises_tmux_errors() -> None:
+    client, process = start("%begin 3 13 1\nno space for new pane\n%error 3 13 1\n")
+
+    with pytest.raises(RuntimeError, match="no space"):
+        client.run("send-keys", "-t", "%4", "ssh it's $HOME ; x", "Enter")
+    assert shlex.split(process.written()[-1]) == ["send-keys", "-t", "%4", "ssh it's $HOME ; x", "Enter"]
+
+
+def test_run_raises_eof_when_client_exits() -> None:
+    client, _ = start("%begin 3 13 1\n")
+
+    with pytest.raises(EOFError):
+        client.run("select-layout", "tiled")
+
+
+def test_start_closes_client_when_attach_fails() -> None:
+    process = FakeProcess("%begin 1 10 0\ncan't find session: v\n%error 1 10 0\n")
+    with patch("sshplex.lib.multiplexer.tmux_control.subprocess.Popen", return_value=process), \
+            pytest.raises(RuntimeError, match="find session"):
+        TmuxControlClient(["tmux", "-C", "attach-session", "-t", "v"])
+
+    process.wait.assert_called_once_with(timeout=2)
+
+
+def test_attach_reply_is_not_taken_for_a_command_reply() -> None:
+    process = FakeProcess(
+        "%begin 2 11 1\nsshplex-control-ready\n%end 2 11 1\n"
+        "%begin 2 12 1\n%end 2 12 1\n"
+        "%begin 1 10 0\n%end 1 10 0\n"
+        "%begin 3 13 1\n%5\n%end 3 13 1\n"
+    )
+    client, _ = start("", process)
+
+    assert client.run("split-window", "-P", "-F#{pane_id}") == ["%5"]
+
+
+class StalledOutput:
+    """stdout that never produces a line, like a hung tmux server."""
+
+    def __init__(self) -> None:
+        self.release: queue.Queue[None] = queue.Queue()
+
+    def __iter__(self):
+        self.release.get()
+        return iter(())
+
+    def close(self) -> None:
+        self.release.put(None)
+
+
+def test_run_times_out_when_tmux_stops_answering() -> None:
+    client, process = start("")
+    process.stdout = StalledOutput()
+    client._lines = queue.Queue()
+
+    with pytest.raises(TimeoutError):
+        client.run("select-layout", "tiled")
+
+
+@pytest.mark.skipif(shutil.which("tmux") is None, reason="tmux is not installed")
+def test_replies_match_commands_on_a_real_server(tmp_path) -> None:
+    """Every reply belongs to its own command against a live tmux server."""
+    tmux = shutil.which("tmux") or "tmux"
+    # A private server; never the user's default one
+    env = {k: v for k, v in os.environ.items() if k != "TMUX"}
+    base = [tmux, "-S", str(tmp_path / "tmux.sock")]
+    with patch.dict(os.environ, env, clear=True):
+        subprocess.run(base + ["new-session", "-d", "-s", "v", "-x", "200", "-y", "80"], check=True)
+        try:
+            for _ in range(5):
+                client = TmuxControlClient(base + ["-C", "attach-session", "-t", "v"])
+                try:
+                    for n in range(5):
+                        assert client.run("display-message", "-p", f"reply-{n}") == [f"reply-{n}"]
+                    pane_ids = [client.run("split-window", "-t", "v", "-P", "-F#{pane_id}")[0] for _ in range(3)]
+                    client.run("select-layout", "-t", "v", "tiled")
+                    listed = client.run("list-panes", "-t", "v", "-F", "#{pane_id}")
+                    assert set(pane_ids) <= set(listed)
+                    with pytest.raises(RuntimeError):
+                        client.run("select-window", "-t", "no-such-window")
+                    assert client.run("display-message", "-p", "after-error") == ["after-error"]
+                finally:
+                    client.close()
+                subprocess.run(base + ["kill-pane", "-a", "-t", "v"], check=True)
+        finally:
+            subprocess.run(base + ["kill-server"], check=False)
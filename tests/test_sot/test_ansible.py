@@ -1,13 +1,61 @@
 """Tests for SSHplex Ansible inventory provider."""
 
+import os
 import tempfile
+from collections import OrderedDict
 from pathlib import Path
 
 import pytest
 import yaml
 
+import sshplex.lib.yaml_compat as yaml_compat
 from sshplex.lib.sot.ansible import AnsibleProvider
 
+# libyaml's emitter when PyYAML was built with it
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# One host in one child group; trivial inventories are written from text
+# rather than emitted, the dumped fixtures already cover PyYAML's output
+_GROUP_INVENTORY = (
+    "all:\n"
+    "  children:\n"
+    "    {group}:\n"
+    "      hosts:\n"
+    "        {host}:\n"
+    "          ansible_host: {ip}\n"
+)
+
+
+@pytest.fixture(scope="module")
+def simple_inventory(tmp_path_factory):
+    """Create a simple Ansible inventory file, shared by the read-only tests."""
+    inventory = {
+        'all': {
+            'hosts': {
+                'localhost': {'ansible_connection': 'local'}
+            },
+            'children': {
+                'webservers': {
+                    'hosts': {
+                        'web1': {'ansible_host': '10.1.1.1', 'ansible_user': 'webuser'},
+                        'web2': {'ansible_host': '10.1.1.2'},
+                    }
+                },
+                'databases': {
+                    'hosts': {
+                        'db1': {'ansible_host': '10.1.2.1', 'ansible_port': 3306},
+                    }
+                }
+            }
+        }
+    }
+    
+    inventory_file = tmp_path_factory.mktemp("ansible") / "inventory.yml"
+    with open(inventory_file, 'wb') as f:
+        yaml.dump(inventory, f, Dumper=Dumper, encoding='utf-8', sort_keys=False)
+    
+    return inventory_file
+
 
 class TestAnsibleProvider:
     """Tests for AnsibleProvider class."""
@@ -18,36 +66,6 @@ class TestAnsibleProvider:
         with tempfile.TemporaryDirectory() as tmpdir:
             yield Path(tmpdir)
 
-    @pytest.fixture
-    def simple_inventory(self, temp_dir):
-        """Create a simple Ansible inventory file."""
-        inventory = {
-            'all': {
-                'hosts': {
-                    'localhost': {'ansible_connection': 'local'}
-                },
-                'children': {
-                    'webservers': {
-                        'hosts': {
-                            'web1': {'ansible_host': '10.1.1.1', 'ansible_user': 'webuser'},
-                            'web2': {'ansible_host': '10.1.1.2'},
-                        }
-                    },
-                    'databases': {
-                        'hosts': {
-                            'db1': {'ansible_host': '10.1.2.1', 'ansible_port': 3306},
-                        }
-                    }
-                }
-            }
-        }
-        
-        inventory_file = temp_dir / "inventory.yml"
-        with open(inventory_file, 'w') as f:
-            yaml.dump(inventory, f)
-        
-        return inventory_file
-
     @pytest.fixture
     def provider(self, simple_inventory):
         """Create an AnsibleProvider instance."""
@@ -94,9 +112,9 @@ class TestAnsibleProvider:
     def test_host_data_populated(self, provider):
         """Test that host data is correctly populated."""
         provider.connect()
-        hosts = provider.get_hosts()
+        hosts_by_name = provider.get_hosts_by_name()
         
-        web1 = next(h for h in hosts if h.name == 'web1')
+        web1 = hosts_by_name['web1']
         assert web1.ip == '10.1.1.1'
         assert web1.ansible_user == 'webuser'
         assert web1.ansible_group == 'webservers'
@@ -138,36 +156,103 @@ class TestAnsibleProvider:
         assert len(hosts) == 2
         assert all(h.name.startswith('web') for h in hosts)
 
+    def test_host_patterns_compile_once_per_inventory(self, simple_inventory, monkeypatch):
+        """Test host patterns aren't recompiled for every host."""
+        import sshplex.lib.sot.ansible as ansible_module
+
+        compiled = []
+        real_compile = ansible_module.re.compile
+
+        def counting_compile(pattern, *args):
+            compiled.append(pattern)
+            return real_compile(pattern, *args)
+
+        monkeypatch.setattr(ansible_module.re, 'compile', counting_compile)
+        provider = AnsibleProvider(
+            inventory_paths=[str(simple_inventory)],
+            filters={'host_patterns': [r'^web', r'^db']}
+        )
+        provider.connect()
+        hosts = provider.get_hosts()
+
+        assert sorted(h.name for h in hosts) == ['db1', 'web1', 'web2']
+        assert compiled == [r'^web', r'^db']
+
+    @pytest.fixture
+    def parses(self, monkeypatch):
+        """Start without remembered parses and record every inventory parse."""
+        monkeypatch.setattr(yaml_compat, '_PARSED_FILES', OrderedDict())
+        parsed = []
+        real_load = yaml_compat.yaml.load
+
+        def counting_load(stream, Loader):
+            parsed.append(stream.name)
+            return real_load(stream, Loader=Loader)
+
+        monkeypatch.setattr(yaml_compat.yaml, 'load', counting_load)
+        return parsed
+
+    def test_unchanged_inventory_is_parsed_once(self, temp_dir, parses):
+        """Test repeated providers reuse the parse until the file changes."""
+        inv_file = temp_dir / "inventory.yml"
+        inv_file.write_text("all:\n  hosts:\n    web1:\n      ansible_host: 10.0.0.1\n")
+
+        first = AnsibleProvider(inventory_paths=[str(inv_file)])
+        second = AnsibleProvider(inventory_paths=[str(inv_file)])
+        assert first.connect() is True
+        assert second.connect() is True
+        assert len(parses) == 1
+        assert first.inventories[0]['data'] is not second.inventories[0]['data']
+
+        inv_file.write_text("all:\n  hosts:\n    web2:\n      ansible_host: 10.0.0.22\n")
+        third = AnsibleProvider(inventory_paths=[str(inv_file)])
+        assert third.connect() is True
+
+        assert len(parses) == 2
+        assert [h.name for h in third.get_hosts()] == ['web2']
+
+    def test_edited_inventory_with_new_mtime_is_reparsed(self, temp_dir, parses):
+        """Test an edit that keeps the size is picked up through the new mtime."""
+        inv_file = temp_dir / "inventory.yml"
+        inv_file.write_text("all:\n  hosts:\n    web1:\n      ansible_host: 10.0.0.1\n")
+        assert AnsibleProvider(inventory_paths=[str(inv_file)]).connect() is True
+
+        mtime_ns = inv_file.stat().st_mtime_ns
+        inv_file.write_text("all:\n  hosts:\n    web9:\n      ansible_host: 10.0.0.9\n")
+        os.utime(inv_file, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+        provider = AnsibleProvider(inventory_paths=[str(inv_file)])
+        assert provider.connect() is True
+
+        assert len(parses) == 2
+        assert [h.name for h in provider.get_hosts()] == ['web9']
+        assert len(yaml_compat._PARSED_FILES) == 1
+
+    def test_remembered_parses_are_bounded(self, temp_dir, parses, monkeypatch):
+        """Test only the most recently used inventories stay in memory."""
+        monkeypatch.setattr(yaml_compat, '_MAX_PARSED_FILES', 2)
+        files = []
+        for index in range(3):
+            inv_file = temp_dir / f"inv{index}.yml"
+            inv_file.write_text(_GROUP_INVENTORY.format(group='group', host=f'host{index}', ip=f'10.0.0.{index}'))
+            files.append(inv_file)
+
+        for inv_file in files:
+            assert AnsibleProvider(inventory_paths=[str(inv_file)]).connect() is True
+        assert len(yaml_compat._PARSED_FILES) == 2
+
+        # The oldest was dropped; the newest two are still served from memory
+        for inv_file in files[1:] + files[:1]:
+            assert AnsibleProvider(inventory_paths=[str(inv_file)]).connect() is True
+        assert parses == [str(f) for f in files] + [str(files[0])]
+
     def test_multiple_inventories(self, temp_dir):
         """Test loading multiple inventory files."""
         # Create two inventory files
-        inv1 = {
-            'all': {
-                'children': {
-                    'group1': {
-                        'hosts': {'host1': {'ansible_host': '10.0.1.1'}}
-                    }
-                }
-            }
-        }
-        inv2 = {
-            'all': {
-                'children': {
-                    'group2': {
-                        'hosts': {'host2': {'ansible_host': '10.0.2.1'}}
-                    }
-                }
-            }
-        }
-        
         file1 = temp_dir / "inv1.yml"
         file2 = temp_dir / "inv2.yml"
-        
-        with open(file1, 'w') as f:
-            yaml.dump(inv1, f)
-        with open(file2, 'w') as f:
-            yaml.dump(inv2, f)
-        
+        file1.write_text(_GROUP_INVENTORY.format(group='group1', host='host1', ip='10.0.1.1'))
+        file2.write_text(_GROUP_INVENTORY.format(group='group2', host='host2', ip='10.0.2.1'))
+
         provider = AnsibleProvider(inventory_paths=[str(file1), str(file2)])
         assert provider.connect() is True
         
@@ -193,8 +278,8 @@ class TestAnsibleProvider:
         }
         
         inv_file = temp_dir / "nested.yml"
-        with open(inv_file, 'w') as f:
-            yaml.dump(inventory, f)
+        with open(inv_file, 'wb') as f:
+            yaml.dump(inventory, f, Dumper=Dumper, encoding='utf-8', sort_keys=False)
         
         provider = AnsibleProvider(inventory_paths=[str(inv_file)])
         provider.connect()
@@ -205,20 +290,17 @@ class TestAnsibleProvider:
 
     def test_host_without_ansible_host_skipped(self, temp_dir):
         """Test that hosts without ansible_host are skipped."""
-        inventory = {
-            'all': {
-                'hosts': {
-                    'host1': {'ansible_host': '10.0.0.1'},
-                    'host2': {},  # No ansible_host
-                    'host3': {'ansible_host': '10.0.0.3'},
-                }
-            }
-        }
-        
         inv_file = temp_dir / "test.yml"
-        with open(inv_file, 'w') as f:
-            yaml.dump(inventory, f)
-        
+        inv_file.write_text(
+            "all:\n"
+            "  hosts:\n"
+            "    host1:\n"
+            "      ansible_host: 10.0.0.1\n"
+            "    host2: {}\n"  # No ansible_host
+            "    host3:\n"
+            "      ansible_host: 10.0.0.3\n"
+        )
+
         provider = AnsibleProvider(inventory_paths=[str(inv_file)])
         provider.connect()
         hosts = provider.get_hosts()
@@ -230,8 +312,8 @@ class TestAnsibleProvider:
     def test_empty_inventory(self, temp_dir):
         """Test with empty inventory file."""
         inv_file = temp_dir / "empty.yml"
-        with open(inv_file, 'w') as f:
-            yaml.dump({}, f)
+        with open(inv_file, 'wb') as f:
+            yaml.dump({}, f, Dumper=Dumper, encoding='utf-8', sort_keys=False)
         
         provider = AnsibleProvider(inventory_paths=[str(inv_file)])
         assert provider.connect() is False
@@ -275,10 +357,10 @@ class TestAnsibleProvider:
         file1 = temp_dir / "inv1.yml"
         file2 = temp_dir / "inv2.yml"
         
-        with open(file1, 'w') as f:
-            yaml.dump(inv1, f)
-        with open(file2, 'w') as f:
-            yaml.dump(inv2, f)
+        with open(file1, 'wb') as f:
+            yaml.dump(inv1, f, Dumper=Dumper, encoding='utf-8', sort_keys=False)
+        with open(file2, 'wb') as f:
+            yaml.dump(inv2, f, Dumper=Dumper, encoding='utf-8', sort_keys=False)
         
         provider = AnsibleProvider(inventory_paths=[str(file1), str(file2)])
         provider.connect()
@@ -0,0 +1,78 @@
+"""Tests for the SSHplex Host data structure."""
+
+import pickle
+
+import pytest
+
+from sshplex.lib.sot.base import Host, SoTProvider
+
+
+class TestHost:
+    """Tests for Host class."""
+
+    def test_metadata_reads_as_attributes(self):
+        """Test metadata values are readable as attributes without a __dict__."""
+        host = Host("web-01", "10.0.1.10", role="web", tags=["prod"])
+
+        assert host.role == "web"
+        assert host.tags == ["prod"]
+        assert not hasattr(host, "__dict__")
+        with pytest.raises(AttributeError):
+            _ = host.missing
+        assert getattr(host, "missing", "default") == "default"
+
+    def test_extra_attributes_stay_out_of_metadata(self):
+        """Test attributes set directly aren't serialized as metadata."""
+        host = Host("web-01", "10.0.1.10", role="web")
+        host.ansible_group = "web"
+
+        assert host.ansible_group == "web"
+        assert "ansible_group" not in host.to_dict()["metadata"]
+
+        host.update_metadata({"ansible_group": "db"})
+
+        assert host.ansible_group == "db"
+
+    def test_host_round_trips_through_pickle(self):
+        """Test slotted hosts survive pickling with metadata and extras."""
+        host = Host("web-01", "10.0.1.10", role="web")
+        host.ansible_group = "web"
+
+        loaded = pickle.loads(pickle.dumps(host))
+
+        assert (loaded.name, loaded.ip, loaded.role, loaded.ansible_group) == (
+            "web-01",
+            "10.0.1.10",
+            "web",
+            "web",
+        )
+
+
+class ListProvider(SoTProvider):
+    """Provider serving a fixed host list."""
+
+    def __init__(self, hosts):
+        self.hosts = hosts
+
+    def connect(self):
+        return True
+
+    def get_hosts(self, filters=None):
+        return list(self.hosts)
+
+    def test_connection(self):
+        return True
+
+
+def test_get_hosts_by_name_indexes_hosts():
+    """Test hosts are keyed by name, the last duplicate winning."""
+    provider = ListProvider([
+        Host("web-01", "10.0.1.10"),
+        Host("db-01", "10.0.1.20"),
+        Host("web-01", "10.0.1.11"),
+    ])
+
+    hosts_by_name = provider.get_hosts_by_name()
+
+    assert list(hosts_by_name) == ["web-01", "db-01"]
+    assert hosts_by_name["web-01"].ip == "10.0.1.11"
@@ -213,6 +213,35 @@ def test_get_all_hosts_merge_is_consistent_between_modes() -> None:
     assert factory.cache.saved_info["fetch_mode"] == "parallel"
 
 
+def test_iter_all_hosts_yields_each_host_once_and_caches_merged_set() -> None:
+    """Streamed hosts are unique, merged across providers and cached at the end."""
+    config = _make_config(imports=[], providers=[])
+
+    with patch("sshplex.lib.sot.factory.HostCache", InMemoryCache):
+        factory = SoTFactory(config)
+
+    factory.providers = [
+        DummyProvider("static-a", [Host("node1", "10.0.0.1", provider="static-a", sources=["static-a"])]),
+        DummyProvider(
+            "ansible-b",
+            [
+                Host("node1", "10.0.0.1", provider="ansible-b", sources=["ansible-b"]),
+                Host("node2", "10.0.0.2", provider="ansible-b"),
+            ],
+        ),
+    ]
+
+    streamed = list(factory.iter_all_hosts(force_refresh=True, max_workers=2))
+
+    assert sorted(host.name for host in streamed) == ["node1", "node2"]
+    node1 = next(host for host in streamed if host.name == "node1")
+    assert {"static-a", "ansible-b"}.issubset(set(node1.metadata["sources"]))
+    assert factory.cache.saved_hosts == streamed
+    assert factory.cache.saved_info["fetch_mode"] == "parallel"
+
+    assert list(factory.iter_all_hosts()) == streamed
+
+
 def test_get_all_hosts_uses_filter_aware_memory_cache() -> None:
     """Different filters should not reuse each other's in-memory cache entries."""
     config = _make_config(imports=[], providers=[])
@@ -290,3 +319,28 @@ def test_sync_git_sources_initializes_git_providers_without_full_init(tmp_path)
     assert results and results[0]["status"] == "updated"
     provider.connect.assert_called_once()
     provider.sync.assert_called_once_with(force=True)
+
+
+def test_memory_cache_expires_after_cache_ttl() -> None:
+    """In-memory host sets are refetched once older than the cache TTL."""
+    config = _make_config(imports=[], providers=[])
+    config.cache.ttl_hours = 1
+
+    with patch("sshplex.lib.sot.factory.HostCache", InMemoryCache):
+        factory = SoTFactory(config)
+
+    provider = MagicMock(spec=DummyProvider)
+    provider.get_hosts.return_value = [Host(name="web-01", ip="10.0.0.1")]
+    factory.providers = [provider]
+
+    clock = [1000.0]
+    with patch("sshplex.lib.sot.factory.time.monotonic", lambda: clock[0]):
+        factory.get_all_hosts(additional_filters={"role": "web"})
+        clock[0] += 3599
+        factory.get_all_hosts(additional_filters={"role": "web"})
+        assert provider.get_hosts.call_count == 1
+
+        clock[0] += 2
+        factory.get_all_hosts(additional_filters={"role": "web"})
+
+    assert provider.get_hosts.call_count == 2
@@ -1,5 +1,8 @@
 """Tests for SSHplex NetBox provider."""
 
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import List, Optional
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -7,44 +10,106 @@ import pytest
 from sshplex.lib.sot.netbox import NetBoxProvider
 
 
+@dataclass(slots=True)
+class FakeVM:
+    """Plain record with the VM fields the provider reads."""
+
+    name: str
+    primary_ip4: Optional[str] = None
+    primary_ip6: Optional[str] = None
+    status: Optional[str] = None
+    role: Optional[str] = None
+    cluster: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+    description: str = ''
+
+
+@dataclass(slots=True)
+class FakeDevice:
+    """Plain record with the device fields the provider reads."""
+
+    name: str
+    primary_ip4: Optional[str] = None
+    primary_ip6: Optional[str] = None
+    status: Optional[str] = None
+    role: Optional[str] = None
+    platform: Optional[str] = None
+    rack: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+    comments: str = ''
+
+
+class FakeEndpoint:
+    """NetBox endpoint stand-in that records filter() calls."""
+
+    def __init__(self, records=(), error=None):
+        self.records = list(records)
+        self.error = error
+        self.calls = []
+
+    def filter(self, **params):
+        self.calls.append(params)
+        if self.error is not None:
+            raise self.error
+        return list(self.records)
+
+
+class FakeNetBoxAPI:
+    """Minimal pynetbox.api stand-in with the endpoints the provider queries."""
+
+    def __init__(self, vms=(), devices=(), vm_error=None):
+        self.virtualization = SimpleNamespace(virtual_machines=FakeEndpoint(vms, vm_error))
+        self.dcim = SimpleNamespace(devices=FakeEndpoint(devices))
+        self.http_session = SimpleNamespace(verify=True, timeout=30)
+
+    def status(self):
+        return {'version': '3.5.0'}
+
+
+@pytest.fixture(scope="module")
+def shared_pynetbox():
+    """Mock pynetbox module, patched in once for the whole module."""
+    mock_module = MagicMock()
+    with patch('sshplex.lib.sot.netbox._import_pynetbox', return_value=mock_module):
+        yield mock_module
+
+
+@pytest.fixture
+def mock_pynetbox(shared_pynetbox):
+    """Hand each test the shared pynetbox mock with no calls or results left over."""
+    shared_pynetbox.reset_mock(return_value=True, side_effect=True)
+    return shared_pynetbox
+
+
 class TestNetBoxProvider:
     """Tests for NetBoxProvider class."""
 
-    @pytest.fixture
-    def mock_pynetbox(self):
-        """Mock pynetbox module."""
-        mock_module = MagicMock()
-        with patch('sshplex.lib.sot.netbox._import_pynetbox', return_value=mock_module):
-            yield mock_module
-
     @pytest.fixture
     def mock_vm(self):
-        """Create a mock NetBox VM object."""
-        vm = MagicMock()
-        vm.name = 'test-vm-01'
-        vm.primary_ip4 = '10.0.1.1/24'
-        vm.primary_ip6 = None
-        vm.status = 'active'
-        vm.role = 'server'
-        vm.cluster = 'test-cluster'
-        vm.tags = ['web', 'prod']
-        vm.description = 'Test VM description'
-        return vm
+        """Create a fake NetBox VM record."""
+        return FakeVM(
+            name='test-vm-01',
+            primary_ip4='10.0.1.1/24',
+            status='active',
+            role='server',
+            cluster='test-cluster',
+            tags=['web', 'prod'],
+            description='Test VM description',
+        )
 
     @pytest.fixture
     def mock_device(self):
-        """Create a mock NetBox device object."""
-        device = MagicMock()
-        device.name = 'test-device-01'
-        device.primary_ip4 = '10.0.2.1/24'
-        device.primary_ip6 = None
-        device.status = 'active'
-        device.role = 'router'
-        device.platform = 'ios'
-        device.rack = 'rack-01'
-        device.comments = 'Test device'
-        device.tags = ['network', 'prod']
-        return device
+        """Create a fake NetBox device record."""
+        return FakeDevice(
+            name='test-device-01',
+            primary_ip4='10.0.2.1/24',
+            status='active',
+            role='router',
+            platform='ios',
+            rack='rack-01',
+            tags=['network', 'prod'],
+            comments='Test device',
+        )
 
     @pytest.fixture
     def provider(self):
@@ -69,8 +134,7 @@ class TestNetBoxProvider:
 
     def test_connect_success(self, provider, mock_pynetbox):
         """Test successful connection to NetBox."""
-        mock_api = MagicMock()
-        mock_api.status.return_value = {'version': '3.5.0'}
+        mock_api = FakeNetBoxAPI()
         mock_pynetbox.api.return_value = mock_api
         
         result = provider.connect()
@@ -93,8 +157,7 @@ class TestNetBoxProvider:
 
     def test_test_connection_success(self, provider, mock_pynetbox):
         """Test connection test when connected."""
-        mock_api = MagicMock()
-        mock_api.status.return_value = {'version': '3.5.0'}
+        mock_api = FakeNetBoxAPI()
         mock_pynetbox.api.return_value = mock_api
         
         provider.connect()
@@ -114,10 +177,7 @@ class TestNetBoxProvider:
 
     def test_get_hosts_vms_only(self, provider, mock_pynetbox, mock_vm):
         """Test getting only VMs from NetBox."""
-        mock_api = MagicMock()
-        mock_api.status.return_value = {'version': '3.5.0'}
-        mock_api.virtualization.virtual_machines.filter.return_value = [mock_vm]
-        mock_api.dcim.devices.filter.return_value = []
+        mock_api = FakeNetBoxAPI(vms=[mock_vm])
         mock_pynetbox.api.return_value = mock_api
         
         provider.connect()
@@ -129,10 +189,7 @@ class TestNetBoxProvider:
 
     def test_get_hosts_devices_only(self, provider, mock_pynetbox, mock_device):
         """Test getting only devices from NetBox."""
-        mock_api = MagicMock()
-        mock_api.status.return_value = {'version': '3.5.0'}
-        mock_api.virtualization.virtual_machines.filter.return_value = []
-        mock_api.dcim.devices.filter.return_value = [mock_device]
+        mock_api = FakeNetBoxAPI(devices=[mock_device])
         mock_pynetbox.api.return_value = mock_api
         
         provider.connect()
@@ -144,10 +201,7 @@ class TestNetBoxProvider:
 
     def test_get_hosts_both(self, provider, mock_pynetbox, mock_vm, mock_device):
         """Test getting both VMs and devices."""
-        mock_api = MagicMock()
-        mock_api.status.return_value = {'version': '3.5.0'}
-        mock_api.virtualization.virtual_machines.filter.return_value = [mock_vm]
-        mock_api.dcim.devices.filter.return_value = [mock_device]
+        mock_api = FakeNetBoxAPI(vms=[mock_vm], devices=[mock_device])
         mock_pynetbox.api.return_value = mock_api
         
         provider.connect()
@@ -157,30 +211,23 @@ class TestNetBoxProvider:
 
     def test_get_hosts_with_filters(self, provider, mock_pynetbox, mock_vm):
         """Test getting hosts with filters."""
-        mock_api = MagicMock()
-        mock_api.status.return_value = {'version': '3.5.0'}
-        mock_api.virtualization.virtual_machines.filter.return_value = [mock_vm]
-        mock_api.dcim.devices.filter.return_value = []
+        mock_api = FakeNetBoxAPI(vms=[mock_vm])
         mock_pynetbox.api.return_value = mock_api
         
         provider.connect()
         hosts = provider.get_hosts(filters={'status': 'active', 'role': 'server'})
         
-        # Verify filter was passed and hosts returned
-        mock_api.virtualization.virtual_machines.filter.assert_called()
+        # Verify filter was passed to both endpoints and hosts returned
+        expected = {'status': 'active', 'role': 'server'}
+        assert mock_api.virtualization.virtual_machines.calls == [expected]
+        assert mock_api.dcim.devices.calls == [expected]
         assert len(hosts) == 1
 
     def test_vm_without_ip_skipped(self, provider, mock_pynetbox):
         """Test that VMs without IP are skipped."""
-        mock_vm = MagicMock()
-        mock_vm.name = 'no-ip-vm'
-        mock_vm.primary_ip4 = None
-        mock_vm.primary_ip6 = None
-        
-        mock_api = MagicMock()
-        mock_api.status.return_value = {'version': '3.5.0'}
-        mock_api.virtualization.virtual_machines.filter.return_value = [mock_vm]
-        mock_api.dcim.devices.filter.return_value = []
+        mock_vm = FakeVM(name='no-ip-vm')
+        
+        mock_api = FakeNetBoxAPI(vms=[mock_vm])
         mock_pynetbox.api.return_value = mock_api
         
         provider.connect()
@@ -190,20 +237,15 @@ class TestNetBoxProvider:
 
     def test_ipv6_fallback(self, provider, mock_pynetbox):
         """Test IPv6 fallback when no IPv4."""
-        mock_vm = MagicMock()
-        mock_vm.name = 'ipv6-vm'
-        mock_vm.primary_ip4 = None
-        mock_vm.primary_ip6 = '2001:db8::1/64'
-        mock_vm.status = 'active'
-        mock_vm.role = 'server'
-        mock_vm.cluster = 'cluster'
-        mock_vm.tags = []
-        mock_vm.description = ''
-        
-        mock_api = MagicMock()
-        mock_api.status.return_value = {'version': '3.5.0'}
-        mock_api.virtualization.virtual_machines.filter.return_value = [mock_vm]
-        mock_api.dcim.devices.filter.return_value = []
+        mock_vm = FakeVM(
+            name='ipv6-vm',
+            primary_ip6='2001:db8::1/64',
+            status='active',
+            role='server',
+            cluster='cluster',
+        )
+        
+        mock_api = FakeNetBoxAPI(vms=[mock_vm])
         mock_pynetbox.api.return_value = mock_api
         
         provider.connect()
@@ -214,10 +256,7 @@ class TestNetBoxProvider:
 
     def test_ip_cidr_removed(self, provider, mock_pynetbox, mock_vm):
         """Test that CIDR notation is removed from IP."""
-        mock_api = MagicMock()
-        mock_api.status.return_value = {'version': '3.5.0'}
-        mock_api.virtualization.virtual_machines.filter.return_value = [mock_vm]
-        mock_api.dcim.devices.filter.return_value = []
+        mock_api = FakeNetBoxAPI(vms=[mock_vm])
         mock_pynetbox.api.return_value = mock_api
         
         provider.connect()
@@ -228,10 +267,7 @@ class TestNetBoxProvider:
 
     def test_host_metadata(self, provider, mock_pynetbox, mock_vm):
         """Test that host metadata is populated."""
-        mock_api = MagicMock()
-        mock_api.status.return_value = {'version': '3.5.0'}
-        mock_api.virtualization.virtual_machines.filter.return_value = [mock_vm]
-        mock_api.dcim.devices.filter.return_value = []
+        mock_api = FakeNetBoxAPI(vms=[mock_vm])
         mock_pynetbox.api.return_value = mock_api
         
         provider.connect()
@@ -247,10 +283,7 @@ class TestNetBoxProvider:
         """Test that provider_name is used in host metadata."""
         provider.provider_name = 'custom-netbox'
         
-        mock_api = MagicMock()
-        mock_api.status.return_value = {'version': '3.5.0'}
-        mock_api.virtualization.virtual_machines.filter.return_value = [mock_vm]
-        mock_api.dcim.devices.filter.return_value = []
+        mock_api = FakeNetBoxAPI(vms=[mock_vm])
         mock_pynetbox.api.return_value = mock_api
         
         provider.connect()
@@ -266,8 +299,7 @@ class TestNetBoxProvider:
             verify_ssl=False
         )
         
-        mock_api = MagicMock()
-        mock_api.status.return_value = {'version': '3.5.0'}
+        mock_api = FakeNetBoxAPI()
         mock_pynetbox.api.return_value = mock_api
         
         provider.connect()
@@ -283,8 +315,7 @@ class TestNetBoxProvider:
             timeout=60
         )
         
-        mock_api = MagicMock()
-        mock_api.status.return_value = {'version': '3.5.0'}
+        mock_api = FakeNetBoxAPI()
         mock_pynetbox.api.return_value = mock_api
         
         provider.connect()
@@ -293,9 +324,7 @@ class TestNetBoxProvider:
 
     def test_error_handling_in_get_hosts(self, provider, mock_pynetbox):
         """Test error handling in get_hosts."""
-        mock_api = MagicMock()
-        mock_api.status.return_value = {'version': '3.5.0'}
-        mock_api.virtualization.virtual_machines.filter.side_effect = Exception('API error')
+        mock_api = FakeNetBoxAPI(vm_error=Exception('API error'))
         mock_pynetbox.api.return_value = mock_api
         
         provider.connect()
@@ -1,31 +1,32 @@
 """Tests for SSHplex static host provider."""
 
+from types import MappingProxyType
+
 import pytest
 
 from sshplex.lib.sot.base import Host
 from sshplex.lib.sot.static import StaticProvider
 
+# Read-only sample data shared by every test; nothing here mutates it
+_SAMPLE_HOSTS = (
+    MappingProxyType({'name': 'web-01', 'ip': '10.0.1.10', 'description': 'Web server', 'tags': ('web', 'prod')}),
+    MappingProxyType({'name': 'db-01', 'ip': '10.0.1.20', 'description': 'Database server', 'tags': ('db', 'prod')}),
+    MappingProxyType({'name': 'cache-01', 'ip': '10.0.1.30', 'description': 'Cache server', 'tags': ('cache', 'prod')}),
+)
 
-class TestStaticProvider:
-    """Tests for StaticProvider class."""
 
-    @pytest.fixture
-    def sample_hosts(self):
-        """Sample host data for testing."""
-        return [
-            {'name': 'web-01', 'ip': '10.0.1.10', 'description': 'Web server', 'tags': ['web', 'prod']},
-            {'name': 'db-01', 'ip': '10.0.1.20', 'description': 'Database server', 'tags': ['db', 'prod']},
-            {'name': 'cache-01', 'ip': '10.0.1.30', 'description': 'Cache server', 'tags': ['cache', 'prod']},
-        ]
+@pytest.fixture(scope="module")
+def provider():
+    """Create one StaticProvider for the read-only tests."""
+    return StaticProvider(name='test-static', hosts=_SAMPLE_HOSTS)
 
-    @pytest.fixture
-    def provider(self, sample_hosts):
-        """Create a StaticProvider instance."""
-        return StaticProvider(name='test-static', hosts=sample_hosts)
 
-    def test_init(self, sample_hosts):
+class TestStaticProvider:
+    """Tests for StaticProvider class."""
+
+    def test_init(self):
         """Test provider initialization."""
-        provider = StaticProvider(name='test', hosts=sample_hosts)
+        provider = StaticProvider(name='test', hosts=_SAMPLE_HOSTS)
         assert provider.name == 'test'
         assert len(provider.hosts_data) == 3
 
@@ -74,6 +75,19 @@ class TestStaticProvider:
         hosts = provider.get_hosts(filters={'tags': ['web', 'db']})
         assert len(hosts) == 2
 
+    def test_filter_by_tags_keeps_config_order(self):
+        """Test tag filtering returns hosts in configuration order, including string tags."""
+        provider = StaticProvider(name='mixed', hosts=[
+            {'name': 'db-01', 'ip': '10.0.1.20', 'tags': ['db']},
+            {'name': 'edge-01', 'ip': '10.0.1.40', 'tags': 'web,edge'},
+            {'name': 'web-01', 'ip': '10.0.1.10', 'tags': ['web', 'db']},
+            {'name': 'bare-01', 'ip': '10.0.1.50'},
+        ])
+
+        hosts = provider.get_hosts(filters={'tags': ['web', 'db']})
+
+        assert [h.name for h in hosts] == ['db-01', 'edge-01', 'web-01']
+
     def test_filter_by_name_pattern(self, provider):
         """Test filtering hosts by name pattern."""
         hosts = provider.get_hosts(filters={'name_pattern': r'^web-.*$'})
@@ -82,3 +82,223 @@ def test_build_ssh_command_accepts_proxy_key_with_tilde_path() -> None:
 
     assert proxy_option.startswith("ProxyCommand=/usr/bin/ssh ")
     assert str(Path("~/.ssh/proxy key").expanduser()) in proxy_option
+
+
+def test_build_ssh_command_resolves_proxies_once_per_connector() -> None:
+    """Proxy lookup is built once and shared by every host of a provider."""
+    config = _base_config()
+    config.ssh.proxy = [
+        SimpleNamespace(
+            name="proxy-a",
+            imports=["static-a"],
+            host="proxy.example.com",
+            username="jumper",
+            key_path="~/.ssh/proxy",
+        ),
+        SimpleNamespace(
+            name="proxy-b",
+            imports=["static-a", "static-b"],
+            host="bad host",
+            username="jumper",
+            key_path="~/.ssh/proxy",
+        ),
+    ]
+    connector = _build_connector(config)
+
+    first = connector._build_ssh_command(Host("a", "10.0.0.1", provider="static-a"), "admin")
+    second = connector._build_ssh_command(Host("b", "10.0.0.2", provider="static-a"), "admin")
+    invalid = connector._build_ssh_command(Host("c", "10.0.0.3", provider="static-b"), "admin")
+    none = connector._build_ssh_command(Host("d", "10.0.0.4", provider="other"), "admin")
+
+    assert "proxy.example.com" in first and "proxy.example.com" in second
+    assert "ProxyCommand" not in invalid and "ProxyCommand" not in none
+    connector.logger.warning.assert_called_once()
+    assert set(connector._proxy_commands) == {"static-a", "static-b"}
+
+
+def test_build_ssh_command_quotes_shared_options_once_per_option_set() -> None:
+    """Hosts with the same options share one quoted prefix; overrides get their own."""
+    connector = _build_connector(_base_config())
+
+    first = connector._build_ssh_command(Host("a", "10.0.0.1"), "admin")
+    second = connector._build_ssh_command(Host("b", "10.0.0.2"), "admin")
+    other_port = connector._build_ssh_command(Host("c", "10.0.0.3", ssh_port="2222"), "admin")
+
+    assert first.rsplit(" ", 1)[0] == second.rsplit(" ", 1)[0]
+    assert second.endswith(" admin@10.0.0.2")
+    assert shlex.split(other_port)[-3:] == ["-o", "ConnectTimeout=10", "admin@10.0.0.3"]
+    assert "-p 2222" in other_port
+    assert len(connector._ssh_command_prefixes) == 2
+
+
+def test_build_ssh_commands_without_aliases_stays_on_the_calling_thread(monkeypatch) -> None:
+    """Plain hosts need no ssh -G lookups, so no thread pool is started."""
+    import sshplex.sshplex_connector as connector_module
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("thread pool started without ssh aliases")
+
+    monkeypatch.setattr(connector_module, "ThreadPoolExecutor", no_pool)
+    connector = _build_connector(_base_config())
+
+    commands = connector._build_ssh_commands([Host("a", "10.0.0.1"), Host("b", "10.0.0.2")], "admin")
+
+    assert [command.rsplit(" ", 1)[-1] for command in commands] == ["admin@10.0.0.1", "admin@10.0.0.2"]
+
+
+def test_build_ssh_commands_resolves_aliases_in_order(monkeypatch) -> None:
+    """Alias lookups may run in a pool, but commands keep host order."""
+    import sshplex.sshplex_connector as connector_module
+
+    monkeypatch.setattr(
+        connector_module, "resolve_ssh_effective_config", lambda alias: {"hostname": f"{alias}.internal"}
+    )
+    connector = _build_connector(_base_config())
+    hosts = [Host("a", "10.0.0.1", ssh_alias="bastion-a"), Host("b", "10.0.0.2"), Host("c", "10.0.0.3")]
+
+    commands = connector._build_ssh_commands(hosts, "admin")
+
+    assert [command.rsplit(" ", 1)[-1] for command in commands] == ["admin@bastion-a", "admin@10.0.0.2", "admin@10.0.0.3"]
+    assert len(connector._ssh_command_prefixes) == 1
+
+
+def test_connect_to_hosts_builds_commands_up_front_and_keeps_pane_order() -> None:
+    """Commands are built before panes are created, panes follow host order."""
+    config = _base_config()
+    config.tmux = SimpleNamespace(max_panes_per_window=5, control_with_iterm2=False)
+    connector = _build_connector(config)
+    connector.backend = "tmux"
+    connector.system = "linux"
+    connector.multiplexer = MagicMock()
+    connector.multiplexer.create_session.return_value = True
+    connector.multiplexer.create_pane.return_value = True
+    hosts = [Host(f"web-{i:02d}", f"10.0.0.{i}") for i in range(1, 21)]
+    hosts.insert(3, Host("bad;host", ""))
+
+    assert connector.connect_to_hosts(hosts, username="admin", use_panes=True)
+
+    created = [call.args[0] for call in connector.multiplexer.create_pane.call_args_list]
+    assert created == [f"web-{i:02d}" for i in range(1, 21)]
+    commands = [call.args[1] for call in connector.multiplexer.create_pane.call_args_list]
+    assert commands[4].endswith("admin@10.0.0.5")
+    assert connector.last_success_count == 20
+
+
+def test_connect_to_hosts_logs_redacted_commands_only_when_formatted(monkeypatch) -> None:
+    """Built-command debug messages pass the host as is and defer the redaction."""
+    config = _base_config()
+    config.tmux = SimpleNamespace(max_panes_per_window=5, control_with_iterm2=False)
+    connector = _build_connector(config)
+    connector.backend = "tmux"
+    connector.system = "linux"
+    connector.multiplexer = MagicMock()
+    connector.multiplexer.create_session.return_value = True
+    connector.multiplexer.create_pane.return_value = True
+    sanitize = MagicMock(side_effect=SSHplexConnector._sanitize_ssh_command)
+    monkeypatch.setattr(SSHplexConnector, "_sanitize_ssh_command", staticmethod(sanitize))
+
+    assert connector.connect_to_hosts([Host("web-01", "10.0.0.1")], username="admin", use_panes=True)
+
+    (message, host, command), = [
+        call.args for call in connector.logger.debug.call_args_list
+        if call.args and call.args[0].startswith("SSHplex: Built SSH command")
+    ]
+    assert host == "10.0.0.1"
+    assert sanitize.call_count == 0
+    assert message.format(host, command).endswith(": " + command.command)
+    assert sanitize.call_count == 1
+
+
+def test_connect_to_hosts_skips_duplicate_hosts_but_keeps_shared_ips() -> None:
+    """The same host passed twice gets one pane; distinct hosts sharing an IP keep theirs."""
+    config = _base_config()
+    config.tmux = SimpleNamespace(max_panes_per_window=5, control_with_iterm2=False)
+    connector = _build_connector(config)
+    connector.backend = "tmux"
+    connector.system = "linux"
+    connector.multiplexer = MagicMock()
+    connector.multiplexer.create_session.return_value = True
+    connector.multiplexer.create_pane.return_value = True
+    hosts = [
+        Host("web-01", "10.0.0.1"),
+        Host("db-01", "10.0.0.2"),
+        Host("web-01", "10.0.0.1"),
+        Host("site-b-web", "10.0.0.1"),
+    ]
+
+    assert connector.connect_to_hosts(hosts, username="admin", use_panes=True)
+
+    created = [call.args[0] for call in connector.multiplexer.create_pane.call_args_list]
+    assert created == ["web-01", "db-01", "site-b-web"]
+    assert connector.last_success_count == 3
+
+
+def test_connect_to_hosts_overlaps_retry_backoff_across_hosts(monkeypatch) -> None:
+    """Hosts waiting to retry share the wait instead of sleeping one after another."""
+    config = _base_config()
+    config.ssh.retry = SimpleNamespace(enabled=True, max_attempts=3, delay_seconds=2.0, exponential_backoff=True)
+    config.tmux = SimpleNamespace(max_panes_per_window=5, control_with_iterm2=False)
+    connector = _build_connector(config)
+    connector.backend = "tmux"
+    connector.system = "linux"
+    connector.multiplexer = MagicMock()
+    connector.multiplexer.create_session.return_value = True
+    attempts: dict[str, int] = {}
+
+    def create_pane(pane_id: str, command: str, max_panes: int) -> bool:
+        attempts[pane_id] = attempts.get(pane_id, 0) + 1
+        # a and b succeed on their second attempt, c never does
+        return pane_id == "ok" or (pane_id in ("a", "b") and attempts[pane_id] == 2)
+
+    connector.multiplexer.create_pane.side_effect = create_pane
+    clock = [100.0]
+    sleeps: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr("sshplex.sshplex_connector.time.monotonic", lambda: clock[0])
+    monkeypatch.setattr("sshplex.sshplex_connector.time.sleep", fake_sleep)
+    hosts = [Host(name, f"10.0.0.{i}") for i, name in enumerate(["a", "b", "c", "ok"], 1)]
+
+    assert connector.connect_to_hosts(hosts, username="admin", use_panes=True)
+
+    assert sum(sleeps) == 6.0  # 2s shared first backoff, then c's 4s second backoff
+    assert attempts == {"a": 2, "b": 2, "c": 3, "ok": 1}
+    assert connector.last_success_count == 3
+    assert connector.last_failed_hosts == ["10.0.0.3"]
+
+
+def test_build_ssh_command_quotes_argument_vector_once() -> None:
+    """The shell string is the quoted form of the argument vector."""
+    config = _base_config()
+    connector = _build_connector(config)
+    host = Host(name="web-01", ip="10.0.0.10", ssh_port="2222")
+
+    args = connector._build_ssh_args(host, "admin", "~/.ssh/key with space")
+    command = connector._build_ssh_command(host, "admin", "~/.ssh/key with space")
+
+    assert shlex.split(command) == ["TERM=xterm-256color", *args]
+    assert args[args.index("-p") + 1] == "2222"
+
+
+def test_terminal_opener_uses_single_pane_windows_for_iterm2_control_mode() -> None:
+    """tmux -CC window mode creates one-pane windows; plain tmux creates windows."""
+    config = _base_config()
+    config.tmux = SimpleNamespace(max_panes_per_window=5, control_with_iterm2=True)
+    connector = _build_connector(config)
+    connector.backend = "tmux"
+    connector.multiplexer = MagicMock()
+
+    connector.system = "darwin"
+    create, label, _error = connector._terminal_opener(use_panes=False)
+    create("web-01", "ssh web-01")
+    connector.multiplexer.create_pane.assert_called_once_with("web-01", "ssh web-01", 1)
+    assert label == "window"
+
+    connector.system = "linux"
+    create, _label, error = connector._terminal_opener(use_panes=False)
+    create("web-02", "ssh web-02")
+    connector.multiplexer.create_window.assert_called_once_with("web-02", "ssh web-02")
+    assert error == "Failed to create tmux window"
@@ -0,0 +1,200 @@
+"""Tests for tmux session manager session loading."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from sshplex.lib.ui import session_manager as session_manager_module
+from sshplex.lib.ui.session_manager import TmuxSession, TmuxSessionManager
+
+
+class FakeTable:
+    """DataTable double recording row-level operations."""
+
+    def __init__(self) -> None:
+        self.rows: dict[str, list[str]] = {}
+        self.ops: list[tuple[str, str]] = []
+        self.columns = ["broadcast", "name", "age", "clients", "active_cmd", "created", "windows", "panes"]
+
+    def clear(self) -> None:
+        self.rows.clear()
+        self.ops.append(("clear", ""))
+
+    def add_row(self, *values: str, key: str | None = None) -> None:
+        self.rows[key or "placeholder"] = list(values)
+        self.ops.append(("add", key or ""))
+
+    def remove_row(self, key: str) -> None:
+        del self.rows[key]
+        self.ops.append(("remove", key))
+
+    def update_cell(self, key: str, column: str, value: str) -> None:
+        self.rows[key][self.columns.index(column)] = value
+        self.ops.append(("update", f"{key}.{column}"))
+
+
+def make_session(name: str, age: str = "1m", windows: int = 1) -> TmuxSession:
+    return TmuxSession(
+        name=name,
+        session_id=f"${name}",
+        created="2026-01-01 00:00:00",
+        age=age,
+        windows=windows,
+        panes=windows,
+        clients=0,
+        active_cmd="-",
+    )
+
+
+class FakeServer:
+    """libtmux.Server double answering batched format queries."""
+
+    def __init__(self, outputs: dict[str, list[str]], stderr: list[str] | None = None) -> None:
+        self.outputs = outputs
+        self.stderr = stderr or []
+        self.calls: list[tuple[str, ...]] = []
+
+    def cmd(self, *args: str) -> SimpleNamespace:
+        self.calls.append(args)
+        return SimpleNamespace(stdout=self.outputs.get(args[0], []), stderr=self.stderr)
+
+
+def test_load_sessions_uses_two_batched_queries(monkeypatch: pytest.MonkeyPatch) -> None:
+    server = FakeServer(
+        {
+            "list-sessions": [
+                "$1\t1700000000\t2\t1\tweb sessions",
+                "$2\t1700000100\t1\t0\tdb",
+            ],
+            "list-panes": [
+                "$1\t1\tssh",
+                "$1\t1\tssh",
+                "$1\t0\tbash",
+                "$2\t0\t",
+            ],
+        }
+    )
+    monkeypatch.setattr("libtmux.Server", lambda: server)
+
+    sessions, error = TmuxSessionManager(SimpleNamespace())._load_sessions_blocking()
+
+    assert error is None
+    assert [call[0] for call in server.calls] == ["list-sessions", "list-panes"]
+    web, db = sessions
+    assert (web.name, web.windows, web.panes, web.clients) == ("web sessions", 2, 3, 1)
+    assert web.broadcast is True
+    assert web.active_cmd == "ssh(2), bash(1)"
+    assert (db.name, db.panes, db.broadcast, db.active_cmd) == ("db", 1, False, "?(1)")
+
+
+def test_load_sessions_without_server_is_empty(monkeypatch: pytest.MonkeyPatch) -> None:
+    server = FakeServer({}, stderr=["no server running on /tmp/tmux-0/default"])
+    monkeypatch.setattr("libtmux.Server", lambda: server)
+
+    assert TmuxSessionManager(SimpleNamespace())._load_sessions_blocking() == ([], None)
+
+
+def test_load_sessions_reports_tmux_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    server = FakeServer({}, stderr=["unknown option"])
+    monkeypatch.setattr("libtmux.Server", lambda: server)
+
+    assert TmuxSessionManager(SimpleNamespace())._load_sessions_blocking() == (
+        [],
+        "unknown option",
+    )
+
+
+def test_populate_table_only_touches_changed_rows() -> None:
+    manager = TmuxSessionManager(SimpleNamespace())
+    manager.table = FakeTable()
+    manager.sessions = [make_session("a"), make_session("b"), make_session("c")]
+    manager.populate_table()
+    manager.table.ops.clear()
+
+    manager.sessions = [make_session("a"), make_session("c", age="2m"), make_session("d")]
+    manager.populate_table()
+
+    assert manager.table.ops == [("remove", "b"), ("update", "c.age"), ("add", "d")]
+    assert list(manager.table.rows) == ["a", "c", "d"]
+
+
+def test_populate_table_rebuilds_when_order_changes() -> None:
+    manager = TmuxSessionManager(SimpleNamespace())
+    manager.table = FakeTable()
+    manager.sessions = [make_session("b"), make_session("c")]
+    manager.populate_table()
+
+    manager.sessions = [make_session("a"), make_session("b"), make_session("c")]
+    manager.populate_table()
+
+    assert ("clear", "") in manager.table.ops[-4:]
+    assert list(manager.table.rows) == ["a", "b", "c"]
+
+
+def test_refresh_runs_load_in_exclusive_worker_group() -> None:
+    manager = TmuxSessionManager(SimpleNamespace())
+    calls: list[dict[str, object]] = []
+
+    def fake_run_worker(work: Any, **kwargs: object) -> None:
+        work.close()
+        calls.append(kwargs)
+
+    manager.run_worker = fake_run_worker  # type: ignore[method-assign]
+    manager.action_refresh_sessions()
+
+    assert calls == [{"name": "tmux_refresh_sessions", "group": "tmux_load_sessions", "exclusive": True}]
+
+
+def test_find_tmux_session_returns_none_for_missing_session_without_fallbacks() -> None:
+    from libtmux._internal.query_list import QueryList
+
+    class Server:
+        find_where_calls = 0
+
+        @property
+        def sessions(self) -> QueryList[Any]:
+            return QueryList([SimpleNamespace(session_name="work")])
+
+        def find_where(self, attrs: dict[str, str]) -> None:
+            Server.find_where_calls += 1
+
+    manager = TmuxSessionManager(SimpleNamespace())
+    manager.tmux_server = Server()
+
+    assert manager._find_tmux_session("work").session_name == "work"
+    assert manager._find_tmux_session("missing") is None
+    assert Server.find_where_calls == 0
+
+
+def test_attach_execs_resolved_tmux_binary(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[str, list[str]]] = []
+    monkeypatch.setattr(session_manager_module, "find_tmux", lambda: "/opt/bin/tmux")
+    monkeypatch.setattr(session_manager_module, "flush_logging", lambda: calls.append(("flush", [])))
+    monkeypatch.setattr(session_manager_module.os, "execv", lambda path, args: calls.append((path, args)))
+    monkeypatch.setattr(session_manager_module.os, "execlp", lambda *args: pytest.fail("PATH lookup used"))
+
+    TmuxSessionManager._exec_tmux_attach("work")
+
+    assert calls == [("flush", []), ("/opt/bin/tmux", ["/opt/bin/tmux", "attach-session", "-t", "work"])]
+
+
+def test_refresh_is_debounced(monkeypatch: pytest.MonkeyPatch) -> None:
+    manager = TmuxSessionManager(SimpleNamespace())
+    names: list[object] = []
+
+    def fake_run_worker(work: Any, **kwargs: object) -> None:
+        work.close()
+        names.append(kwargs["name"])
+
+    manager.run_worker = fake_run_worker  # type: ignore[method-assign]
+    clock = iter([100.0, 100.1, 100.3])
+    monkeypatch.setattr(session_manager_module.time, "monotonic", lambda: next(clock))
+
+    manager.action_refresh_sessions()
+    manager.action_refresh_sessions()
+    manager.action_refresh_sessions()
+
+    assert names == ["tmux_refresh_sessions", "tmux_refresh_sessions"]
@@ -17,6 +17,12 @@ from sshplex.lib.utils.iterm2 import (
 )
 
 
+@pytest.fixture(autouse=True)
+def forget_iterm2_installed(monkeypatch):
+    """Don't let one test's installed check answer for the next."""
+    monkeypatch.setattr("sshplex.lib.utils.iterm2._iterm2_installed", False)
+
+
 class TestIsMacos:
     """Tests for is_macos function."""
 
@@ -51,6 +57,28 @@ class TestCheckITerm2Installed:
 
         assert check_iterm2_installed() is True
 
+    @patch('sshplex.lib.utils.iterm2.is_macos')
+    @patch('sshplex.lib.utils.iterm2.subprocess.run')
+    def test_installed_is_remembered(self, mock_run, mock_is_macos):
+        """Test a positive answer skips osascript on later checks."""
+        mock_is_macos.return_value = True
+        mock_run.return_value = MagicMock(returncode=0, stdout="true")
+
+        assert check_iterm2_installed() is True
+        assert check_iterm2_installed() is True
+        mock_run.assert_called_once()
+
+    @patch('sshplex.lib.utils.iterm2.is_macos')
+    @patch('sshplex.lib.utils.iterm2.subprocess.run')
+    def test_not_installed_is_checked_again(self, mock_run, mock_is_macos):
+        """Test a negative answer isn't cached."""
+        mock_is_macos.return_value = True
+        mock_run.return_value = MagicMock(returncode=1, stdout="false")
+
+        assert check_iterm2_installed() is False
+        assert check_iterm2_installed() is False
+        assert mock_run.call_count == 2
+
     @patch('sshplex.lib.utils.iterm2.is_macos')
     @patch('sshplex.lib.utils.iterm2.subprocess.run')
     def test_not_installed_returns_false(self, mock_run, mock_is_macos):